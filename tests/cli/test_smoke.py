@@ -0,0 +1,28 @@
+"""
+Smoke test for CLI commands: every command runs in-process without crashing.
+"""
+
+SMOKE_COMMANDS = [
+    ("status", []),
+    ("list-roles", []),
+    ("list-stages", []),
+    ("analyze", []),
+    ("check-team", []),
+    ("export-graph", []),
+    ("dry-run", ["test_stage"]),
+    ("wfauto", ["--no-agent"]),
+    ("wfauto", ["--parallel", "--no-agent"]),
+]
+
+
+def test_all_commands_smoke(cli_runner, sample_workflow_config, monkeypatch):
+    """Run each command once against a configured workspace; none may crash."""
+    monkeypatch.chdir(sample_workflow_config["workspace"])
+    
+    failures = []
+    for command, args in SMOKE_COMMANDS:
+        result = cli_runner.invoke([command] + args)
+        if result.exception is not None or result.exit_code not in (0, 1):
+            failures.append((command, args, result.exit_code, result.exception))
+    
+    assert not failures, f"Commands crashed: {failures}"
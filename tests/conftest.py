@@ -1,8 +1,10 @@
 """
 Shared pytest fixtures and configuration for all tests.
 """
+import copy
+import importlib
+import pkgutil
 import pytest
-import tempfile
 import shutil
 from pathlib import Path
 from typing import Generator, Dict, Any
@@ -11,24 +13,45 @@ import yaml
 from work_by_roles.core.workflow_engine import WorkflowEngine
 from work_by_roles.core.agent_message_bus import AgentMessageBus
 from work_by_roles.core.models import Role, Stage, Workflow, Skill
+from concurrent.futures import ProcessPoolExecutor
+from tests.fixtures.cli_runner import CliRunner, preimport_cli
+from tests.fixtures.fs_utils import fast_copy
 
+# libyaml-backed dumper when available; the pure-Python one is ~10x slower
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
-@pytest.fixture
-def temp_workspace() -> Generator[Path, None, None]:
-    """Create a temporary workspace directory for testing."""
-    temp_dir = tempfile.mkdtemp(prefix="work_by_roles_test_")
-    workspace = Path(temp_dir)
-    
-    # Create .workflow directory and temp subdirectory
-    workflow_dir = workspace / ".workflow"
-    workflow_dir.mkdir(parents=True, exist_ok=True)
-    temp_dir = workflow_dir / "temp"
-    temp_dir.mkdir(parents=True, exist_ok=True)
+
+def _materialize_workflow_config(template_dir: Path, workflow_dir: Path) -> None:
+    """Copy the schema files and hard-link the read-only skills tree."""
+    shutil.copytree(template_dir, workflow_dir, dirs_exist_ok=True, ignore=shutil.ignore_patterns("skills"))
+    fast_copy(template_dir / "skills", workflow_dir / "skills")
+
+
+def pytest_configure(config):
+    """
+    Import the CLI and every work_by_roles.core module once, before collection.
     
-    yield workspace
+    Runs once per process (each xdist worker included), so the first test in
+    a run doesn't absorb the import cost of the engine/CLI module graph.
+    Modules whose optional dependencies are missing are skipped here and
+    fail, if at all, in the tests that use them.
+    """
+    import work_by_roles.core
     
-    # Cleanup
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    for module_info in pkgutil.iter_modules(work_by_roles.core.__path__, "work_by_roles.core."):
+        try:
+            importlib.import_module(module_info.name)
+        except ImportError:
+            pass
+    import work_by_roles.cli  # noqa: F401
+
+
+@pytest.fixture
+def temp_workspace(tmp_path: Path) -> Path:
+    """Create a temporary workspace directory for testing."""
+    # tmp_path is per-test (and per-xdist-worker); pytest prunes old runs itself
+    (tmp_path / ".workflow" / "temp").mkdir(parents=True, exist_ok=True)
+    return tmp_path
 
 
 @pytest.fixture
@@ -128,17 +151,50 @@ def workflow_engine(temp_workspace: Path) -> WorkflowEngine:
     return WorkflowEngine(workspace_path=temp_workspace)
 
 
+@pytest.fixture(scope="module")
+def _loaded_workflow_engine(tmp_path_factory, _workflow_config_template: Dict[str, Any]) -> WorkflowEngine:
+    """WorkflowEngine with the sample configs loaded once per test module."""
+    workspace = tmp_path_factory.mktemp("engine_workspace")
+    workflow_dir = workspace / ".workflow"
+    _materialize_workflow_config(_workflow_config_template["workflow_dir"], workflow_dir)
+    
+    engine = WorkflowEngine(workspace_path=workspace)
+    engine.load_all_configs(
+        skill_file=workflow_dir / "skills",
+        roles_file=workflow_dir / "role_schema.yaml",
+        workflow_file=workflow_dir / "workflow_schema.yaml"
+    )
+    return engine
+
+
 @pytest.fixture
-def message_bus(temp_workspace: Path) -> AgentMessageBus:
-    """Create an AgentMessageBus instance for testing."""
-    messages_dir = temp_workspace / ".workflow" / "messages"
-    return AgentMessageBus(persist_messages=False, messages_dir=messages_dir)
+def workflow_engine_loaded(_loaded_workflow_engine: WorkflowEngine) -> Generator[WorkflowEngine, None, None]:
+    """
+    Module-shared WorkflowEngine with sample configs loaded.
+    
+    Execution state is reset after each test so stage transitions don't leak;
+    deep-copy engine.workflow before mutating its definition.
+    """
+    yield _loaded_workflow_engine
+    _loaded_workflow_engine.reset_state()
 
 
 @pytest.fixture
-def sample_workflow_config(temp_workspace: Path) -> Dict[str, Any]:
-    """Create sample workflow configuration files."""
-    workflow_dir = temp_workspace / ".workflow"
+def message_bus() -> AgentMessageBus:
+    """Create an in-memory AgentMessageBus instance for testing (no disk I/O)."""
+    return AgentMessageBus(persist_messages=False, messages_dir=None)
+
+
+@pytest.fixture(scope="session")
+def cli_runner() -> CliRunner:
+    """In-process runner for CLI commands (no subprocess spawn)."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def _workflow_config_template(tmp_path_factory) -> Dict[str, Any]:
+    """Write the sample workflow configuration files once per session."""
+    workflow_dir = tmp_path_factory.mktemp("wf_template")
     
     # Create role_schema.yaml
     role_schema = {
@@ -163,7 +219,7 @@ def sample_workflow_config(temp_workspace: Path) -> Dict[str, Any]:
     }
     
     with open(workflow_dir / "role_schema.yaml", "w") as f:
-        yaml.dump(role_schema, f)
+        yaml.dump(role_schema, f, Dumper=YAML_DUMPER)
     
     # Create workflow_schema.yaml
     workflow_schema = {
@@ -204,7 +260,7 @@ def sample_workflow_config(temp_workspace: Path) -> Dict[str, Any]:
     }
     
     with open(workflow_dir / "workflow_schema.yaml", "w") as f:
-        yaml.dump(workflow_schema, f)
+        yaml.dump(workflow_schema, f, Dumper=YAML_DUMPER)
     
     # Create skills directory
     skills_dir = workflow_dir / "skills" / "test_skill"
@@ -236,22 +292,39 @@ This is a test skill for testing purposes.
         f.write(skill_md)
     
     return {
-        "workspace": temp_workspace,
         "workflow_dir": workflow_dir,
         "role_schema": role_schema,
         "workflow_schema": workflow_schema
     }
 
 
-# Import enhanced fixtures for automated testing
-from tests.fixtures.test_project_fixtures import (
-    clean_project,
-    fresh_project,
-    project_with_files,
-    project_with_template,
-    command_tester,
-    command_tester_clean,
-    ProjectTestHelper,
-    CommandTester
-)
+@pytest.fixture(scope="session")
+def cli_pool():
+    """
+    Persistent worker processes for CLI tests that need process isolation.
+    
+    Use with tests.fixtures.cli_runner.run_cli_isolated; workers import the
+    CLI once and are reused across tests instead of spawning per call. Kept
+    small because every xdist worker starts its own pool.
+    """
+    with ProcessPoolExecutor(max_workers=2, initializer=preimport_cli) as pool:
+        yield pool
+
+
+@pytest.fixture
+def sample_workflow_config(temp_workspace: Path, _workflow_config_template: Dict[str, Any]) -> Dict[str, Any]:
+    """Create sample workflow configuration files (copied from the session template)."""
+    workflow_dir = temp_workspace / ".workflow"
+    _materialize_workflow_config(_workflow_config_template["workflow_dir"], workflow_dir)
+    
+    return {
+        "workspace": temp_workspace,
+        "workflow_dir": workflow_dir,
+        "role_schema": copy.deepcopy(_workflow_config_template["role_schema"]),
+        "workflow_schema": copy.deepcopy(_workflow_config_template["workflow_schema"])
+    }
+
 
+# Enhanced fixtures for automated testing, registered as a plugin so the
+# helpers are only loaded through pytest's plugin machinery
+pytest_plugins = ["tests.fixtures.test_project_fixtures"]
@@ -4,23 +4,15 @@ End-to-end tests for full workflow execution.
 import pytest
 from pathlib import Path
 
-from work_by_roles.core.workflow_engine import WorkflowEngine
 from work_by_roles.core.agent_orchestrator import AgentOrchestrator
 
 
 class TestFullWorkflow:
     """Test full workflow end-to-end."""
     
-    def test_complete_workflow_from_init_to_completion(self, sample_workflow_config):
+    def test_complete_workflow_from_init_to_completion(self, workflow_engine_loaded):
         """Test complete workflow from initialization to completion."""
-        engine = WorkflowEngine(workspace_path=sample_workflow_config["workspace"])
-        
-        # Load configurations
-        engine.load_all_configs(
-            skill_file=sample_workflow_config["workflow_dir"] / "skills",
-            roles_file=sample_workflow_config["workflow_dir"] / "role_schema.yaml",
-            workflow_file=sample_workflow_config["workflow_dir"] / "workflow_schema.yaml"
-        )
+        engine = workflow_engine_loaded
         
         # Verify workflow loaded
         assert engine.workflow is not None
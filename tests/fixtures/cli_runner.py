@@ -0,0 +1,110 @@
+"""
+In-process runner for the argparse-based workflow CLI.
+Invokes work_by_roles.cli.main directly instead of spawning a subprocess,
+so tests don't pay interpreter startup and package import on every call.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+
+def _resolve_cli_command() -> List[str]:
+    """
+    Command prefix for out-of-process CLI runs.
+
+    Prefers the installed `workflow` console script, which skips `-m` module
+    resolution; falls back to importing the entry point directly.
+    """
+    script = shutil.which("workflow")
+    if script:
+        return [script]
+    return [sys.executable, "-c", "from work_by_roles.cli import main; main()"]
+
+
+# Resolved once per session
+CLI_COMMAND: List[str] = _resolve_cli_command()
+
+
+@dataclass
+class CliResult:
+    """Result of an in-process CLI invocation."""
+    exit_code: int
+    stdout: str
+    stderr: str
+    exception: Optional[BaseException] = None
+
+    @property
+    def output(self) -> str:
+        return self.stdout
+
+
+class CliRunner:
+    """Run CLI commands in the current interpreter and capture their output."""
+
+    def invoke(self, args: Sequence[str], catch_exceptions: bool = True) -> CliResult:
+        """
+        Invoke the CLI with the given arguments.
+
+        SystemExit is translated into an exit code the same way the interpreter
+        would; any other exception is recorded on the result with exit code 1.
+        """
+        from work_by_roles.cli import main
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        exit_code = 0
+        exception = None
+
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                main(list(args))
+            except SystemExit as e:
+                if e.code is None:
+                    exit_code = 0
+                elif isinstance(e.code, int):
+                    exit_code = e.code
+                else:
+                    print(e.code, file=stderr)
+                    exit_code = 1
+            except Exception as e:
+                if not catch_exceptions:
+                    raise
+                exit_code = 1
+                exception = e
+
+        return CliResult(
+            exit_code=exit_code,
+            stdout=stdout.getvalue(),
+            stderr=stderr.getvalue(),
+            exception=exception
+        )
+
+
+def preimport_cli() -> None:
+    """Process-pool initializer: import the CLI once per worker process."""
+    import work_by_roles.cli  # noqa: F401
+
+
+def run_cli_isolated(args: Sequence[str], cwd: str) -> CliResult:
+    """
+    Run a CLI command inside a pool worker process.
+
+    For tests that need process isolation but shouldn't pay a fresh
+    interpreter per call. The exception (if any) is flattened to a
+    RuntimeError so the result always pickles back to the parent.
+    """
+    previous_cwd = os.getcwd()
+    os.chdir(cwd)
+    try:
+        result = CliRunner().invoke(args)
+    finally:
+        os.chdir(previous_cwd)
+
+    if result.exception is not None:
+        result.exception = RuntimeError(f"{type(result.exception).__name__}: {result.exception}")
+    return result
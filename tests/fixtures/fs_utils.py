@@ -0,0 +1,37 @@
+"""
+Filesystem helpers shared by test fixtures.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import Union
+
+
+def fast_copy(src: Path, dst: Path) -> None:
+    """
+    Recreate the tree at src under dst using hard links where possible.
+    
+    Only for files tests treat as read-only: a hard-linked file shares its
+    inode with the source, so writing it in place would change the source too.
+    Falls back to shutil.copy2 where linking isn't possible (e.g. across
+    filesystems or on platforms without hard links).
+    """
+    for root, _dirs, files in os.walk(src):
+        target_root = dst / Path(root).relative_to(src)
+        target_root.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            source_file = os.path.join(root, name)
+            target_file = target_root / name
+            try:
+                os.link(source_file, target_file)
+            except OSError:
+                shutil.copy2(source_file, target_file)
+
+
+def has_file(root: Union[str, Path], name: str) -> bool:
+    """Return True as soon as a file called name is found anywhere under root."""
+    for _dirpath, _dirnames, filenames in os.walk(root):
+        if name in filenames:
+            return True
+    return False
@@ -3,15 +3,82 @@ Enhanced test fixtures for workflow setup and CLI command testing.
 Provides automated project setup/teardown and command execution helpers.
 """
 
+import contextlib
+import io
+import json
+import os
 import pytest
-import tempfile
 import shutil
 import subprocess
-import sys
 from pathlib import Path
-from typing import Generator, Dict, Any, Optional, List
+from typing import Generator, Dict, Any, Optional, List, Sequence, Tuple
 import yaml
 
+from tests.fixtures.cli_runner import CLI_COMMAND, CliRunner
+from tests.fixtures.fs_utils import fast_copy
+
+# libyaml parser when available, pure-Python SafeLoader otherwise
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+_RUNNER = CliRunner()
+
+# Canonical scaffold content, written once per session and hard-linked into projects
+_BASIC_FILES = {
+    "README.md": "# Test Project\n",
+    "main.py": "print('Hello')\n",
+}
+_PROJECT_FILES = {
+    "requirements.txt": "pytest>=7.0\n",
+    "src/app.py": "def main(): pass\n",
+    "tests/test_app.py": "def test_main(): pass\n",
+    "pyproject.toml": "[project]\nname = 'test'\n",
+}
+
+
+# (path, mtime_ns, size) -> parsed YAML encoded as JSON; kept in memory so
+# nothing is written into the projects under test
+_YAML_JSON_CACHE: Dict[Tuple[str, int, int], str] = {}
+
+
+def read_yaml_cached(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing a JSON copy of the result while the file is unchanged.
+    
+    json's C decoder is much cheaper than even CSafeLoader, and decoding the
+    cached text hands each caller its own copy. Data that doesn't survive a
+    JSON round trip unchanged (non-str keys, dates, ...) is not cached.
+    """
+    path = Path(path)
+    stat = path.stat()
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    
+    cached = _YAML_JSON_CACHE.get(key)
+    if cached is not None:
+        return json.loads(cached)
+    
+    # Bytes go straight to the loader, which detects the encoding itself
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=_YAML_LOADER)
+    
+    try:
+        payload = json.dumps(data, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return data
+    if json.loads(payload) == data:
+        _YAML_JSON_CACHE[key] = payload
+    return data
+
+
+@contextlib.contextmanager
+def _chdir(path: Path) -> Generator[None, None, None]:
+    """Temporarily change the working directory."""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
 
 class ProjectTestHelper:
     """Helper class for testing workflow commands in isolated projects."""
@@ -27,40 +94,47 @@ class ProjectTestHelper:
         Note: setup command doesn't support --template argument.
         It automatically finds the template. Use init() if you need to specify template.
         """
-        cmd = [sys.executable, "-m", "work_by_roles.cli", "setup"]
         # Note: setup doesn't support --template, it auto-detects
-        
-        return subprocess.run(
-            cmd,
-            cwd=self.project_dir,
-            capture_output=True,
-            text=True
-        )
+        return self.run_command(["setup"])
     
     def init(self, template: Optional[str] = None, quick: bool = False) -> subprocess.CompletedProcess:
         """Run workflow init command."""
-        cmd = [sys.executable, "-m", "work_by_roles.cli", "init"]
+        cmd = ["init"]
         if template:
             cmd.extend(["--template", template])
         if quick:
             cmd.append("--quick")
         
-        return subprocess.run(
-            cmd,
-            cwd=self.project_dir,
-            capture_output=True,
-            text=True
-        )
+        return self.run_command(cmd)
     
     def run_command(self, command: List[str], **kwargs) -> subprocess.CompletedProcess:
-        """Run a workflow CLI command."""
-        cmd = [sys.executable, "-m", "work_by_roles.cli"] + command
-        return subprocess.run(
-            cmd,
-            cwd=self.project_dir,
-            capture_output=True,
-            text=True,
-            **kwargs
+        """
+        Run a workflow CLI command.
+        
+        Runs in-process by default. Extra subprocess kwargs, or setting
+        WORKFLOW_TEST_SUBPROCESS=1, switch to a real child process for tests
+        that need isolation.
+        """
+        if kwargs or os.environ.get("WORKFLOW_TEST_SUBPROCESS"):
+            return subprocess.run(
+                CLI_COMMAND + command,
+                cwd=self.project_dir,
+                capture_output=True,
+                text=True,
+                **kwargs
+            )
+        
+        with _chdir(self.project_dir):
+            result = _RUNNER.invoke(command)
+        
+        stderr = result.stderr
+        if result.exception is not None:
+            stderr += f"{type(result.exception).__name__}: {result.exception}\n"
+        return subprocess.CompletedProcess(
+            args=command,
+            returncode=result.exit_code,
+            stdout=result.stdout,
+            stderr=stderr
         )
     
     def cleanup(self):
@@ -89,14 +163,16 @@ class ProjectTestHelper:
     
     def read_yaml(self, relative_path: str) -> Dict[str, Any]:
         """Read a YAML file from the project."""
-        file_path = self.project_dir / relative_path
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return read_yaml_cached(self.project_dir / relative_path)
     
     def create_project_file(self, relative_path: str, content: str):
         """Create a file in the project."""
         file_path = self.project_dir / relative_path
         file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Scaffold files may be hard links to the session template; unlink
+        # first so the write never reaches the shared inode.
+        if file_path.exists():
+            file_path.unlink()
         file_path.write_text(content, encoding='utf-8')
 
 
@@ -180,41 +256,129 @@ class CommandTester:
             "success": result.returncode in [0, 1],
             "result": result
         }
+    
+    def run_batch(self, commands: Sequence[Tuple[str, Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Run several read-only commands in-process against one loaded engine.
+        
+        The engine and its configs are loaded once; each command handler is then
+        called directly with the engine passed in through ``preloaded_engine``
+        (argparse only builds its namespace), so N commands cost a single config
+        load instead of N interpreter startups.
+        
+        Args:
+            commands: (command, options) pairs, e.g. [("status", {}), ("list-roles", {})].
+                Options are turned into ``--key value`` flags for the subcommand.
+        
+        Returns:
+            Mapping of command name to its success flag, exit code and output.
+        """
+        from work_by_roles.cli import base
+        from work_by_roles.cli.parser import setup_parser
+        
+        parser = setup_parser()
+        global_args = ["--workspace", str(self.project.project_dir)]
+        engine_result = None
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        for command, options in commands:
+            argv = global_args + [command]
+            for key, value in options.items():
+                argv.append(f"--{key.replace('_', '-')}")
+                if value is not True:
+                    argv.append(str(value))
+            
+            stdout, stderr = io.StringIO(), io.StringIO()
+            exit_code = 0
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                try:
+                    args = parser.parse_args(argv)
+                    if engine_result is None:
+                        engine_result = base._init_engine(args)
+                    args.preloaded_engine = engine_result
+                    args.func(args)
+                except SystemExit as e:
+                    exit_code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+                except Exception as e:
+                    print(f"{type(e).__name__}: {e}", file=stderr)
+                    exit_code = 1
+            
+            results[command] = {
+                "success": exit_code == 0,
+                "exit_code": exit_code,
+                "stdout": stdout.getvalue(),
+                "stderr": stderr.getvalue(),
+                "has_output": bool(stdout.getvalue())
+            }
+        
+        return results
+
+
+def _write_files(root: Path, files: Dict[str, str]) -> None:
+    """Write a {relative_path: content} mapping under root."""
+    for relative_path, content in files.items():
+        file_path = root / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(content)
+
+
+@pytest.fixture(scope="session")
+def _scaffold_dir(tmp_path_factory) -> Path:
+    """
+    Write the project scaffold files once per session.
+    
+    basic/ holds what every clean project starts with; files/ holds the extra
+    structure for project_with_files. Both are hard-linked into each project.
+    """
+    scaffold_dir = tmp_path_factory.mktemp("scaffold")
+    _write_files(scaffold_dir / "basic", _BASIC_FILES)
+    _write_files(scaffold_dir / "files", _PROJECT_FILES)
+    return scaffold_dir
 
 
 @pytest.fixture
-def clean_project() -> Generator[ProjectTestHelper, None, None]:
+def clean_project(tmp_path_factory, _scaffold_dir: Path) -> ProjectTestHelper:
     """
     Create a clean temporary project for testing.
-    Automatically cleans up after test.
+    The directory lives under pytest's basetemp, which pytest prunes itself.
     """
-    temp_dir = tempfile.mkdtemp(prefix="workflow_test_project_")
-    project_dir = Path(temp_dir)
+    project_dir = tmp_path_factory.mktemp("workflow_test_project")
     
-    # Create some basic project files
-    (project_dir / "README.md").write_text("# Test Project\n")
-    (project_dir / "main.py").write_text("print('Hello')\n")
+    # Link in the basic project files
+    fast_copy(_scaffold_dir / "basic", project_dir)
     
-    helper = ProjectTestHelper(project_dir)
+    return ProjectTestHelper(project_dir)
+
+
+@pytest.fixture(scope="session")
+def _setup_template_dir(tmp_path_factory) -> Path:
+    """
+    Run `workflow setup` once per session in a project matching clean_project.
     
-    yield helper
+    fresh_project restores this .workflow tree instead of re-running setup.
+    """
+    project_dir = tmp_path_factory.mktemp("setup_template")
+    _write_files(project_dir, _BASIC_FILES)
     
-    # Cleanup
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    helper = ProjectTestHelper(project_dir)
+    result = helper.setup()
+    helper.assert_setup_success(result)
+    return project_dir
 
 
 @pytest.fixture
-def fresh_project(clean_project: ProjectTestHelper) -> Generator[ProjectTestHelper, None, None]:
+def fresh_project(clean_project: ProjectTestHelper, _setup_template_dir: Path) -> Generator[ProjectTestHelper, None, None]:
     """
     Create a fresh project with workflow setup already run.
-    Automatically resets before each test.
+    
+    The .workflow tree is copied from the session-wide setup result, so each
+    test gets its own writable copy without paying for setup again. Real
+    copies (not hard links): commands rewrite files such as state.yaml in place.
     """
     # Ensure clean state
     clean_project.reset()
     
-    # Run setup
-    result = clean_project.setup()
-    clean_project.assert_setup_success(result)
+    shutil.copytree(_setup_template_dir / ".workflow", clean_project.workflow_dir)
     
     yield clean_project
     
@@ -222,41 +386,35 @@ def fresh_project(clean_project: ProjectTestHelper) -> Generator[ProjectTestHelp
 
 
 @pytest.fixture
-def project_with_files(clean_project: ProjectTestHelper) -> Generator[ProjectTestHelper, None, None]:
+def project_with_files(clean_project: ProjectTestHelper, _scaffold_dir: Path) -> Generator[ProjectTestHelper, None, None]:
     """
     Create a project with realistic file structure.
     """
     helper = clean_project
     
-    # Create realistic project structure
-    helper.create_project_file("requirements.txt", "pytest>=7.0\n")
-    helper.create_project_file("src/app.py", "def main(): pass\n")
-    helper.create_project_file("tests/test_app.py", "def test_main(): pass\n")
-    helper.create_project_file("pyproject.toml", "[project]\nname = 'test'\n")
+    # Link in the realistic project structure
+    fast_copy(_scaffold_dir / "files", helper.project_dir)
     
     yield helper
 
 
-@pytest.fixture(params=["standard-delivery", "vibe-coding", None])
-def project_with_template(request, clean_project: ProjectTestHelper) -> Generator[ProjectTestHelper, None, None]:
+@pytest.fixture
+def project_with_template(clean_project: ProjectTestHelper) -> Generator[ProjectTestHelper, None, None]:
     """
-    Create projects with different templates (parametrized).
-    Note: setup command auto-detects templates, init command requires teams/ directory.
-    For testing, we use setup which automatically finds templates.
+    Create a project set up from the auto-detected template.
+    
+    setup takes no --template argument, so this is not parametrized: every
+    template param used to run the identical setup. Use init(template=...)
+    directly to cover a specific template (it requires a teams/ directory).
     """
     helper = clean_project
-    template = request.param
-    
-    # Use setup command (it auto-detects templates)
-    # For specific template testing, we can use init, but it requires teams/ directory
-    # In test environment, setup is more reliable
     result = helper.setup()
     
     # Verify setup succeeded
     if result.returncode == 0 and helper.workflow_dir.exists():
         yield helper
     else:
-        pytest.skip(f"Template {template} setup failed: {result.stderr}")
+        pytest.skip(f"Template setup failed: {result.stderr}")
 
 
 @pytest.fixture
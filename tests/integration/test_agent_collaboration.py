@@ -3,22 +3,29 @@ Integration tests for agent collaboration.
 """
 import pytest
 
-from work_by_roles.core.workflow_engine import WorkflowEngine
-from work_by_roles.core.agent_orchestrator import AgentOrchestrator
-from work_by_roles.core.agent_message_bus import AgentMessageBus
+
+@pytest.fixture
+def orchestrator_with_agents(workflow_engine, sample_role):
+    """AgentOrchestrator for test_role plus the agent pool created from it."""
+    from work_by_roles.core.agent_orchestrator import AgentOrchestrator
+    
+    workflow_engine.role_manager.roles = {"test_role": sample_role}
+    
+    orchestrator = AgentOrchestrator(workflow_engine)
+    agents = orchestrator._create_agent_pool([sample_role])
+    
+    yield orchestrator, agents
+    
+    orchestrator.message_bus.clear_messages()
+    orchestrator.message_bus.clear_contexts()
 
 
 class TestAgentCollaboration:
     """Test agent collaboration integration."""
     
-    def test_multi_agent_message_passing(self, workflow_engine, sample_role):
+    def test_multi_agent_message_passing(self, orchestrator_with_agents):
         """Test message passing between multiple agents."""
-        workflow_engine.role_manager.roles = {"test_role": sample_role}
-        
-        orchestrator = AgentOrchestrator(workflow_engine)
-        
-        # Create agents
-        agents = orchestrator._create_agent_pool([sample_role])
+        orchestrator, agents = orchestrator_with_agents
         agent1 = list(agents.values())[0]
         
         # Send message
@@ -34,11 +41,9 @@ class TestAgentCollaboration:
         messages = orchestrator.message_bus.peek_messages("agent2")
         assert len(messages) > 0
     
-    def test_task_decomposition_and_execution(self, workflow_engine, sample_role):
+    def test_task_decomposition_and_execution(self, orchestrator_with_agents):
         """Test task decomposition and collaborative execution."""
-        workflow_engine.role_manager.roles = {"test_role": sample_role}
-        
-        orchestrator = AgentOrchestrator(workflow_engine)
+        orchestrator, _agents = orchestrator_with_agents
         
         goal = "实现测试功能"
         result = orchestrator.execute_with_collaboration(
@@ -52,12 +57,9 @@ class TestAgentCollaboration:
         assert len(result["decomposition"].tasks) > 0
         assert len(result["agents"]) > 0
     
-    def test_context_sharing(self, workflow_engine, sample_role):
+    def test_context_sharing(self, orchestrator_with_agents):
         """Test context sharing between agents."""
-        workflow_engine.role_manager.roles = {"test_role": sample_role}
-        
-        orchestrator = AgentOrchestrator(workflow_engine)
-        agents = orchestrator._create_agent_pool([sample_role])
+        orchestrator, agents = orchestrator_with_agents
         
         agent1 = list(agents.values())[0]
         agent1.prepare("Test goal", {"input": "test"})
@@ -71,4 +73,3 @@ class TestAgentCollaboration:
         shared = orchestrator.message_bus.get_context(agent1.agent_id)
         assert shared is not None
         assert shared["goal"] == "Test goal"
-
@@ -3,20 +3,14 @@ Integration tests for checkpoint restore functionality.
 """
 
 import pytest
-from pathlib import Path
-import tempfile
-import shutil
 
 from work_by_roles.core.workflow_engine import WorkflowEngine
-from work_by_roles.core.checkpoint_manager import CheckpointManager
-from work_by_roles.core.enums import StageStatus
 
 
 @pytest.fixture
-def temp_workspace():
+def temp_workspace(tmp_path):
     """Create a temporary workspace with workflow config"""
-    temp_dir = tempfile.mkdtemp(prefix="test_checkpoint_restore_")
-    workspace = Path(temp_dir)
+    workspace = tmp_path
     
     # Create minimal workflow config
     workflow_dir = workspace / ".workflow"
@@ -77,8 +71,7 @@ category: general
 This is a test skill for integration testing.
 """, encoding='utf-8')
     
-    yield workspace
-    shutil.rmtree(temp_dir, ignore_errors=True)
+    return workspace
 
 
 def test_checkpoint_restore_integration(temp_workspace):
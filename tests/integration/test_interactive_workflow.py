@@ -1,16 +1,28 @@
 import pytest
-from unittest.mock import MagicMock
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
 from work_by_roles.core.intent_handler import IntentHandler
 from work_by_roles.core.enums import IntentType
 
+
+@dataclass
+class StubRoleManager:
+    """Only the attributes IntentHandler reads from the role manager."""
+    roles: Dict[str, Any] = field(default_factory=dict)
+    skill_library: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class StubWorkflow:
+    stages: List[Any] = field(default_factory=list)
+
+
+@dataclass
 class SimpleEngine:
-    def __init__(self, workspace_path):
-        self.workspace_path = workspace_path
-        self.role_manager = MagicMock()
-        self.role_manager.roles = {}
-        self.role_manager.skill_library = {}
-        self.workflow = MagicMock()
-        self.workflow.stages = []
+    workspace_path: Path
+    role_manager: StubRoleManager = field(default_factory=StubRoleManager)
+    workflow: StubWorkflow = field(default_factory=StubWorkflow)
 
 @pytest.fixture
 def mock_engine(tmp_path):
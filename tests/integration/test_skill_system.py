@@ -3,23 +3,15 @@ Integration tests for skill system.
 """
 import pytest
 
-from work_by_roles.core.workflow_engine import WorkflowEngine
-from work_by_roles.core.agent_orchestrator import AgentOrchestrator
-from work_by_roles.core.skill_benchmark import SkillBenchmark
-
 
 class TestSkillSystem:
-    """Test skill system integration."""
+    """Test skill system integration (configs are loaded once per module)."""
     
-    def test_skill_selection_and_execution(self, workflow_engine, sample_skill, sample_role, sample_workflow_config):
+    def test_skill_selection_and_execution(self, workflow_engine_loaded, sample_skill, sample_role):
         """Test skill selection and execution flow."""
-        workflow_engine.load_all_configs(
-            skill_file=sample_workflow_config["workflow_dir"] / "skills",
-            roles_file=sample_workflow_config["workflow_dir"] / "role_schema.yaml",
-            workflow_file=sample_workflow_config["workflow_dir"] / "workflow_schema.yaml"
-        )
+        from work_by_roles.core.agent_orchestrator import AgentOrchestrator
         
-        orchestrator = AgentOrchestrator(workflow_engine)
+        orchestrator = AgentOrchestrator(workflow_engine_loaded)
         
         # Select skill
         selected = orchestrator.skill_selector.select_skill("test task", sample_role)
@@ -36,16 +28,13 @@ class TestSkillSystem:
             
             assert result is not None
     
-    def test_skill_benchmark(self, workflow_engine, sample_skill, sample_workflow_config):
+    def test_skill_benchmark(self, workflow_engine_loaded, sample_skill):
         """Test skill benchmarking."""
-        workflow_engine.load_all_configs(
-            skill_file=sample_workflow_config["workflow_dir"] / "skills",
-            roles_file=sample_workflow_config["workflow_dir"] / "role_schema.yaml",
-            workflow_file=sample_workflow_config["workflow_dir"] / "workflow_schema.yaml"
-        )
+        from work_by_roles.core.agent_orchestrator import AgentOrchestrator
+        from work_by_roles.core.skill_benchmark import SkillBenchmark
         
-        orchestrator = AgentOrchestrator(workflow_engine)
-        benchmark = SkillBenchmark(workflow_engine, orchestrator)
+        orchestrator = AgentOrchestrator(workflow_engine_loaded)
+        benchmark = SkillBenchmark(workflow_engine_loaded, orchestrator)
         
         test_cases = [
             {
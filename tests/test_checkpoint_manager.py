@@ -7,6 +7,7 @@ from pathlib import Path
 from datetime import datetime
 import tempfile
 import shutil
+import yaml
 
 from work_by_roles.core.checkpoint_manager import CheckpointManager
 from work_by_roles.core.models import ExecutionState, Checkpoint
@@ -113,6 +114,39 @@ def test_delete_checkpoint(temp_workspace):
     assert retrieved is None
 
 
+def test_checkpoint_index_shared_between_managers(temp_workspace):
+    """Test that a second manager sees checkpoints recorded in the index"""
+    manager = CheckpointManager(temp_workspace)
+    execution_state = ExecutionState(current_stage="stage1")
+    
+    cp1 = manager.create_checkpoint("workflow1", execution_state, name="CP1")
+    assert manager.index_file.exists()
+    
+    other = CheckpointManager(temp_workspace)
+    cp2 = other.create_checkpoint("workflow1", execution_state, name="CP2")
+    
+    # The first manager picks up the rewritten index
+    ids = [cp.checkpoint_id for cp in manager.list_checkpoints("workflow1")]
+    assert set(ids) == {cp1.checkpoint_id, cp2.checkpoint_id}
+    
+    manager.delete_checkpoint(cp1.checkpoint_id)
+    assert [cp.checkpoint_id for cp in other.list_checkpoints("workflow1")] == [cp2.checkpoint_id]
+
+
+def test_checkpoint_index_rebuilt_when_missing(temp_workspace):
+    """Test that checkpoints written without an index are still found"""
+    manager = CheckpointManager(temp_workspace)
+    execution_state = ExecutionState(current_stage="stage1")
+    checkpoint = manager.create_checkpoint("workflow1", execution_state, name="Legacy")
+    manager.index_file.unlink()
+    
+    fresh = CheckpointManager(temp_workspace)
+    latest = fresh.get_latest_checkpoint("workflow1")
+    assert latest is not None
+    assert latest.checkpoint_id == checkpoint.checkpoint_id
+    assert fresh.index_file.exists()
+
+
 def test_restore_from_checkpoint(temp_workspace):
     """Test restoring from checkpoint"""
     manager = CheckpointManager(temp_workspace)
@@ -146,3 +180,54 @@ def test_restore_from_checkpoint(temp_workspace):
     assert engine.executor.state.current_stage == "stage1"
     assert engine.executor.state.current_role == "role1"
 
+
+def test_large_checkpoint_is_compressed(temp_workspace):
+    """Test that large checkpoints are compressed on disk and load transparently"""
+    manager = CheckpointManager(temp_workspace)
+    manager.COMPRESS_THRESHOLD = 1024
+    
+    violations = [f"violation {i}" for i in range(100)]
+    execution_state = ExecutionState(current_stage="stage1", violations=violations)
+    snapshot = {"notes": ["需求分析阶段的上下文快照"] * 200}
+    checkpoint = manager.create_checkpoint("workflow1", execution_state, name="Big", context_snapshot=snapshot)
+    
+    checkpoint_file = temp_workspace / ".workflow" / "checkpoints" / "workflow1" / f"{checkpoint.checkpoint_id}.yaml"
+    assert checkpoint_file.read_bytes().startswith(CheckpointManager.COMPRESSED_MAGIC)
+    
+    # Side files stay plain so they can be read directly
+    state_file = checkpoint_file.with_name(f"{checkpoint.checkpoint_id}_state.yaml")
+    assert state_file.stat().st_size > manager.COMPRESS_THRESHOLD
+    assert yaml.safe_load(state_file.read_text(encoding="utf-8"))["violations"] == violations
+    
+    loaded = manager.get_checkpoint(checkpoint.checkpoint_id)
+    assert loaded is not None
+    assert loaded.context_snapshot == snapshot
+
+
+def test_serialization_buffers_are_reused(temp_workspace):
+    """Test that checkpoint serialization reuses pooled buffers"""
+    manager = CheckpointManager(temp_workspace)
+    execution_state = ExecutionState(current_stage="stage1")
+    
+    manager.create_checkpoint("workflow1", execution_state, name="CP1")
+    pooled = list(manager._buf_pool)
+    manager.create_checkpoint("workflow1", execution_state, name="CP2")
+    
+    assert len(pooled) == 1
+    assert manager._buf_pool == pooled
+    assert pooled[0].getbuffer().nbytes == 0
+
+
+def test_checkpoint_files_written_atomically(temp_workspace):
+    """Test that checkpoint writes leave no temp files behind, with or without fsync"""
+    manager = CheckpointManager(temp_workspace)
+    execution_state = ExecutionState(current_stage="stage1")
+    
+    manager.create_checkpoint("workflow1", execution_state, name="CP1")
+    manager.FSYNC_ON_SAVE = True
+    checkpoint = manager.create_checkpoint("workflow1", execution_state, name="CP2")
+    
+    workflow_dir = temp_workspace / ".workflow" / "checkpoints" / "workflow1"
+    assert not list(workflow_dir.glob("*.tmp"))
+    assert len(list(workflow_dir.glob("*_state.yaml"))) == 2
+    assert manager.get_checkpoint(checkpoint.checkpoint_id).name == "CP2"
@@ -93,3 +93,48 @@ def test_get_recent_changes_limit(temp_workspace):
     # Should be sorted by timestamp (most recent first)
     assert recent[0]["file"] == "file9.py"
 
+
+
+def test_get_recent_changes_same_timestamp(temp_workspace):
+    """Test that recent changes follow recording order even when timestamps tie"""
+    tracker = CodeWritingTracker(temp_workspace)
+    
+    for i in range(3):
+        tracker.track_file_creation(f"file{i}.py", f"content{i}", "stage1")
+    for change in tracker.writing_history:
+        change["timestamp"] = "2024-01-01T00:00:00"
+    
+    recent = tracker.get_recent_changes(limit=3)
+    assert [c["file"] for c in recent] == ["file2.py", "file1.py", "file0.py"]
+
+
+def test_track_file_modification_counts(temp_workspace):
+    """Test addition/deletion counts and preview truncation"""
+    tracker = CodeWritingTracker(temp_workspace)
+    
+    old_content = "".join(f"line{i}\n" for i in range(30))
+    new_content = "".join(f"line{i}\n" if i % 2 else f"changed{i}\n" for i in range(30))
+    tracker.track_file_modification("big.py", old_content, new_content, "stage1")
+    tracker.track_file_modification("same.py", old_content, old_content, "stage1")
+    
+    same, big = tracker.get_recent_changes(limit=2)
+    assert (big["additions"], big["deletions"]) == (15, 15)
+    assert "还有" in big["diff_preview"]
+    assert (same["changes"], same["diff_preview"]) == (0, "")
+
+
+def test_format_code_changes_reuses_rendered_entries(temp_workspace):
+    """Test repeated renders reuse already formatted change entries"""
+    from work_by_roles.core.code_writing_tracker import _format_change_block
+    
+    tracker = CodeWritingTracker(temp_workspace)
+    tracker.track_file_creation("a.py", "print('a')\n", "stage1", "skill1")
+    tracker.track_file_modification("a.py", "print('a')\n", "print('b')\n", "stage2")
+    
+    first = tracker.format_code_changes_for_display()
+    hits = _format_change_block.cache_info().hits
+    
+    assert tracker.format_code_changes_for_display() == first
+    assert _format_change_block.cache_info().hits == hits + 2
+    assert "   - 技能: skill1" in first
+    assert "   - 变更: +1 -1 行" in first
@@ -95,3 +95,47 @@ def test_list_all_documents(temp_workspace):
     assert all("size" in doc for doc in docs)
     assert all("last_modified" in doc for doc in docs)
 
+
+
+def test_document_preview_counts_match_full_read(temp_workspace):
+    """Test streamed preview reports the same counts as reading the whole file"""
+    generator = DocumentPreviewGenerator(temp_workspace)
+    
+    content = "\n".join(f"行 {i}" for i in range(10)) + "\n"
+    doc_path = temp_workspace / ".workflow" / "temp" / "counts.md"
+    doc_path.write_text(content, encoding='utf-8')
+    
+    preview = generator.get_document_preview("counts.md", max_lines=3)
+    
+    assert preview["total_lines"] == len(content.split('\n'))
+    assert preview["size"] == len(content)
+    assert preview["preview"].startswith("行 0\n行 1\n行 2\n\n...")
+    
+    docs = generator.list_all_documents()
+    assert docs[0]["lines"] == len(content.split('\n'))
+    assert docs[0]["size_chars"] == len(content)
+
+
+def test_format_document_for_display_cached_until_modified(temp_workspace, monkeypatch):
+    """Test formatted output is reused until the document changes"""
+    import os
+    from work_by_roles.core import document_preview_generator as module
+    
+    generator = DocumentPreviewGenerator(temp_workspace)
+    doc_path = temp_workspace / ".workflow" / "temp" / "cached.md"
+    doc_path.write_text("# v1\n", encoding='utf-8')
+    
+    reads = []
+    real_scan = module._scan_text
+    monkeypatch.setattr(module, "_scan_text", lambda *a: reads.append(a) or real_scan(*a))
+    
+    first = generator.format_document_for_display("cached.md")
+    assert generator.format_document_for_display("cached.md") == first
+    assert len(reads) == 1
+    
+    doc_path.write_text("# v2 changed\n", encoding='utf-8')
+    stat = doc_path.stat()
+    os.utime(doc_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    assert "v2 changed" in generator.format_document_for_display("cached.md")
+    assert len(reads) == 2
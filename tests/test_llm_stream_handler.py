@@ -72,3 +72,31 @@ def test_reset(stream_writer):
     assert handler.buffer == ""
     assert handler.full_response == ""
 
+
+
+def test_full_response_after_many_chunks(stream_writer):
+    """Test accumulated response stays correct across reads and further chunks"""
+    handler = LLMStreamHandler(stream_writer)
+    
+    for i in range(1000):
+        handler.handle_chunk(str(i % 10))
+        if i == 499:
+            assert len(handler.full_response) == 500
+    
+    assert handler.full_response == "0123456789" * 100
+    assert handler.get_full_response() == handler.buffer
+
+
+def test_extract_text_from_response_subclasses(stream_writer):
+    """Test dict/str subclasses fall back to the same extraction rules"""
+    from collections import OrderedDict
+    
+    class Text(str):
+        pass
+    
+    handler = LLMStreamHandler(stream_writer)
+    
+    assert handler._extract_text_from_response(OrderedDict(text="Hello")) == "Hello"
+    assert handler._extract_text_from_response(Text("Hello")) == "Hello"
+    assert handler._extract_text_from_response({"content": None, "text": "x"}) is None
+    assert handler._extract_text_from_response({"other": 1}) == "{'other': 1}"
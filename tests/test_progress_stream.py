@@ -66,3 +66,34 @@ def test_write_status(stream_writer):
     content = stream_writer.output_stream.getvalue()
     assert "Status message" in content
 
+
+
+def test_update_skips_unchanged_progress_line(stream_writer):
+    """Test repeated identical updates are written only once"""
+    progress = ProgressStream(stream_writer)
+    
+    progress.update(0.5, "Processing")
+    progress.update(0.501, "Processing")
+    progress.update(0.5, "Processing")
+    
+    content = stream_writer.output_stream.getvalue()
+    assert content.count("Processing") == 1
+    
+    progress.write_status("Status message")
+    progress.update(0.5, "Processing")
+    
+    content = stream_writer.output_stream.getvalue()
+    assert content.count("Processing") == 2
+
+
+def test_update_throttles_rapid_writes(stream_writer):
+    """Test rapid updates are coalesced but the final state is written"""
+    progress = ProgressStream(stream_writer)
+    
+    for i in range(1, 1001):
+        progress.update(i / 1000, "Streaming")
+    
+    content = stream_writer.output_stream.getvalue()
+    assert content.count("Streaming") < 100
+    assert content.endswith("100%")
+    assert progress.current_progress == 1.0
@@ -73,3 +73,32 @@ def test_stream_writer_is_interactive():
     result = writer.is_interactive()
     assert isinstance(result, bool)
 
+
+
+class _CountingStream(StringIO):
+    """StringIO that counts flush calls"""
+    
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+    
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+def test_stream_writer_defers_flush_when_not_requested():
+    """Test non-TTY output is only flushed when asked to"""
+    output = _CountingStream()
+    
+    with StreamWriter(output_stream=output) as writer:
+        writer.write("a", flush=False)
+        writer.writeline("b", flush=False)
+        writer.write_progress("Processing", 0.5)
+        assert output.flushes == 0
+        
+        writer.write("c")
+        assert output.flushes == 1
+    
+    assert output.flushes == 2
+    assert output.getvalue() == "ab\n\rProcessing [50%]c"
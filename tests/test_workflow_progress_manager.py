@@ -8,6 +8,7 @@ from datetime import datetime
 import tempfile
 import shutil
 import json
+import time
 
 from work_by_roles.core.workflow_progress_manager import (
     WorkflowProgressManager,
@@ -78,15 +79,39 @@ def test_progress_manager_progress_calculation(temp_workspace):
     assert manager.current_progress.overall_progress == 0.5  # 1 completed out of 2
 
 
-def test_progress_manager_save_load(temp_workspace):
-    """Test saving and loading progress"""
+def test_progress_manager_progress_follows_status_changes(temp_workspace):
+    """Test overall progress when a stage is re-run or completed twice"""
     manager = WorkflowProgressManager(temp_workspace)
     manager.start_workflow("test_workflow")
     manager.start_stage("stage1", "Stage 1")
+    manager.start_stage("stage2", "Stage 2")
+    
+    manager.update_stage("stage1", status="completed")
+    manager.update_stage("stage1", status="completed")
+    assert manager.current_progress.overall_progress == 0.5
+    
+    manager.update_stage("stage1", status="running")
+    assert manager.current_progress.overall_progress == 0.0
+    
+    manager.update_stage("stage1", status="completed")
+    manager.update_stage("stage2", status="completed")
+    assert manager.current_progress.overall_progress == 1.0
+    
+    restored = WorkflowProgress.from_dict(manager.current_progress.to_dict())
+    assert restored.completed_count == 2
+
+
+@pytest.mark.parametrize("persist_format", ["json", "pickle"])
+def test_progress_manager_save_load(temp_workspace, persist_format):
+    """Test saving and loading progress"""
+    manager = WorkflowProgressManager(temp_workspace, persist_format=persist_format)
+    manager.start_workflow("test_workflow")
+    manager.start_stage("stage1", "Stage 1")
     manager.update_stage("stage1", status="completed", output_files=["file1.md"])
+    manager.flush()
     
     # Create new manager and load
-    manager2 = WorkflowProgressManager(temp_workspace)
+    manager2 = WorkflowProgressManager(temp_workspace, persist_format=persist_format)
     loaded = manager2.load_progress()
     
     assert loaded is not None
@@ -97,6 +122,28 @@ def test_progress_manager_save_load(temp_workspace):
     assert "file1.md" in loaded.stages[0].output_files
 
 
+def test_progress_manager_load_reuses_unchanged_file(temp_workspace):
+    """Test load_progress only re-parses the file after it changes"""
+    manager = WorkflowProgressManager(temp_workspace)
+    manager.start_workflow("test_workflow")
+    manager.start_stage("stage1", "Stage 1")
+    manager.flush()
+    
+    first = manager.load_progress()
+    assert manager.load_progress() is first
+    
+    manager.update_stage("stage1", status="completed")
+    reloaded = manager.load_progress()
+    assert reloaded is not first
+    assert reloaded.stages[0].status == "completed"
+    
+    # Writes from elsewhere are picked up too
+    other = WorkflowProgressManager(temp_workspace)
+    other.start_workflow("other_workflow")
+    other.flush()
+    assert manager.load_progress().workflow_id == "other_workflow"
+
+
 def test_progress_manager_get_progress_markdown(temp_workspace):
     """Test generating progress markdown"""
     manager = WorkflowProgressManager(temp_workspace)
@@ -132,3 +179,92 @@ def test_progress_step_serialization():
     assert step2.step_id == "test"
     assert step2.status == "running"
 
+
+def test_progress_manager_rejects_unknown_format(temp_workspace):
+    """Test unsupported persist formats are rejected up front"""
+    with pytest.raises(ValueError):
+        WorkflowProgressManager(temp_workspace, persist_format="xml")
+
+
+def test_progress_manager_coalesces_saves(temp_workspace):
+    """Test rapid updates are written once, on flush"""
+    manager = WorkflowProgressManager(temp_workspace)
+    manager.SAVE_INTERVAL = 60
+    manager.start_workflow("test_workflow")
+    
+    for i in range(10):
+        manager.start_stage(f"stage{i}", f"Stage {i}")
+    
+    on_disk = json.loads(manager.progress_file.read_text(encoding='utf-8'))
+    assert on_disk["stages"] == []
+    
+    manager.flush()
+    on_disk = json.loads(manager.progress_file.read_text(encoding='utf-8'))
+    assert len(on_disk["stages"]) == 10
+
+
+def test_progress_manager_writes_deferred_change_after_interval(temp_workspace):
+    """Test a change made right after a save is written without another update"""
+    manager = WorkflowProgressManager(temp_workspace)
+    manager.SAVE_INTERVAL = 0.05
+    manager.start_workflow("test_workflow")
+    manager.start_stage("stage1", "Stage 1")
+    manager.update_stage("stage1", status="completed")
+    
+    deadline = time.monotonic() + 5
+    while time.monotonic() < deadline:
+        on_disk = json.loads(manager.progress_file.read_text(encoding='utf-8'))
+        if on_disk["stages"] and on_disk["stages"][0]["status"] == "completed":
+            break
+        time.sleep(0.01)
+    assert on_disk["stages"][0]["status"] == "completed"
+
+
+def test_progress_markdown_duration_ignores_wall_clock(temp_workspace):
+    """Test durations come from the monotonic clock, not start_time/end_time"""
+    manager = WorkflowProgressManager(temp_workspace)
+    manager.start_workflow("test_workflow")
+    step = manager.start_stage("stage1", "Stage 1")
+    manager.update_stage("stage1", status="completed")
+    
+    # Simulate a wall-clock jump between start and end
+    step.end_time = step.start_time.replace(year=step.start_time.year + 1)
+    
+    markdown = manager.get_progress_markdown()
+    assert "耗时: 0.0秒" in markdown
+
+
+def test_progress_get_step_tracks_appended_stages():
+    """Test WorkflowProgress.get_step finds steps added after earlier lookups"""
+    progress = WorkflowProgress(workflow_id="test_workflow")
+    assert progress.get_step("stage1") is None
+    
+    first = ProgressStep(step_id="stage1", name="Stage 1", status="completed")
+    progress.stages.append(first)
+    assert progress.get_step("stage1") is first
+    
+    # A repeated step_id still resolves to the first step, as before
+    progress.stages.append(ProgressStep(step_id="stage2", name="Stage 2", status="running"))
+    progress.stages.append(ProgressStep(step_id="stage1", name="Stage 1 retry", status="running"))
+    assert progress.get_step("stage2").name == "Stage 2"
+    assert progress.get_step("stage1") is first
+    
+    progress.stages.clear()
+    assert progress.get_step("stage1") is None
+
+
+def test_progress_get_step_tracks_replaced_stages():
+    """Test WorkflowProgress.get_step follows a reassigned stage list and in-place replacements"""
+    first = ProgressStep(step_id="a", name="A", status="completed")
+    progress = WorkflowProgress(workflow_id="test_workflow", stages=[first])
+    assert progress.get_step("a") is first
+    
+    replacement = ProgressStep(step_id="b", name="B", status="running")
+    progress.stages = [replacement]
+    assert progress.get_step("b") is replacement
+    assert progress.get_step("a") is None
+    
+    third = ProgressStep(step_id="c", name="C", status="pending")
+    progress.stages[0] = third
+    assert progress.get_step("c") is third
+    assert progress.get_step("b") is None
@@ -21,6 +21,13 @@ class TestAgent:
         assert agent.agent_id.startswith(sample_role.id)
         assert agent.message_bus is None
     
+    def test_agent_ids_are_unique(self, workflow_engine, sample_role):
+        """Test agents of the same role get distinct IDs."""
+        ids = {Agent(sample_role, workflow_engine).agent_id for _ in range(100)}
+        
+        assert len(ids) == 100
+        assert all(agent_id.startswith(f"{sample_role.id}_") for agent_id in ids)
+    
     def test_agent_initialization_with_message_bus(self, workflow_engine, sample_role, message_bus):
         """Test initializing Agent with message bus."""
         agent = Agent(sample_role, workflow_engine, message_bus=message_bus)
@@ -90,6 +97,19 @@ class TestAgent:
         assert output_path.exists()
         assert output_path.read_text() == "Document content"
     
+    def test_agent_produce_output_overwrites(self, workflow_engine, sample_role, temp_workspace):
+        """Test re-producing an output replaces it, even if its directory was removed."""
+        import shutil
+        agent = Agent(sample_role, workflow_engine)
+        agent.prepare("Test goal")
+        
+        agent.produce_output("notes.md", "很长的第一版内容\n" * 10, output_type="document")
+        output_path = Path(agent.context.outputs["notes.md"])
+        shutil.rmtree(output_path.parent)
+        
+        agent.produce_output("notes.md", "第二版", output_type="document")
+        assert output_path.read_text(encoding="utf-8") == "第二版"
+    
     def test_agent_get_context_summary(self, workflow_engine, sample_role, sample_workflow_config):
         """Test getting context summary."""
         workflow_engine.load_all_configs(
@@ -108,6 +128,23 @@ class TestAgent:
         assert hasattr(summary, "key_outputs")
         assert hasattr(summary, "current_goal")
     
+    def test_agent_get_context_summary_for_stage(self, workflow_engine, sample_role, sample_workflow_config):
+        """Test the summary names the current stage and uses its goal."""
+        workflow_engine.load_all_configs(
+            skill_file=sample_workflow_config["workflow_dir"] / "skills",
+            roles_file=sample_workflow_config["workflow_dir"] / "role_schema.yaml",
+            workflow_file=sample_workflow_config["workflow_dir"] / "workflow_schema.yaml"
+        )
+        stage = workflow_engine.workflow.stages[0]
+        
+        agent = Agent(sample_role, workflow_engine)
+        agent.prepare("Test goal")
+        summary = agent.get_context_summary(stage.id)
+        
+        assert summary.stage_summary.endswith(f"{stage.name} (进行中)")
+        assert summary.current_goal == (stage.goal_template or stage.name)
+        assert not hasattr(summary, "__dict__")
+    
     def test_agent_generate_prompt(self, workflow_engine, sample_role, sample_stage):
         """Test generating prompt."""
         agent = Agent(sample_role, workflow_engine)
@@ -120,6 +157,18 @@ class TestAgent:
         assert sample_stage.name in prompt
         assert "Test goal" in prompt
     
+    def test_agent_generate_prompt_reuses_static_sections(self, workflow_engine, sample_role, sample_stage):
+        """Test repeated prompts for the same role, stage and goal reuse cached text."""
+        from work_by_roles.core.agent import _build_prompt_sections
+        agent = Agent(sample_role, workflow_engine)
+        agent.prepare("Cached goal")
+        
+        first = agent.generate_prompt(sample_stage)
+        hits = _build_prompt_sections.cache_info().hits
+        
+        assert agent.generate_prompt(sample_stage) == first
+        assert _build_prompt_sections.cache_info().hits == hits + 1
+    
     def test_agent_send_message(self, workflow_engine, sample_role, message_bus):
         """Test sending a message."""
         agent = Agent(sample_role, workflow_engine, message_bus=message_bus)
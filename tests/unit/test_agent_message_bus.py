@@ -61,6 +61,25 @@ class TestAgentMessageBus:
         # Messages should still be there
         assert len(message_bus.messages.get("agent2", [])) == 1
     
+    def test_peek_returns_snapshot(self, message_bus):
+        """Test that peeked messages are a copy of the agent's queue."""
+        message_bus.publish("agent1", "agent2", "request", {"msg": "1"})
+        
+        messages = message_bus.peek_messages("agent2")
+        message_bus.publish("agent1", "agent2", "request", {"msg": "2"})
+        
+        assert len(messages) == 1
+        assert message_bus.get_message_count("agent2") == 2
+    
+    def test_subscribed_agent_still_receives_broadcasts(self, message_bus):
+        """Test that draining a queue keeps the agent registered."""
+        message_bus.publish("agent1", "agent2", "request", {})
+        message_bus.subscribe("agent2")
+        
+        message_bus.broadcast("agent1", "notification", {"broadcast": True})
+        
+        assert message_bus.get_message_count("agent2") == 1
+    
     def test_broadcast_message(self, message_bus):
         """Test broadcasting messages to all agents."""
         # Create some agents by publishing to them first
@@ -158,4 +177,119 @@ class TestAgentMessageBus:
                 broadcast_found = True
                 break
         assert broadcast_found
-
+    
+    def test_broadcast_shares_one_message(self, message_bus):
+        """Test broadcast delivers a single shared message instance."""
+        message_bus.publish("agent1", "agent2", "notification", {})
+        message_bus.publish("agent1", "agent3", "notification", {})
+        
+        [message_id] = message_bus.broadcast("agent1", "notification", {"test": True})
+        
+        latest = [message_bus.peek_messages(agent)[-1] for agent in ("agent2", "agent3")]
+        assert latest[0] is latest[1]
+        assert latest[0].message_id == message_id
+        assert message_bus.peek_messages("agent1") == []
+    
+    def test_messages_dir_created_on_first_persist(self, temp_workspace):
+        """Persistent bus only creates its directory once a message is written."""
+        messages_dir = temp_workspace / ".workflow" / "messages"
+        bus = AgentMessageBus(persist_messages=True, messages_dir=messages_dir)
+        
+        assert not messages_dir.exists()
+        
+        bus.publish("agent1", "agent2", "request", {"question": "test"})
+        bus.flush()
+        
+        assert messages_dir.exists()
+        log_lines = (messages_dir / AgentMessageBus.LOG_FILENAME).read_text(encoding="utf-8").splitlines()
+        assert len(log_lines) == 1
+    
+    def test_persisted_messages_are_batched(self, temp_workspace):
+        """Publishes are buffered and appended to the log one batch at a time."""
+        messages_dir = temp_workspace / ".workflow" / "messages"
+        bus = AgentMessageBus(persist_messages=True, messages_dir=messages_dir)
+        bus.FLUSH_BATCH_SIZE = 3
+        bus.FLUSH_INTERVAL = 60.0
+        log_file = messages_dir / AgentMessageBus.LOG_FILENAME
+        
+        bus.publish("agent1", "agent2", "request", {"n": 1})
+        bus.publish("agent1", "agent2", "request", {"n": 2})
+        assert not log_file.exists()
+        
+        bus.publish("agent1", "agent3", "request", {"n": 3})
+        assert len(log_file.read_text(encoding="utf-8").splitlines()) == 3
+        
+        bus.publish("agent1", "agent2", "request", {"n": 4})
+        loaded = bus.load_persisted_messages("agent2")
+        assert [m.content["n"] for m in loaded] == [1, 2, 4]
+    
+    def test_persisted_log_round_trips_unicode(self, temp_workspace):
+        """Non-ASCII content is written unescaped and read back intact."""
+        messages_dir = temp_workspace / ".workflow" / "messages"
+        bus = AgentMessageBus(persist_messages=True, messages_dir=messages_dir)
+        
+        bus.publish("agent1", "agent2", "request", {"question": "实现用户登录", "ids": {1: "一"}})
+        bus.flush()
+        
+        assert "实现用户登录" in (messages_dir / AgentMessageBus.LOG_FILENAME).read_text(encoding="utf-8")
+        [loaded] = bus.load_persisted_messages("agent2")
+        assert loaded.content == {"question": "实现用户登录", "ids": {"1": "一"}}
+    
+    def test_messages_dir_recreated_after_removal(self, temp_workspace):
+        """Persistent bus recreates its directory if it disappears between flushes."""
+        import shutil
+        messages_dir = temp_workspace / ".workflow" / "messages"
+        bus = AgentMessageBus(persist_messages=True, messages_dir=messages_dir)
+        
+        bus.publish("agent1", "agent2", "request", {"n": 1})
+        bus.flush()
+        shutil.rmtree(messages_dir)
+        
+        bus.publish("agent1", "agent2", "request", {"n": 2})
+        bus.flush()
+        
+        assert [m.content["n"] for m in bus.load_persisted_messages("agent2")] == [2]
+    
+    def test_loaded_message_fields_are_interned(self, temp_workspace):
+        """Messages read back from the log share one str per agent ID and type."""
+        messages_dir = temp_workspace / ".workflow" / "messages"
+        bus = AgentMessageBus(persist_messages=True, messages_dir=messages_dir)
+        
+        bus.publish("agent1", "agent2", "request", {"n": 1})
+        bus.publish("agent1", "agent2", "request", {"n": 2})
+        
+        first, second = bus.load_persisted_messages("agent2")
+        assert first.from_agent is second.from_agent
+        assert first.to_agent is second.to_agent
+        assert first.message_type is second.message_type
+    
+    def test_concurrent_publish_and_subscribe_loses_nothing(self, temp_workspace):
+        """Messages published from many threads are each delivered and persisted once."""
+        import threading
+        messages_dir = temp_workspace / ".workflow" / "messages"
+        bus = AgentMessageBus(persist_messages=True, messages_dir=messages_dir)
+        senders, per_sender = 4, 200
+        received = []
+        done = threading.Event()
+        
+        def send(sender):
+            for n in range(per_sender):
+                bus.publish(f"agent{sender}", "reader", "request", {"n": n})
+        
+        def read():
+            while not done.is_set():
+                received.extend(bus.subscribe("reader"))
+            received.extend(bus.subscribe("reader"))
+        
+        reader = threading.Thread(target=read)
+        reader.start()
+        threads = [threading.Thread(target=send, args=(i,)) for i in range(senders)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        done.set()
+        reader.join()
+        
+        assert len(received) == senders * per_sender
+        assert len(bus.load_persisted_messages("reader")) == senders * per_sender
@@ -243,3 +243,84 @@ class TestAgentOrchestrator:
         assert "log" in summary
         assert summary["total_stages_executed"] > 0
 
+    
+    def test_auto_workflows_run_concurrently(self, workflow_engine, sample_workflow_config, monkeypatch):
+        """Test auto-triggered skill workflows of a stage run in parallel, in order."""
+        import threading
+        from types import SimpleNamespace
+        from work_by_roles.core.skill_workflow_executor import SkillWorkflowExecutor
+        
+        workflow_engine.load_all_configs(
+            skill_file=sample_workflow_config["workflow_dir"] / "skills",
+            roles_file=sample_workflow_config["workflow_dir"] / "role_schema.yaml",
+            workflow_file=sample_workflow_config["workflow_dir"] / "workflow_schema.yaml"
+        )
+        workflow_engine.auto_checkpoint = False
+        orchestrator = AgentOrchestrator(workflow_engine, immersive_display=False)
+        
+        workflows = [SimpleNamespace(id="wf_a"), SimpleNamespace(id="wf_b")]
+        monkeypatch.setattr(workflow_engine.role_manager, "get_workflows_for_stage", lambda stage_id: workflows)
+        
+        # Both runs must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        
+        def fake_execute(self, workflow_id, inputs, stage_id=None, role_id=None):
+            barrier.wait()
+            return SimpleNamespace(status="completed", outputs={}, errors=[])
+        
+        monkeypatch.setattr(SkillWorkflowExecutor, "execute_workflow", fake_execute)
+        
+        result = orchestrator.execute_stage_with_workflows("test_stage", immersive=False)
+        
+        assert [wf["workflow_id"] for wf in result["skill_workflows"]] == ["wf_a", "wf_b"]
+        assert all(wf["status"] == "completed" for wf in result["skill_workflows"])
+    
+    def test_stage_lookup_follows_config_reload(self, workflow_engine, sample_workflow_config):
+        """Test the cached stage index is rebuilt when the workflow changes."""
+        orchestrator = AgentOrchestrator(workflow_engine, immersive_display=False)
+        assert orchestrator._get_stage("test_stage") is None
+        
+        workflow_engine.load_all_configs(
+            skill_file=sample_workflow_config["workflow_dir"] / "skills",
+            roles_file=sample_workflow_config["workflow_dir"] / "role_schema.yaml",
+            workflow_file=sample_workflow_config["workflow_dir"] / "workflow_schema.yaml"
+        )
+        stage = orchestrator._get_stage("test_stage")
+        assert stage is workflow_engine.executor._get_stage_by_id("test_stage")
+        
+        workflow_engine.executor.workflow.stages.remove(stage)
+        assert orchestrator._get_stage("test_stage") is None
+    
+    def test_execute_parallel_stages_sync_overlaps_independent_stages(self, workflow_engine, sample_workflow_config, monkeypatch):
+        """Test independent stages run concurrently and dependents wait for them."""
+        import threading
+        from types import SimpleNamespace
+        
+        workflow_engine.load_all_configs(
+            skill_file=sample_workflow_config["workflow_dir"] / "skills",
+            roles_file=sample_workflow_config["workflow_dir"] / "role_schema.yaml",
+            workflow_file=sample_workflow_config["workflow_dir"] / "workflow_schema.yaml"
+        )
+        orchestrator = AgentOrchestrator(workflow_engine, immersive_display=False)
+        
+        prerequisites = {"a": [], "b": [], "c": ["a", "b"]}
+        monkeypatch.setattr(orchestrator, "_get_stage", lambda stage_id: SimpleNamespace(prerequisites=prerequisites[stage_id]))
+        
+        # "a" and "b" must be in flight at once to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+        finished = []
+        
+        def fake_execute(stage_id, inputs=None, use_llm=False):
+            if stage_id != "c":
+                barrier.wait()
+            seen = sorted(finished)
+            finished.append(stage_id)
+            return {"stage": stage_id, "seen": seen}
+        
+        monkeypatch.setattr(orchestrator, "execute_stage", fake_execute)
+        
+        results = orchestrator.execute_parallel_stages_sync(["a", "b", "c"])
+        
+        assert set(results) == {"a", "b", "c"}
+        assert all("error" not in r for r in results.values())
+        assert results["c"]["seen"] == ["a", "b"]
@@ -56,3 +56,53 @@ class TestConditionEvaluator:
         
         assert result is True
 
+    
+    def test_compiled_condition_reused_with_new_values(self):
+        """Test a condition is compiled once but sees each evaluator's values."""
+        from work_by_roles.core.condition_evaluator import _parse_condition
+        
+        condition = "{{step.step1.result.status}} == 'success' and {{inputs.retries}} < 3"
+        _parse_condition.cache_clear()
+        
+        assert ConditionEvaluator({"step1": {"result": {"status": "success"}}}, {"retries": 1}).evaluate(condition) is True
+        assert ConditionEvaluator({"step1": {"result": {"status": "success"}}}, {"retries": 5}).evaluate(condition) is False
+        assert ConditionEvaluator({}, {"retries": 1}).evaluate(condition) is False
+        
+        assert _parse_condition.cache_info().misses == 1
+    
+    def test_resolve_variables_renders_literals(self):
+        """Test template resolution still produces Python literals."""
+        evaluator = ConditionEvaluator({"step1": {"result": {"name": "a'b", "ok": True}}}, {"n": 2})
+        
+        resolved = evaluator._resolve_variables("{{step.step1.result.name}} {{step.step1.result.ok}} {{inputs.n}} {{inputs.missing}}")
+        
+        assert resolved == "\"a'b\" True 2 None"
+    
+    def test_evaluate_rejects_unsupported_expressions(self):
+        """Test conditions outside the supported grammar evaluate to False."""
+        evaluator = ConditionEvaluator({}, {"name": "x"})
+        
+        with pytest.warns(UserWarning):
+            assert evaluator.evaluate("__import__('os').getcwd()") is False
+        with pytest.warns(UserWarning):
+            assert evaluator.evaluate("{{inputs.name}}.upper() == 'X'") is False
+    
+    def test_evaluate_supported_operators(self):
+        """Test chained comparisons, membership, builtins and short-circuiting."""
+        evaluator = ConditionEvaluator({"step1": {"result": {"items": [1, 2, 3]}}}, {"env": "prod"})
+        
+        assert evaluator.evaluate("0 < len({{step.step1.result.items}}) <= 3") is True
+        assert evaluator.evaluate("{{inputs.env}} in ('prod', 'staging') and not {{inputs.env}} == 'dev'") is True
+        assert evaluator.evaluate("{{step.step1.result.items}}[-1] * 2 == 6") is True
+        assert evaluator.evaluate("{{inputs.missing}} is None or 1 / 0") is True
+    
+    def test_evaluate_dict_set_and_conditional_expressions(self):
+        """Test dict and set literals and x if c else y evaluate as with eval."""
+        evaluator = ConditionEvaluator({"s": {"meta": {"k": "v"}}}, {"env": "prod", "extra": {"n": 1}})
+        
+        assert evaluator.evaluate('{{step.s.meta}} == {"k": "v"}') is True
+        assert evaluator.evaluate('{**{{inputs.extra}}, "m": 2} == {"n": 1, "m": 2}') is True
+        assert evaluator.evaluate("{{inputs.env}} in {'prod', 'staging'}") is True
+        assert evaluator.evaluate("(1 if {{inputs.env}} == 'prod' else 0) == 1") is True
+        with pytest.warns(UserWarning):
+            assert evaluator.evaluate("(1 if {{inputs.env}} == 'dev' else 1 / 0) == 1") is False
@@ -0,0 +1,111 @@
+"""
+Unit tests for ConfigLoader schema caching.
+"""
+import os
+import pytest
+import yaml
+from unittest.mock import patch
+
+from work_by_roles.core import config_loader
+from work_by_roles.core.config_loader import ConfigLoader
+from work_by_roles.core.exceptions import ValidationError
+from work_by_roles.core.schema_loader import SchemaLoader
+
+
+class TestConfigLoaderCache:
+    """Test that parsed schemas are shared across loader instances."""
+    
+    def test_schema_parsed_once_across_loaders(self, sample_workflow_config):
+        """Two loaders reading the same unchanged file parse it only once."""
+        roles_file = sample_workflow_config["workflow_dir"] / "role_schema.yaml"
+        config_loader.clear_schema_cache()
+        
+        with patch.object(SchemaLoader, "load_schema", wraps=SchemaLoader.load_schema) as load_schema:
+            first = ConfigLoader(sample_workflow_config["workspace"])._load_cached(roles_file)
+            second = ConfigLoader(sample_workflow_config["workspace"])._load_cached(roles_file)
+        
+        assert load_schema.call_count == 1
+        assert first == second
+        # Each loader gets its own copy
+        assert first is not second
+    
+    def test_modified_schema_is_reloaded(self, sample_workflow_config):
+        """Changing the file invalidates the shared cache entry."""
+        roles_file = sample_workflow_config["workflow_dir"] / "role_schema.yaml"
+        ConfigLoader(sample_workflow_config["workspace"])._load_cached(roles_file)
+        
+        role_schema = sample_workflow_config["role_schema"]
+        role_schema["roles"][0]["name"] = "Renamed Role With Longer Name"
+        with open(roles_file, "w") as f:
+            yaml.dump(role_schema, f)
+        
+        data = ConfigLoader(sample_workflow_config["workspace"])._load_cached(roles_file)
+        assert data["roles"][0]["name"] == "Renamed Role With Longer Name"
+    
+    def test_cached_copy_mutation_does_not_leak(self, sample_workflow_config):
+        """Mutating a returned schema does not affect other loaders."""
+        roles_file = sample_workflow_config["workflow_dir"] / "role_schema.yaml"
+        data = ConfigLoader(sample_workflow_config["workspace"])._load_cached(roles_file)
+        data["roles"].clear()
+        
+        fresh = ConfigLoader(sample_workflow_config["workspace"])._load_cached(roles_file)
+        assert len(fresh["roles"]) == 1
+    
+    def test_skill_parsed_once_across_loaders(self, sample_workflow_config):
+        """Skill.md files are parsed once and handed out as independent copies."""
+        skills_dir = sample_workflow_config["workflow_dir"] / "skills"
+        config_loader.clear_schema_cache()
+        
+        with patch.object(ConfigLoader, "_parse_anthropic_skill", wraps=ConfigLoader._parse_anthropic_skill) as parse:
+            first = ConfigLoader(sample_workflow_config["workspace"])._load_skill_directory(skills_dir)
+            second = ConfigLoader(sample_workflow_config["workspace"])._load_skill_directory(skills_dir)
+        
+        assert parse.call_count == len(first["skills"])
+        assert first == second
+        assert first["skills"][0] is not second["skills"][0]
+    
+    def test_load_all_reports_errors_in_dependency_order(self, sample_workflow_config):
+        """load_all reports errors for missing schemas in load order."""
+        workflow_dir = sample_workflow_config["workflow_dir"]
+        loader = ConfigLoader(sample_workflow_config["workspace"])
+        
+        with pytest.raises(ValidationError) as exc_info:
+            loader.load_all(
+                skill_file=workflow_dir / "skills",
+                roles_file=workflow_dir / "missing_roles.yaml",
+                workflow_file=workflow_dir / "missing_workflow.yaml",
+            )
+        
+        message = str(exc_info.value)
+        assert message.index("missing_roles.yaml") < message.index("missing_workflow.yaml")
+    
+    def test_load_all_returns_parsed_schemas(self, sample_workflow_config):
+        """load_all returns the same data as loading each schema directly."""
+        workflow_dir = sample_workflow_config["workflow_dir"]
+        loader = ConfigLoader(sample_workflow_config["workspace"])
+        
+        skill_data, roles_data, workflow_data, context = loader.load_all(
+            skill_file=workflow_dir / "skills",
+            roles_file=workflow_dir / "role_schema.yaml",
+            workflow_file=workflow_dir / "workflow_schema.yaml",
+        )
+        
+        assert [s["id"] for s in skill_data["skills"]] == ["test_skill"]
+        assert roles_data == loader._load_cached(workflow_dir / "role_schema.yaml")
+        assert workflow_data == loader._load_cached(workflow_dir / "workflow_schema.yaml")
+        assert context is None
+    
+    def test_same_loader_sees_rewrite_with_unchanged_mtime(self, sample_workflow_config):
+        """A rewrite that keeps the mtime but changes the size is picked up."""
+        roles_file = sample_workflow_config["workflow_dir"] / "role_schema.yaml"
+        loader = ConfigLoader(sample_workflow_config["workspace"])
+        loader._load_cached(roles_file)
+        stat = roles_file.stat()
+        
+        role_schema = sample_workflow_config["role_schema"]
+        role_schema["roles"][0]["name"] = "Renamed Role With Longer Name"
+        with open(roles_file, "w") as f:
+            yaml.dump(role_schema, f)
+        os.utime(roles_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        assert loader._load_cached(roles_file)["roles"][0]["name"] == "Renamed Role With Longer Name"
@@ -72,3 +72,18 @@ def test_serialization():
     assert dm2.context.original_goal == "Goal"
     assert len(dm2.pending_questions) == 1
     assert dm2.pending_questions[0].question == "Q"
+
+def test_serialization_reuses_unchanged_turns():
+    dm = DialogManager(session_id="session_123")
+    dm.add_user_turn("Goal")
+    first = dm.to_dict()
+    
+    dm.add_system_turn("Reply")
+    second = dm.to_dict()
+    assert [t["content"] for t in second["history"]] == ["Goal", "Reply"]
+    assert second["history"][0] is first["history"][0]
+    assert len(first["history"]) == 1
+    
+    dm.clear()
+    dm.add_user_turn("New goal")
+    assert [t["content"] for t in dm.to_dict()["history"]] == ["New goal"]
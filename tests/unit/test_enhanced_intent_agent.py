@@ -23,6 +23,21 @@ def test_detect_ambiguities(mock_engine):
     assert AmbiguityType.UNCLEAR_REQUIREMENTS in amb_types
     assert AmbiguityType.MISSING_SCOPE in amb_types
 
+def test_detect_ambiguities_overlapping_keywords(mock_engine):
+    agent = IntentAgent(mock_engine)
+    intent_result = {"intent_type": IntentType.FEATURE_REQUEST, "confidence": 0.9}
+    
+    # "更新" is a modification word that also contains "新", which counts as
+    # saying the work is new, so no missing-context question is raised
+    amb_types = [a[0] for a in agent.detect_ambiguities("更新登录页面", intent_result)]
+    assert AmbiguityType.MISSING_CONTEXT not in amb_types
+    
+    amb_types = [a[0] for a in agent.detect_ambiguities("修改登录页面", intent_result)]
+    assert AmbiguityType.MISSING_CONTEXT in amb_types
+    
+    amb_types = [a[0] for a in agent.detect_ambiguities("给接口加上 Redis 缓存", intent_result)]
+    assert AmbiguityType.TECHNICAL_AMBIGUITY not in amb_types
+
 def test_generate_clarification_questions(mock_engine):
     agent = IntentAgent(mock_engine)
     ambiguities = [(AmbiguityType.MISSING_SCOPE, "Missing scope")]
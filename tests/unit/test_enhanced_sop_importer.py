@@ -23,6 +23,14 @@ def test_infer_industry():
     devops_sop = "The pipeline deploys to kubernetes."
     assert importer._infer_industry(devops_sop) == "devops"
 
+def test_infer_industry_counts_distinct_keywords():
+    importer = SOPImporter()
+    
+    # Repeating one keyword doesn't outweigh two different ones
+    sop = "Sprint, SPRINT, sprint planning. The pipeline deploys to Kubernetes."
+    assert importer._infer_industry(sop) == "devops"
+    assert importer._infer_industry("nothing relevant") == "general"
+
 def test_infer_document_type():
     importer = SOPImporter()
     
@@ -35,6 +35,19 @@ class TestExecutionTracker:
         assert len(tracker.executions) == 1
         assert tracker.executions[0] == execution
     
+    def test_execution_record_is_slotted(self):
+        """Test SkillExecution stores its fields in slots."""
+        execution = SkillExecution(
+            skill_id="test_skill",
+            input={},
+            output=None,
+            status="success"
+        )
+        
+        assert not hasattr(execution, "__dict__")
+        with pytest.raises(AttributeError):
+            execution.extra = "value"
+    
     def test_get_success_rate(self):
         """Test getting success rate."""
         tracker = ExecutionTracker()
@@ -100,3 +113,62 @@ class TestExecutionTracker:
         count = tracker.get_total_executions("test_skill")
         assert count == 5
 
+    
+    def test_concurrent_records_keep_every_execution(self):
+        """Test executions recorded from several threads are all counted."""
+        import threading
+        tracker = ExecutionTracker()
+        threads_count, per_thread = 4, 500
+        
+        def record():
+            for _ in range(per_thread):
+                tracker.record_execution(SkillExecution(
+                    skill_id="shared_skill",
+                    input={},
+                    output={},
+                    status="success",
+                    execution_time=1.0
+                ))
+        
+        threads = [threading.Thread(target=record) for _ in range(threads_count)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        total = threads_count * per_thread
+        assert tracker.get_total_executions("shared_skill") == total
+        assert tracker.get_statistics()["skills"]["shared_skill"]["total_executions"] == total
+        assert tracker.get_success_rate("shared_skill") == 1.0
+    
+    def test_get_statistics_per_skill(self):
+        """Test per-skill statistics across interleaved executions."""
+        tracker = ExecutionTracker()
+        
+        for skill_id, status, seconds, retries in [
+            ("skill_a", "success", 1.0, 0),
+            ("skill_b", "failed", 4.0, 0),
+            ("skill_a", "retried", 3.0, 1),
+            ("skill_b", "success", 2.0, 2),
+        ]:
+            tracker.record_execution(SkillExecution(
+                skill_id=skill_id,
+                input={},
+                output={},
+                status=status,
+                execution_time=seconds,
+                retry_count=retries
+            ))
+        
+        stats = tracker.get_statistics()
+        
+        assert stats["total_executions"] == 4
+        assert stats["unique_skills"] == 2
+        assert stats["skills"]["skill_a"] == {
+            "total_executions": 2,
+            "success_rate": 0.5,
+            "avg_execution_time": 2.0,
+            "total_retries": 1,
+        }
+        assert [e.status for e in tracker.get_skill_history("skill_b")] == ["failed", "success"]
+        assert tracker.get_total_executions("missing") == 0
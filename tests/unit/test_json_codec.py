@@ -0,0 +1,30 @@
+"""
+Unit tests for json_codec.
+"""
+import json
+
+import pytest
+
+from work_by_roles.core import json_codec
+
+
+SAMPLE = {"workflow_id": "wf", "name": "需求分析", "stages": [{"progress": 0.5, "done": False}], "extra": None}
+
+
+class TestJsonCodec:
+    """Test json_codec encode/decode helpers."""
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_dumps_matches_stdlib(self, monkeypatch, use_orjson):
+        """Test both backends produce the same bytes as json.dumps."""
+        if use_orjson and not json_codec.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+        monkeypatch.setattr(json_codec, "HAS_ORJSON", use_orjson)
+        
+        expected = json.dumps(SAMPLE, indent=2, ensure_ascii=False).encode("utf-8")
+        assert json_codec.dumps(SAMPLE, indent=True) == expected
+        assert json_codec.loads(json_codec.dumps(SAMPLE)) == SAMPLE
+    
+    def test_dumps_falls_back_for_non_str_keys(self):
+        """Test payloads orjson rejects are still serialized."""
+        assert json_codec.loads(json_codec.dumps({1: "a"})) == {"1": "a"}
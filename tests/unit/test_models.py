@@ -48,6 +48,37 @@ class TestAgentMessage:
         
         assert message1.message_id != message2.message_id
     
+    def test_agent_message_ids_unique_for_same_timestamp(self):
+        """Test messages created at the same instant still get distinct IDs."""
+        timestamp = datetime.now()
+        ids = {
+            AgentMessage(
+                from_agent="agent1",
+                to_agent="agent2",
+                message_type="request",
+                content={},
+                timestamp=timestamp
+            ).message_id
+            for _ in range(100)
+        }
+        
+        assert len(ids) == 100
+        assert all(message_id.startswith("agent1_agent2_") for message_id in ids)
+    
+    def test_agent_message_is_slotted(self):
+        """Test AgentMessage stores its fields in slots."""
+        message = AgentMessage(
+            from_agent="agent1",
+            to_agent="agent2",
+            message_type="request",
+            content={}
+        )
+        
+        assert not hasattr(message, "__dict__")
+        assert AgentMessage.from_dict(message.to_dict()) == message
+        with pytest.raises(AttributeError):
+            message.extra = "value"
+    
     def test_agent_message_serialization(self):
         """Test message serialization."""
         message = AgentMessage(
@@ -116,6 +147,14 @@ class TestTask:
         
         assert task.dependencies == ["task1"]
     
+    def test_task_is_slotted(self):
+        """Test Task stores its fields in slots."""
+        task = Task(id="task1", description="Test task", category="general")
+        
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.extra = "value"
+    
     def test_task_status_transition(self):
         """Test task status transitions."""
         task = Task(
@@ -238,6 +277,63 @@ class TestTaskDecomposition:
         errors = decomposition.validate()
         assert len(errors) > 0
         assert any("circular" in error.lower() for error in errors)
+    
+    def test_get_task_tracks_appended_tasks(self):
+        """Test get_task finds tasks added after the first lookup."""
+        decomposition = TaskDecomposition(
+            tasks=[Task(id="task1", description="Task 1", category="general", assigned_role="role1")],
+            execution_order=["task1"],
+            dependencies={}
+        )
+        
+        assert decomposition.get_task("task2") is None
+        task2 = Task(id="task2", description="Task 2", category="general", assigned_role="role2")
+        decomposition.tasks.append(task2)
+        assert decomposition.get_task("task2") is task2
+        
+        decomposition.tasks.clear()
+        assert decomposition.get_task("task1") is None
+    
+    def test_get_task_tracks_replaced_tasks(self):
+        """Test get_task follows a reassigned task list and in-place replacements."""
+        task1 = Task(id="task1", description="Task 1", category="general", assigned_role="role1")
+        decomposition = TaskDecomposition(
+            tasks=[task1],
+            execution_order=["task1"],
+            dependencies={}
+        )
+        assert decomposition.get_task("task1") is task1
+        
+        task2 = Task(id="task2", description="Task 2", category="general", assigned_role="role2")
+        decomposition.tasks = [task2]
+        assert decomposition.get_task("task2") is task2
+        assert decomposition.get_task("task1") is None
+        
+        task3 = Task(id="task3", description="Task 3", category="general", assigned_role="role3")
+        decomposition.tasks[0] = task3
+        assert decomposition.get_task("task3") is task3
+        assert decomposition.get_task("task2") is None
+        
+        replacement = Task(id="task3", description="Task 3 again", category="general", assigned_role="role3")
+        decomposition.tasks.pop()
+        decomposition.tasks.append(replacement)
+        assert decomposition.get_task("task3") is replacement
+    
+    def test_validate_deep_dependency_chain(self):
+        """Test validation handles long dependency chains without recursion."""
+        tasks = [
+            Task(id=f"task{i}", description=f"Task {i}", category="general", assigned_role="role1",
+                 dependencies=[f"task{i - 1}"] if i else [])
+            for i in range(5000)
+        ]
+        
+        decomposition = TaskDecomposition(
+            tasks=tasks,
+            execution_order=[t.id for t in tasks],
+            dependencies={t.id: t.dependencies for t in tasks if t.dependencies}
+        )
+        
+        assert decomposition.validate() == []
 
 
 class TestAgentContext:
@@ -39,3 +39,22 @@ class TestQualityGateSystem:
         # The actual validation happens through validate_stage method
         assert system.role_manager == role_manager
 
+
+
+class TestTestValidator:
+    """Test the pytest-backed functionality gate."""
+    
+    def test_runs_pytest_without_cache_plugins(self, temp_workspace):
+        """The gate's inner pytest run skips cacheprovider and stepwise."""
+        from unittest.mock import patch, MagicMock
+        from work_by_roles.validators.implementations import TestValidator
+        
+        with patch("work_by_roles.validators.implementations.subprocess.run") as run:
+            run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            passed, errors = TestValidator().validate(None, None, temp_workspace)
+        
+        assert passed and errors == []
+        cmd = run.call_args[0][0]
+        assert cmd[0] == "pytest" and cmd[-1] == "."
+        assert "no:cacheprovider" in cmd
+        assert "no:stepwise" in cmd
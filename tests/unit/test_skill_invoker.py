@@ -0,0 +1,47 @@
+"""
+Unit tests for skill invokers.
+"""
+import threading
+import time
+
+from work_by_roles.core.models import Skill
+from work_by_roles.core.skill_invoker import LLMSkillInvoker
+
+
+class TestLLMSkillInvoker:
+    """Test LLMSkillInvoker."""
+    
+    def test_concurrent_streams_do_not_interleave(self):
+        """Test invocations from several threads stream through the handler one at a time."""
+        active = []
+        overlaps = []
+        
+        class Client:
+            def stream(self, prompt):
+                return iter(["chunk"])
+        
+        class Handler:
+            def handle_stream(self, stream):
+                active.append(1)
+                if len(active) > 1:
+                    overlaps.append(len(active))
+                time.sleep(0.01)
+                active.pop()
+                return "".join(stream)
+        
+        invoker = LLMSkillInvoker(Client(), stream_handler=Handler())
+        skill = Skill(id="s", name="S", description="d", category="test")
+        results = []
+        
+        def invoke():
+            results.append(invoker.invoke(skill, {}))
+        
+        threads = [threading.Thread(target=invoke) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        
+        assert overlaps == []
+        assert len(results) == 4
+        assert all(r["success"] for r in results)
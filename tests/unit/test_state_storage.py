@@ -49,3 +49,17 @@ class TestStateStorage:
         
         assert loaded is None
 
+    
+    def test_file_storage_writes_plain_yaml(self, temp_workspace):
+        """Test that saved state stays plain, human-readable YAML."""
+        storage = FileStateStorage()
+        state_file = temp_workspace / ".workflow" / "state.yaml"
+        
+        state = ExecutionState()
+        state.current_stage = "需求分析"
+        state.stage_status = {"需求分析": StageStatus.IN_PROGRESS}
+        storage.save(state, state_file)
+        
+        content = state_file.read_text(encoding="utf-8")
+        assert "需求分析" in content
+        assert yaml.safe_load(content)["stage_status"] == {"需求分析": "in_progress"}
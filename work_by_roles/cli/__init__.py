@@ -6,9 +6,9 @@ import sys
 from .parser import setup_parser
 
 
-def main():
+def main(argv=None):
     parser = setup_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
@@ -9,7 +9,17 @@ from typing import Tuple, Optional, Any
 from ..core.engine import WorkflowEngine, TeamManager
 
 def _init_engine(args) -> Tuple[WorkflowEngine, Path, Path]:
-    """Initialize engine with skill library, supporting team context"""
+    """
+    Initialize engine with skill library, supporting team context.
+    
+    If args carries a ``preloaded_engine`` (the (engine, workflow_file,
+    state_file) tuple this function returns), it is used as-is, so callers
+    running several commands can load the configuration once.
+    """
+    preloaded = getattr(args, 'preloaded_engine', None)
+    if preloaded is not None:
+        return preloaded
+    
     workspace = Path(args.workspace or ".")
     workflow_dir = workspace / ".workflow"
     workflow_dir.mkdir(exist_ok=True)
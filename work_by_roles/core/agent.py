@@ -3,15 +3,145 @@ Agent for executing role-specific tasks.
 Following Single Responsibility Principle - handles agent execution only.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Tuple
+from functools import lru_cache
 from pathlib import Path
-import uuid
+import itertools
+import os
 
 from .exceptions import WorkflowError
 from .models import Role, Stage, ContextSummary, AgentContext
 from .workflow_engine import WorkflowEngine
 from .skill_selector import SkillSelector
 
+# Agent IDs are "<role>_<process nonce><counter>": one urandom read per process
+# instead of a uuid4 per agent, and still distinct across runs and forks
+_agent_id_nonce = os.urandom(4).hex()
+_agent_id_counter = itertools.count()
+
+
+def _reset_agent_ids() -> None:
+    global _agent_id_nonce, _agent_id_counter
+    _agent_id_nonce = os.urandom(4).hex()
+    _agent_id_counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_agent_ids)
+
+
+def _new_agent_id(role_id: str) -> str:
+    return f"{role_id}_{_agent_id_nonce}{next(_agent_id_counter):04x}"
+
+
+# Output directories already created in this process (skips a mkdir per output)
+_output_dirs: Set[str] = set()
+
+
+def _write_output_file(path: str, content: str) -> None:
+    """
+    Write an output file with a single open and write of the encoded text.
+    
+    Equivalent to path.write_text(content, encoding='utf-8') (including
+    newline translation), without building a text-mode file object per output.
+    Takes a str path so no Path objects are created here.
+    """
+    if os.linesep != "\n":
+        content = content.replace("\n", os.linesep)
+    data = memoryview(content.encode('utf-8'))
+    
+    parent = os.path.dirname(path)
+    if parent not in _output_dirs:
+        os.makedirs(parent, exist_ok=True)
+        _output_dirs.add(parent)
+    
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(path, flags, 0o666)
+    except FileNotFoundError:
+        # Directory removed since it was cached
+        os.makedirs(parent, exist_ok=True)
+        fd = os.open(path, flags, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=512)
+def _build_prompt_sections(
+    role_name: str,
+    role_description: str,
+    allowed: Tuple[str, ...],
+    forbidden: Tuple[str, ...],
+    instruction_template: Optional[str],
+    stage_id: str,
+    stage_name: str,
+    goal_text: str,
+    outputs: Tuple[Tuple[str, str, str], ...]
+) -> Tuple[str, str]:
+    """
+    Build the static parts of an agent prompt: the text before and after the
+    workflow context summary.
+    
+    Everything here is a pure function of its arguments, so retries and loops
+    that re-prompt the same role for the same stage and goal reuse the text.
+    
+    Args:
+        outputs: (name, type, path relative to the workspace) per stage output
+    """
+    # 1. Base Identity
+    head = [f"You are acting as a {role_name}."]
+    head.append(f"Description: {role_description}\n")
+    
+    # 2. Constraints
+    if allowed:
+        head.append("ALLOWED ACTIONS: " + ", ".join(allowed))
+    if forbidden:
+        head.append("FORBIDDEN ACTIONS: " + ", ".join(forbidden))
+    head.append("")
+    
+    # 4. Stage Goal
+    tail = [f"CURRENT STAGE: {stage_name}"]
+    tail.append(f"GOAL: {goal_text}\n")
+    
+    # 5. Expected Outputs
+    if outputs:
+        tail.append("REQUIRED OUTPUTS:")
+        for name, output_type, relative_path in outputs:
+            tail.append(f"- {name} ({output_type}) -> {relative_path}")
+        tail.append("")
+        tail.append("CRITICAL: File Output Instructions:")
+        tail.append("- ALWAYS use agent.produce_output(name, content, output_type, stage_id) for ALL file outputs")
+        tail.append("- NEVER write files directly with write() or other file tools")
+        tail.append("- NEVER write document/report files to workspace root - they will be automatically moved")
+        tail.append("- For document/report outputs: output_type='document' or 'report'")
+        tail.append("- For code/test outputs: output_type='code' or 'tests'")
+        tail.append("- document/report files automatically go to .workflow/outputs/{workflow_id}/{stage_id}/")
+        tail.append("- code/test files automatically go to workspace root")
+        tail.append("- If you write a document file directly, it will be detected and moved automatically")
+        tail.append("- Examples:")
+        for name, output_type, _ in outputs:
+            tail.append(f"  * agent.produce_output('{name}', content, '{output_type}', '{stage_id}')")
+        tail.append("")
+        
+    # 6. Role-Specific Instructions
+    if instruction_template:
+        tail.append("INSTRUCTIONS:")
+        tail.append(instruction_template)
+    
+    # 7. Reasoning Guidance (explicitly exclude skills)
+    tail.append("")
+    tail.append("REASONING GUIDANCE:")
+    tail.append("- Focus on understanding the task, clarifying goals, and making strategic decisions")
+    tail.append("- Do NOT invoke specific skills or tools during reasoning")
+    tail.append("- Skills will be selected and executed separately based on your decisions")
+    tail.append("- Use natural language reasoning and chain-of-thought")
+    
+    return "\n".join(head), "\n".join(tail)
+
+
 class Agent:
     """
     Represents a Role in action, capable of executing tasks.
@@ -36,7 +166,7 @@ class Agent:
         self.role = role
         self.engine = engine
         self.context: Optional[AgentContext] = None
-        self.agent_id = agent_id or f"{role.id}_{uuid.uuid4().hex[:8]}"
+        self.agent_id = agent_id or _new_agent_id(role.id)
         # Note: skill_selector is stored but NOT used in reasoning methods
         # It's only available for external skill selection queries, not for reasoning
         self.skill_selector = skill_selector or SkillSelector(engine)
@@ -201,9 +331,9 @@ class Agent:
                     f"Redirected to: {path.relative_to(self.engine.workspace_path)}"
                 )
         
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding='utf-8')
-        self.context.outputs[name] = str(path)
+        path_str = os.fspath(path)
+        _write_output_file(path_str, content)
+        self.context.outputs[name] = path_str
         
         if output_type in ("document", "report"):
             print(f"📄 Agent produced output: {name} -> {path.relative_to(self.engine.workspace_path)}")
@@ -238,21 +368,27 @@ class Agent:
         """
         if not self.context:
             raise ValueError("Agent not prepared. Call prepare() first.")
-            
-        # 1. Base Identity
-        prompt = [f"You are acting as a {self.role.name}."]
-        prompt.append(f"Description: {self.role.description}\n")
-        
-        # 2. Constraints
-        allowed = self.role.constraints.get('allowed_actions', [])
-        forbidden = self.role.constraints.get('forbidden_actions', [])
-        if allowed:
-            prompt.append("ALLOWED ACTIONS: " + ", ".join(allowed))
-        if forbidden:
-            prompt.append("FORBIDDEN ACTIONS: " + ", ".join(forbidden))
-        prompt.append("")
-        
-        # 3. Context Summary (lightweight)
+        
+        outputs = tuple(
+            (output.name, output.type,
+             str(self._get_output_path(output.name, output.type, stage.id).relative_to(self.engine.workspace_path)))
+            for output in stage.outputs
+        ) if stage.outputs else ()
+        head, tail = _build_prompt_sections(
+            self.role.name,
+            self.role.description,
+            tuple(self.role.constraints.get('allowed_actions', [])),
+            tuple(self.role.constraints.get('forbidden_actions', [])),
+            self.role.instruction_template,
+            stage.id,
+            stage.name,
+            stage.goal_template or self.context.goal,
+            outputs
+        )
+        
+        prompt = [head]
+        
+        # 3. Context Summary (lightweight); depends on live workflow state, so never cached
         if use_summary:
             context_summary = self.get_context_summary(stage.id)
             if context_summary.stage_summary:
@@ -260,46 +396,7 @@ class Agent:
                 prompt.append(context_summary.to_text())
                 prompt.append("")
         
-        # 4. Stage Goal
-        prompt.append(f"CURRENT STAGE: {stage.name}")
-        goal_text = stage.goal_template or self.context.goal
-        prompt.append(f"GOAL: {goal_text}\n")
-        
-        # 5. Expected Outputs
-        if stage.outputs:
-            prompt.append("REQUIRED OUTPUTS:")
-            for output in stage.outputs:
-                output_path = self._get_output_path(output.name, output.type, stage.id)
-                relative_path = output_path.relative_to(self.engine.workspace_path)
-                prompt.append(f"- {output.name} ({output.type}) -> {relative_path}")
-            prompt.append("")
-            prompt.append("CRITICAL: File Output Instructions:")
-            prompt.append("- ALWAYS use agent.produce_output(name, content, output_type, stage_id) for ALL file outputs")
-            prompt.append("- NEVER write files directly with write() or other file tools")
-            prompt.append("- NEVER write document/report files to workspace root - they will be automatically moved")
-            prompt.append("- For document/report outputs: output_type='document' or 'report'")
-            prompt.append("- For code/test outputs: output_type='code' or 'tests'")
-            prompt.append("- document/report files automatically go to .workflow/outputs/{workflow_id}/{stage_id}/")
-            prompt.append("- code/test files automatically go to workspace root")
-            prompt.append("- If you write a document file directly, it will be detected and moved automatically")
-            prompt.append("- Examples:")
-            for output in stage.outputs:
-                prompt.append(f"  * agent.produce_output('{output.name}', content, '{output.type}', '{stage.id}')")
-            prompt.append("")
-            
-        # 6. Role-Specific Instructions
-        if self.role.instruction_template:
-            prompt.append("INSTRUCTIONS:")
-            prompt.append(self.role.instruction_template)
-        
-        # 7. Reasoning Guidance (explicitly exclude skills)
-        prompt.append("")
-        prompt.append("REASONING GUIDANCE:")
-        prompt.append("- Focus on understanding the task, clarifying goals, and making strategic decisions")
-        prompt.append("- Do NOT invoke specific skills or tools during reasoning")
-        prompt.append("- Skills will be selected and executed separately based on your decisions")
-        prompt.append("- Use natural language reasoning and chain-of-thought")
-            
+        prompt.append(tail)
         return "\n".join(prompt)
     
     # ========================================================================
@@ -3,16 +3,41 @@ Agent Message Bus for inter-agent communication.
 Following Single Responsibility Principle - handles message passing only.
 """
 
-from typing import Dict, List, Optional, Any
-from collections import defaultdict
+from typing import Deque, Dict, List, Optional, Any, Tuple
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-import json
+import sys
+import threading
+import time
+import weakref
 
+from . import json_codec
 from .exceptions import WorkflowError
+from .models import new_message_id, with_slots
 
 
+def _append_lines(log_file: Path, pending: List[bytes], ensure_dir: bool = True) -> None:
+    """Append buffered JSON lines to the message log in one write."""
+    if not pending:
+        return
+    if ensure_dir:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(log_file, 'ab') as f:
+        f.write(b"".join(pending))
+    pending.clear()
+
+
+def _flush_on_finalize(log_file: Path, pending: List[bytes]) -> None:
+    """Best-effort final flush; the workspace may already be gone at exit."""
+    try:
+        _append_lines(log_file, pending)
+    except OSError:
+        pass
+
+
+@with_slots
 @dataclass
 class AgentMessage:
     """Agent 间消息"""
@@ -26,7 +51,7 @@ class AgentMessage:
     def __post_init__(self):
         """Generate message ID if not provided"""
         if not self.message_id:
-            self.message_id = f"{self.from_agent}_{self.to_agent}_{self.timestamp.timestamp()}"
+            self.message_id = new_message_id(self.from_agent, self.to_agent)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -44,9 +69,11 @@ class AgentMessage:
         """Create from dictionary"""
         return cls(
             message_id=data.get("message_id", ""),
-            from_agent=data["from_agent"],
-            to_agent=data["to_agent"],
-            message_type=data["message_type"],
+            # Agent IDs and message types repeat across a log; share one
+            # str object per distinct value
+            from_agent=sys.intern(data["from_agent"]),
+            to_agent=sys.intern(data["to_agent"]),
+            message_type=sys.intern(data["message_type"]),
             content=data["content"],
             timestamp=datetime.fromisoformat(data.get("timestamp", datetime.now().isoformat()))
         )
@@ -58,8 +85,18 @@ class AgentMessageBus:
     
     提供 agent 之间的消息传递、上下文共享和广播功能。
     支持消息持久化（可选）。
+    
+    持久化的消息先在内存中缓冲，攒满 FLUSH_BATCH_SIZE 条或距上次写入超过
+    FLUSH_INTERVAL 秒时，作为 JSON Lines 一次性追加到 messages.jsonl。
+    
+    可在多个线程间共享：每个接收方的队列有各自的锁，发往不同 agent 的消息
+    互不阻塞；广播逐个获取接收方的锁，从不同时持有两把。
     """
     
+    LOG_FILENAME = "messages.jsonl"
+    FLUSH_BATCH_SIZE = 64
+    FLUSH_INTERVAL = 0.05  # seconds
+    
     def __init__(self, persist_messages: bool = False, messages_dir: Optional[Path] = None):
         """
         Initialize Agent Message Bus.
@@ -68,13 +105,25 @@ class AgentMessageBus:
             persist_messages: If True, persist messages to disk
             messages_dir: Directory to store messages (default: .workflow/messages/)
         """
-        self.messages: Dict[str, List[AgentMessage]] = defaultdict(list)
+        # Per-recipient queues: O(1) append on publish, O(k) snapshot on peek
+        self.messages: Dict[str, Deque[AgentMessage]] = defaultdict(deque)
+        # One lock per recipient queue; _registry_lock guards adding queues/locks
+        self._locks: Dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+        # Guards _pending and the log file
+        self._persist_lock = threading.Lock()
         self.contexts: Dict[str, Dict[str, Any]] = {}
         self.persist_messages = persist_messages
         self.messages_dir = messages_dir
-        
+        # Persisted messages waiting to be appended to the log. The directory
+        # is only created on the first flush, so idle buses touch no disk.
+        self._pending: List[bytes] = []
+        self._last_flush = time.monotonic()
+        # Set once the directory is known to exist, to skip mkdir on later flushes
+        self._dir_ready = False
         if persist_messages and messages_dir:
-            messages_dir.mkdir(parents=True, exist_ok=True)
+            # Write out whatever is still buffered when the bus is collected or at exit
+            weakref.finalize(self, _flush_on_finalize, messages_dir / self.LOG_FILENAME, self._pending)
     
     def publish(
         self, 
@@ -86,6 +135,9 @@ class AgentMessageBus:
         """
         Publish a message to a specific agent.
         
+        A broadcast delivers one shared AgentMessage to every recipient queue
+        and persists it once, so its content must not be mutated afterwards.
+        
         Args:
             from_agent: Source agent ID
             to_agent: Target agent ID (use "*" for broadcast)
@@ -95,6 +147,10 @@ class AgentMessageBus:
         Returns:
             Message ID
         """
+        # Interned so queue keys and message fields compare by identity
+        from_agent = sys.intern(from_agent)
+        to_agent = sys.intern(to_agent)
+        message_type = sys.intern(message_type)
         message = AgentMessage(
             from_agent=from_agent,
             to_agent=to_agent,
@@ -103,12 +159,20 @@ class AgentMessageBus:
         )
         
         if to_agent == "*":
-            # Broadcast to all agents
-            for agent_id in self.messages.keys():
-                if agent_id != from_agent:
-                    self.messages[agent_id].append(message)
+            # Broadcast to all agents (the same instance, not per-recipient copies)
+            with self._registry_lock:
+                recipients = [
+                    (self._locks.setdefault(agent_id, threading.Lock()), queue)
+                    for agent_id, queue in self.messages.items()
+                    if agent_id != from_agent
+                ]
+            for lock, queue in recipients:
+                with lock:
+                    queue.append(message)
         else:
-            self.messages[to_agent].append(message)
+            lock, queue = self._queue(to_agent)
+            with lock:
+                queue.append(message)
         
         # Persist if enabled
         if self.persist_messages and self.messages_dir:
@@ -126,9 +190,11 @@ class AgentMessageBus:
         Returns:
             List of unread messages (messages are removed after reading)
         """
-        messages = self.messages.get(agent_id, [])
-        # Clear messages after reading
-        self.messages[agent_id] = []
+        lock, queue = self._queue(agent_id)
+        with lock:
+            messages = list(queue)
+            # Clear messages after reading (the queue stays registered for broadcasts)
+            queue.clear()
         return messages
     
     def peek_messages(self, agent_id: str) -> List[AgentMessage]:
@@ -141,7 +207,11 @@ class AgentMessageBus:
         Returns:
             List of unread messages (messages are NOT removed)
         """
-        return self.messages.get(agent_id, [])
+        queue = self.messages.get(agent_id)
+        if queue is None:
+            return []
+        with self._lock_for(agent_id):
+            return list(queue)
     
     def share_context(self, agent_id: str, context: Dict[str, Any]):
         """
@@ -183,13 +253,16 @@ class AgentMessageBus:
         """
         Broadcast a message to all agents.
         
+        Every recipient receives the same AgentMessage instance; treat its
+        content as read-only once broadcast.
+        
         Args:
             from_agent: Source agent ID
             message_type: Type of message
             content: Message content
             
         Returns:
-            List of message IDs (one per recipient)
+            List containing the ID of the shared broadcast message
         """
         return [self.publish(from_agent, "*", message_type, content)]
     
@@ -201,9 +274,12 @@ class AgentMessageBus:
             agent_id: Agent ID to clear messages for (None to clear all)
         """
         if agent_id:
-            self.messages[agent_id] = []
+            lock, queue = self._queue(agent_id)
+            with lock:
+                queue.clear()
         else:
-            self.messages.clear()
+            with self._registry_lock:
+                self.messages.clear()
     
     def clear_contexts(self, agent_id: Optional[str] = None):
         """
@@ -227,17 +303,52 @@ class AgentMessageBus:
         Returns:
             Number of unread messages
         """
-        return len(self.messages.get(agent_id, []))
+        return len(self.messages.get(agent_id, ()))
+    
+    def _lock_for(self, agent_id: str) -> threading.Lock:
+        """Get the lock guarding an agent's queue, creating it if needed"""
+        lock = self._locks.get(agent_id)
+        if lock is None:
+            with self._registry_lock:
+                lock = self._locks.setdefault(agent_id, threading.Lock())
+        return lock
+    
+    def _queue(self, agent_id: str) -> Tuple[threading.Lock, Deque[AgentMessage]]:
+        """Get an agent's queue and its lock, registering the queue if needed"""
+        queue = self.messages.get(agent_id)
+        if queue is None:
+            with self._registry_lock:
+                queue = self.messages[agent_id]
+        return self._lock_for(agent_id), queue
+    
+    def flush(self):
+        """Write all buffered messages to the message log."""
+        with self._persist_lock:
+            self._flush_locked()
+    
+    def _flush_locked(self):
+        """flush() body; the caller holds _persist_lock"""
+        if self.messages_dir and self._pending:
+            log_file = self.messages_dir / self.LOG_FILENAME
+            try:
+                _append_lines(log_file, self._pending, ensure_dir=not self._dir_ready)
+            except FileNotFoundError:
+                # Directory was removed since the last flush; recreate it
+                _append_lines(log_file, self._pending)
+            self._dir_ready = True
+        self._last_flush = time.monotonic()
     
     def _persist_message(self, message: AgentMessage):
-        """Persist a message to disk"""
-        if not self.messages_dir:
+        """Buffer a message for the log, flushing once the batch is full or stale"""
+        if not self.persist_messages or not self.messages_dir:
             return
         
-        # Create a file for each message
-        message_file = self.messages_dir / f"{message.message_id}.json"
-        with open(message_file, 'w', encoding='utf-8') as f:
-            json.dump(message.to_dict(), f, indent=2, ensure_ascii=False)
+        line = json_codec.dumps(message.to_dict(), default=None) + b"\n"
+        with self._persist_lock:
+            self._pending.append(line)
+            if (len(self._pending) >= self.FLUSH_BATCH_SIZE
+                    or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL):
+                self._flush_locked()
     
     def load_persisted_messages(self, agent_id: str) -> List[AgentMessage]:
         """
@@ -249,18 +360,33 @@ class AgentMessageBus:
         Returns:
             List of messages
         """
-        if not self.messages_dir or not self.messages_dir.exists():
+        if not self.messages_dir:
+            return []
+        
+        self.flush()
+        if not self.messages_dir.exists():
             return []
         
         messages = []
-        for message_file in self.messages_dir.glob("*.json"):
-            try:
-                with open(message_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    message = AgentMessage.from_dict(data)
-                    # Only load messages for this agent
+        log_file = self.messages_dir / self.LOG_FILENAME
+        if log_file.exists():
+            with open(log_file, 'rb') as f:
+                for line in f:
+                    try:
+                        message = AgentMessage.from_dict(json_codec.loads(line))
+                    except Exception:
+                        # Skip invalid lines
+                        continue
                     if message.to_agent == agent_id or message.to_agent == "*":
                         messages.append(message)
+        
+        # One-file-per-message layout written by earlier versions
+        for message_file in self.messages_dir.glob("*.json"):
+            try:
+                message = AgentMessage.from_dict(json_codec.loads(message_file.read_bytes()))
+                # Only load messages for this agent
+                if message.to_agent == agent_id or message.to_agent == "*":
+                    messages.append(message)
             except Exception:
                 # Skip invalid message files
                 continue
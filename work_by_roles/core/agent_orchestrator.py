@@ -3,8 +3,10 @@ Agent orchestrator for coordinating multiple agents.
 Following Single Responsibility Principle - handles agent orchestration only.
 """
 
-from typing import Dict, List, Optional, Any, cast, TYPE_CHECKING
+from typing import Dict, List, Optional, Any, Tuple, cast, TYPE_CHECKING
 from pathlib import Path
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from collections import defaultdict
 import asyncio
 import time
 import warnings
@@ -51,6 +53,12 @@ class AgentOrchestrator:
     - Use use_llm=True in execute_stage() to explicitly enable LLM
     - Default behavior is constraint checking only (no LLM calls)
     """
+    
+    # Upper bound on auto-triggered skill workflows run concurrently per stage
+    MAX_WORKFLOW_WORKERS = 4
+    # Upper bound on independent stages run concurrently by execute_parallel_stages*
+    MAX_STAGE_WORKERS = 4
+    
     def __init__(
         self, 
         engine: 'WorkflowEngine', 
@@ -124,6 +132,35 @@ class AgentOrchestrator:
                 self.immersive_display = None
         else:
             self.immersive_display = immersive_display
+        
+        # stage_id -> Stage index over the executor's workflow, rebuilt when
+        # the stage list is replaced or resized (see _get_stage)
+        self._stage_index: Dict[str, Stage] = {}
+        self._stage_index_source: Optional[Tuple[List[Stage], int]] = None
+        
+        # task/stage id -> Event set when it finishes (see _wait_for_dependencies)
+        self._task_done: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+    
+    def _invalidate_caches(self) -> None:
+        """Drop cached lookups; call after reloading the engine's configs"""
+        self._stage_index = {}
+        self._stage_index_source = None
+    
+    def _get_stage(self, stage_id: str) -> Optional[Stage]:
+        """Get a stage of the current workflow by ID via a cached index"""
+        executor = self.engine.executor
+        if not executor:
+            return None
+        stages = executor.workflow.stages
+        source = self._stage_index_source
+        if source is None or source[0] is not stages or source[1] != len(stages):
+            index: Dict[str, Stage] = {}
+            for stage in stages:
+                # First match wins, as in WorkflowExecutor._get_stage_by_id
+                index.setdefault(stage.id, stage)
+            self._stage_index = index
+            self._stage_index_source = (stages, len(stages))
+        return self._stage_index.get(stage_id)
 
     def execute_stage(self, stage_id: str, inputs: Optional[Dict[str, Any]] = None, use_llm: bool = False) -> Dict[str, Any]:
         """
@@ -164,7 +201,7 @@ class AgentOrchestrator:
         Returns:
             Dict with constraint check result
         """
-        stage = self.engine.executor._get_stage_by_id(stage_id) if self.engine.executor else None
+        stage = self._get_stage(stage_id)
         if not stage:
             raise WorkflowError(f"Stage '{stage_id}' not found")
             
@@ -218,7 +255,7 @@ class AgentOrchestrator:
         if not self.llm_enabled:
             raise WorkflowError("LLM client not available. Set llm_client in __init__ or use check_constraints_only()")
         
-        stage = self.engine.executor._get_stage_by_id(stage_id) if self.engine.executor else None
+        stage = self._get_stage(stage_id)
         if not stage:
             raise WorkflowError(f"Stage '{stage_id}' not found")
             
@@ -588,7 +625,7 @@ class AgentOrchestrator:
             Dict with stage and workflow execution results
         """
         # Get stage object first for display
-        stage = self.engine.executor._get_stage_by_id(stage_id) if self.engine.executor else None
+        stage = self._get_stage(stage_id)
         
         # Display stage start if immersive mode enabled
         if immersive and self.immersive_display and stage:
@@ -630,37 +667,37 @@ class AgentOrchestrator:
                 )
                 # display_stage_progress already streams output, no need to print again
             
-            for workflow in auto_workflows:
-                try:
-                    wf_result = self.workflow_executor.execute_workflow(
-                        workflow_id=workflow.id,
-                        inputs=inputs or {},
-                        stage_id=stage_id,
-                        role_id=stage_result.get("agent", {}).role.id if stage_result.get("agent") else None
-                    )
-                    workflow_results.append({
-                        "workflow_id": workflow.id,
-                        "status": wf_result.status,
-                        "outputs": wf_result.outputs,
-                        "errors": wf_result.errors
-                    })
-                    
-                    # Collect workflow execution results and format as readable text
-                    if wf_result.outputs:
-                        summary = self._format_workflow_summary(
-                            workflow_id=workflow.id,
-                            outputs=wf_result.outputs,
-                            stage=stage
+            role_id = stage_result.get("agent", {}).role.id if stage_result.get("agent") else None
+            
+            if len(auto_workflows) > 1:
+                # Auto-triggered workflows are independent of each other; run them
+                # concurrently, each on its own executor since executors hold
+                # per-run state. Results keep the declared workflow order.
+                max_workers = min(self.MAX_WORKFLOW_WORKERS, len(auto_workflows))
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    futures = [
+                        pool.submit(
+                            self._run_auto_workflow,
+                            SkillWorkflowExecutor(
+                                engine=self.engine,
+                                skill_invoker=self.skill_invoker,
+                                execution_tracker=self.execution_tracker
+                            ),
+                            workflow, inputs, stage_id, role_id, stage
                         )
-                        if summary:
-                            stage_summary.append(summary)
-                            
-                except Exception as e:
-                    workflow_results.append({
-                        "workflow_id": workflow.id,
-                        "status": "error",
-                        "error": str(e)
-                    })
+                        for workflow in auto_workflows
+                    ]
+                    outcomes = [future.result() for future in futures]
+            else:
+                outcomes = [
+                    self._run_auto_workflow(self.workflow_executor, workflow, inputs, stage_id, role_id, stage)
+                    for workflow in auto_workflows
+                ]
+            
+            for wf_entry, summary in outcomes:
+                workflow_results.append(wf_entry)
+                if summary:
+                    stage_summary.append(summary)
         
         # Generate stage output files
         if agent and stage:
@@ -724,6 +761,55 @@ class AgentOrchestrator:
             "checkpoint_before": checkpoint_before.checkpoint_id if checkpoint_before else None
         }
     
+    def _run_auto_workflow(
+        self,
+        executor: SkillWorkflowExecutor,
+        workflow: SkillWorkflow,
+        inputs: Optional[Dict[str, Any]],
+        stage_id: str,
+        role_id: Optional[str],
+        stage: Optional[Stage]
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """
+        Run one auto-triggered skill workflow for a stage.
+        
+        Returns:
+            Tuple of (workflow result entry, formatted summary or None)
+        """
+        try:
+            wf_result = executor.execute_workflow(
+                workflow_id=workflow.id,
+                inputs=inputs or {},
+                stage_id=stage_id,
+                role_id=role_id
+            )
+        except Exception as e:
+            return {
+                "workflow_id": workflow.id,
+                "status": "error",
+                "error": str(e)
+            }, None
+        
+        entry = {
+            "workflow_id": workflow.id,
+            "status": wf_result.status,
+            "outputs": wf_result.outputs,
+            "errors": wf_result.errors
+        }
+        
+        # Collect workflow execution results and format as readable text
+        summary = None
+        if wf_result.outputs:
+            try:
+                summary = self._format_workflow_summary(
+                    workflow_id=workflow.id,
+                    outputs=wf_result.outputs,
+                    stage=stage
+                )
+            except Exception as e:
+                entry = {"workflow_id": workflow.id, "status": "error", "error": str(e)}
+        return entry, summary
+    
     def _generate_stage_output_files(
         self,
         stage: Stage,
@@ -1277,51 +1363,29 @@ class AgentOrchestrator:
         Returns:
             Dict mapping stage_id to execution result
         """
-        if not self.engine.executor:
-            raise WorkflowError("Workflow executor not initialized")
-        
-        # Build dependency graph
-        stage_deps: Dict[str, List[str]] = {}
-        stage_map: Dict[str, Stage] = {}
-        
-        for stage_id in stage_ids:
-            stage = self.engine.executor._get_stage_by_id(stage_id)
-            if not stage:
-                raise WorkflowError(f"Stage '{stage_id}' not found")
-            stage_map[stage_id] = stage
-            # Get dependencies from prerequisites
-            deps = []
-            for prereq in stage.prerequisites:
-                if prereq in stage_ids:
-                    deps.append(prereq)
-            stage_deps[stage_id] = deps
+        stage_deps = self._stage_dependencies(stage_ids)
         
         # Track execution results
         results: Dict[str, Any] = {}
         completed: set = set()
+        loop = asyncio.get_event_loop()
+        # Fresh events per run: earlier runs' events are already set (and,
+        # before Python 3.10, bound to the loop they were created on)
+        self._task_done = defaultdict(asyncio.Event)
         
         async def execute_stage_async(stage_id: str):
             """Execute a single stage asynchronously"""
-            # Wait for dependencies
-            deps = stage_deps.get(stage_id, [])
-            while not all(dep in completed for dep in deps):
-                await asyncio.sleep(0.1)  # Small delay to avoid busy waiting
+            await self._wait_for_dependencies(stage_id, stage_deps.get(stage_id, []), completed)
             
-            # Execute stage
-            try:
-                result = self.execute_stage(stage_id, inputs, use_llm)
-                results[stage_id] = result
-                completed.add(stage_id)
-            except Exception as e:
-                results[stage_id] = {
-                    "stage": stage_id,
-                    "status": "failed",
-                    "error": str(e)
-                }
-                completed.add(stage_id)
+            # Execute stage in the loop's default thread pool so independent
+            # stages actually overlap
+            results[stage_id] = await loop.run_in_executor(
+                None, self._execute_stage_safely, stage_id, inputs, use_llm
+            )
+            self._mark_task_done(stage_id, completed)
         
         # Create tasks for all stages
-        tasks = [execute_stage_async(stage_id) for stage_id in stage_ids]
+        tasks = [execute_stage_async(stage_id) for stage_id in stage_deps]
         
         # Execute all tasks concurrently
         await asyncio.gather(*tasks)
@@ -1335,9 +1399,10 @@ class AgentOrchestrator:
         use_llm: bool = False
     ) -> Dict[str, Any]:
         """
-        Execute multiple stages in parallel (synchronous wrapper).
+        Execute multiple stages in parallel (synchronous).
         
-        This is a synchronous wrapper around execute_parallel_stages().
+        Runs stages on a thread pool; a stage is submitted as soon as all of
+        its prerequisites within stage_ids have finished.
         
         Args:
             stage_ids: List of stage IDs to execute
@@ -1347,15 +1412,57 @@ class AgentOrchestrator:
         Returns:
             Dict mapping stage_id to execution result
         """
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        pending = self._stage_dependencies(stage_ids)
+        results: Dict[str, Any] = {}
+        if not pending:
+            return results
+        
+        max_workers = min(self.MAX_STAGE_WORKERS, len(pending))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            running: Dict[Future, str] = {}
+            while pending or running:
+                ready = [sid for sid, deps in pending.items() if all(dep in results for dep in deps)]
+                for stage_id in ready:
+                    del pending[stage_id]
+                    running[pool.submit(self._execute_stage_safely, stage_id, inputs, use_llm)] = stage_id
+                
+                if not running:
+                    raise WorkflowError(f"Circular stage dependencies: {', '.join(pending)}")
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[running.pop(future)] = future.result()
         
-        return loop.run_until_complete(
-            self.execute_parallel_stages(stage_ids, inputs, use_llm)
-        )
+        return results
+    
+    def _stage_dependencies(self, stage_ids: List[str]) -> Dict[str, List[str]]:
+        """Map each stage ID to its prerequisites that are also in stage_ids"""
+        if not self.engine.executor:
+            raise WorkflowError("Workflow executor not initialized")
+        
+        stage_deps: Dict[str, List[str]] = {}
+        for stage_id in stage_ids:
+            stage = self._get_stage(stage_id)
+            if not stage:
+                raise WorkflowError(f"Stage '{stage_id}' not found")
+            stage_deps[stage_id] = [prereq for prereq in stage.prerequisites if prereq in stage_ids]
+        return stage_deps
+    
+    def _execute_stage_safely(
+        self,
+        stage_id: str,
+        inputs: Optional[Dict[str, Any]],
+        use_llm: bool
+    ) -> Dict[str, Any]:
+        """Execute a stage, turning errors into a failed result"""
+        try:
+            return self.execute_stage(stage_id, inputs, use_llm)
+        except Exception as e:
+            return {
+                "stage": stage_id,
+                "status": "failed",
+                "error": str(e)
+            }
     
     def execute_with_collaboration(
         self,
@@ -1383,14 +1490,11 @@ class AgentOrchestrator:
             Dict with execution results and collaboration summary
         """
         # Get available roles
+        roles = self.engine.role_manager.roles
         if role_ids:
-            available_roles = [
-                self.engine.role_manager.get_role(role_id)
-                for role_id in role_ids
-                if self.engine.role_manager.get_role(role_id)
-            ]
+            available_roles = [roles[role_id] for role_id in role_ids if roles.get(role_id)]
         else:
-            available_roles = list(self.engine.role_manager.roles.values())
+            available_roles = list(roles.values())
         
         if not available_roles:
             raise WorkflowError("No available roles for collaboration")
@@ -1400,16 +1504,16 @@ class AgentOrchestrator:
         
         # Create agents for each task
         agents: Dict[str, Agent] = {}
-        agent_tasks: Dict[str, str] = {}  # Map agent_id to task_id
+        task_agents: Dict[str, str] = {}  # Map task_id to the first agent_id assigned to it
         
         for task in decomposition.tasks:
-            role = self.engine.role_manager.get_role(task.assigned_role)
+            role = roles.get(task.assigned_role)
             if not role:
                 continue
             
             agent = Agent(role, self.engine, self.skill_selector, self.message_bus)
             agents[agent.agent_id] = agent
-            agent_tasks[agent.agent_id] = task.id
+            task_agents.setdefault(task.id, agent.agent_id)
         
         # Update execution state with active agents
         if self.engine.executor:
@@ -1425,11 +1529,7 @@ class AgentOrchestrator:
                 continue
             
             # Find agent for this task
-            agent_id = None
-            for aid, tid in agent_tasks.items():
-                if tid == task_id:
-                    agent_id = aid
-                    break
+            agent_id = task_agents.get(task_id)
             
             if not agent_id or agent_id not in agents:
                 continue
@@ -1518,12 +1618,28 @@ class AgentOrchestrator:
         """
         Wait for task dependencies to complete.
         
+        Waiters are woken by _mark_task_done() as soon as a dependency
+        finishes. Dependencies added to completed directly are still picked
+        up by re-checking it every 0.1s.
+        
         Args:
             task_id: Task ID waiting for dependencies
             dependencies: List of dependency task IDs
             completed: Set of completed task IDs
         """
-        while not all(dep in completed for dep in dependencies):
-            await asyncio.sleep(0.1)
-
-
+        while True:
+            pending = [dep for dep in dependencies if dep not in completed]
+            if not pending:
+                return
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(self._task_done[dep].wait() for dep in pending)),
+                    timeout=0.1
+                )
+            except asyncio.TimeoutError:
+                pass
+    
+    def _mark_task_done(self, task_id: str, completed: set) -> None:
+        """Record task_id as completed and wake tasks waiting on it"""
+        completed.add(task_id)
+        self._task_done[task_id].set()
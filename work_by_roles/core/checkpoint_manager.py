@@ -2,25 +2,50 @@
 Checkpoint manager for workflow state recovery.
 """
 
+import bisect
+import io
+import os
 import uuid
 import yaml
 import json
 import warnings
+import zlib
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 from .models import Checkpoint, ExecutionState
+from .schema_loader import SafeDumper, SafeLoader
 from .workflow_progress_manager import WorkflowProgressManager, WorkflowProgress
 
 
 class CheckpointManager:
     """Manages workflow checkpoints for state recovery"""
     
+    INDEX_FILENAME = "_index.json"
+    # Main checkpoint files above this size are zlib-compressed on disk;
+    # smaller ones, and the _state/_progress side files, stay plain YAML/JSON
+    # so they remain readable. Compressed files start with COMPRESSED_MAGIC
+    # and are detected on load.
+    COMPRESS_THRESHOLD = 256 * 1024
+    COMPRESSION_LEVEL = 3
+    COMPRESSED_MAGIC = b"ZLB1"
+    BUF_POOL_SIZE = 4
+    # Checkpoint files are always published atomically (temp file + os.replace).
+    # Set to True to also fsync each file and, once per checkpoint, its directory.
+    FSYNC_ON_SAVE = False
+    
     def __init__(self, workspace_path: Path):
         self.workspace_path = workspace_path
         self.checkpoints_dir = workspace_path / ".workflow" / "checkpoints"
         self.checkpoints_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.checkpoints_dir / self.INDEX_FILENAME
+        # workflow_id -> [(created_at isoformat, checkpoint_id)], oldest first.
+        # Loaded lazily and reloaded when another manager rewrites the file.
+        self._index: Optional[Dict[str, List[Tuple[str, str]]]] = None
+        self._index_stamp: Optional[Tuple[int, int, int]] = None
+        # Reused serialization buffers (see _acquire_buf/_release_buf)
+        self._buf_pool: List[io.BytesIO] = []
     
     def create_checkpoint(
         self,
@@ -78,9 +103,15 @@ class CheckpointManager:
             metadata=metadata or {}
         )
         
+        # Load (or rebuild) the index before the new files exist on disk
+        index = self._get_index()
+        
         # Save checkpoint
         self._save_checkpoint(checkpoint)
         
+        bisect.insort(index.setdefault(workflow_id, []), (checkpoint.created_at.isoformat(), checkpoint_id))
+        self._write_index()
+        
         return checkpoint
     
     def list_checkpoints(self, workflow_id: Optional[str] = None) -> List[Checkpoint]:
@@ -93,37 +124,22 @@ class CheckpointManager:
         Returns:
             List of checkpoints
         """
-        checkpoints = []
-        
-        # If workflow_id specified, only check that workflow's directory
+        index = self._get_index()
         if workflow_id:
-            workflow_dir = self.checkpoints_dir / workflow_id
-            if workflow_dir.exists():
-                checkpoint_files = list(workflow_dir.glob("*.yaml"))
-            else:
-                return []
+            entries = [(entry, workflow_id) for entry in index.get(workflow_id, [])]
         else:
-            # Check all workflow directories
-            checkpoint_files = []
-            for workflow_dir in self.checkpoints_dir.iterdir():
-                if workflow_dir.is_dir():
-                    checkpoint_files.extend(workflow_dir.glob("*.yaml"))
+            entries = [(entry, wf_id) for wf_id, wf_entries in index.items() for entry in wf_entries]
         
-        for checkpoint_file in checkpoint_files:
-            # Skip state and progress files (they're part of checkpoint data)
-            if checkpoint_file.name.endswith("_state.yaml") or checkpoint_file.name.endswith("_progress.json"):
-                continue
-            
-            try:
-                checkpoint = self._load_checkpoint(checkpoint_file)
-                if checkpoint:
-                    checkpoints.append(checkpoint)
-            except Exception as e:
-                warnings.warn(f"Failed to load checkpoint from {checkpoint_file}: {e}")
-                continue
+        # Most recent first
+        entries.sort(key=lambda item: item[0], reverse=True)
+        
+        checkpoints = []
+        for (_created_at, checkpoint_id), wf_id in entries:
+            checkpoint_file = self.checkpoints_dir / wf_id / f"{checkpoint_id}.yaml"
+            checkpoint = self._load_checkpoint(checkpoint_file)
+            if checkpoint:
+                checkpoints.append(checkpoint)
         
-        # Sort by creation time, most recent first
-        checkpoints.sort(key=lambda c: c.created_at, reverse=True)
         return checkpoints
     
     def get_checkpoint(self, checkpoint_id: str) -> Optional[Checkpoint]:
@@ -157,8 +173,12 @@ class CheckpointManager:
         Returns:
             Latest checkpoint or None if not found
         """
-        checkpoints = self.list_checkpoints(workflow_id)
-        return checkpoints[0] if checkpoints else None
+        # Walk back from the newest entry in case its files were removed externally
+        for _created_at, checkpoint_id in reversed(self._get_index().get(workflow_id, [])):
+            checkpoint = self._load_checkpoint(self.checkpoints_dir / workflow_id / f"{checkpoint_id}.yaml")
+            if checkpoint:
+                return checkpoint
+        return None
     
     def restore_from_checkpoint(
         self,
@@ -233,8 +253,94 @@ class CheckpointManager:
                 except Exception as e:
                     warnings.warn(f"Failed to delete {file}: {e}")
         
+        entries = self._get_index().get(checkpoint.workflow_id, [])
+        remaining = [entry for entry in entries if entry[1] != checkpoint_id]
+        if len(remaining) != len(entries):
+            if remaining:
+                self._index[checkpoint.workflow_id] = remaining
+            else:
+                self._index.pop(checkpoint.workflow_id, None)
+            self._write_index()
+        
         return deleted
     
+    def _get_index(self) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Return the checkpoint index, loading or rebuilding it when needed.
+        
+        The index lets list/latest lookups skip globbing every workflow
+        directory. A missing or unreadable index (e.g. a workspace created
+        before it existed) is rebuilt from the checkpoint files once.
+        """
+        stamp = self._stat_index()
+        if self._index is not None and stamp == self._index_stamp:
+            return self._index
+        
+        index = None
+        if stamp is not None:
+            try:
+                data = json.loads(self.index_file.read_bytes())
+                index = {
+                    wf_id: sorted((created_at, checkpoint_id) for created_at, checkpoint_id in entries)
+                    for wf_id, entries in data.get("workflows", {}).items()
+                }
+            except Exception as e:
+                warnings.warn(f"Failed to read checkpoint index {self.index_file}: {e}. Rebuilding.")
+        
+        if index is None:
+            self._index = self._scan_checkpoints()
+            self._write_index()
+        else:
+            self._index = index
+            self._index_stamp = stamp
+        return self._index
+    
+    def _stat_index(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Identify the current index file version.
+        
+        The index is always replaced via os.replace, so the inode changes on
+        every write even when mtime granularity is too coarse to notice.
+        """
+        try:
+            st = self.index_file.stat()
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _scan_checkpoints(self) -> Dict[str, List[Tuple[str, str]]]:
+        """Build the index by loading every checkpoint file on disk."""
+        index: Dict[str, List[Tuple[str, str]]] = {}
+        for workflow_dir in self.checkpoints_dir.iterdir():
+            if not workflow_dir.is_dir():
+                continue
+            for checkpoint_file in workflow_dir.glob("*.yaml"):
+                # Skip state files (they're part of checkpoint data)
+                if checkpoint_file.name.endswith("_state.yaml"):
+                    continue
+                checkpoint = self._load_checkpoint(checkpoint_file)
+                if checkpoint:
+                    index.setdefault(checkpoint.workflow_id, []).append(
+                        (checkpoint.created_at.isoformat(), checkpoint.checkpoint_id)
+                    )
+        for entries in index.values():
+            entries.sort()
+        return index
+    
+    def _write_index(self) -> None:
+        """Persist the index atomically (temp file + os.replace)."""
+        payload = {
+            "version": 1,
+            "workflows": {wf_id: [list(entry) for entry in entries] for wf_id, entries in (self._index or {}).items()}
+        }
+        tmp_file = self.index_file.with_name(f"{self.index_file.name}.{os.getpid()}.tmp")
+        try:
+            tmp_file.write_bytes(json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+            os.replace(tmp_file, self.index_file)
+            self._index_stamp = self._stat_index()
+        except OSError as e:
+            warnings.warn(f"Failed to write checkpoint index {self.index_file}: {e}")
+    
     def _save_checkpoint(self, checkpoint: Checkpoint) -> None:
         """Save checkpoint to disk"""
         workflow_dir = self.checkpoints_dir / checkpoint.workflow_id
@@ -243,32 +349,96 @@ class CheckpointManager:
         checkpoint_file = workflow_dir / f"{checkpoint.checkpoint_id}.yaml"
         
         try:
-            # Save main checkpoint data
-            with open(checkpoint_file, 'w', encoding='utf-8') as f:
-                yaml.dump(checkpoint.to_dict(), f, default_flow_style=False, allow_unicode=True)
-            
-            # Optionally save state and progress separately for easier access
-            if checkpoint.execution_state:
+            # Serialize in memory first, then write each file with a single call.
+            # Side files go first so the main file only appears once they exist.
+            # The state is converted once and shared by both files.
+            checkpoint_data = checkpoint.to_dict()
+            state_data = checkpoint_data["execution_state"]
+            if state_data is not None:
                 state_file = workflow_dir / f"{checkpoint.checkpoint_id}_state.yaml"
-                with open(state_file, 'w', encoding='utf-8') as f:
-                    yaml.dump(checkpoint.execution_state.to_dict(), f, default_flow_style=False, allow_unicode=True)
+                self._dump_yaml(state_file, state_data, Dumper=SafeDumper)
             
             if checkpoint.progress_data:
                 progress_file = workflow_dir / f"{checkpoint.checkpoint_id}_progress.json"
-                with open(progress_file, 'w', encoding='utf-8') as f:
-                    json.dump(checkpoint.progress_data, f, indent=2, ensure_ascii=False, default=str)
+                self._write_payload(
+                    progress_file,
+                    json.dumps(checkpoint.progress_data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+                )
+            
+            self._dump_yaml(checkpoint_file, checkpoint_data, compress=True)
+            
+            if self.FSYNC_ON_SAVE:
+                self._fsync_dir(workflow_dir)
         except Exception as e:
             raise RuntimeError(f"Failed to save checkpoint: {e}") from e
     
     def _load_checkpoint(self, checkpoint_file: Path) -> Optional[Checkpoint]:
         """Load checkpoint from file"""
         try:
-            with open(checkpoint_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if not data:
-                    return None
-                return Checkpoint.from_dict(data)
+            data = yaml.load(self._read_payload(checkpoint_file), Loader=SafeLoader)
+            if not data:
+                return None
+            return Checkpoint.from_dict(data)
         except Exception as e:
             warnings.warn(f"Failed to load checkpoint from {checkpoint_file}: {e}")
             return None
-
+    
+    def _acquire_buf(self) -> io.BytesIO:
+        """Take a serialization buffer from the pool (or a new one)"""
+        return self._buf_pool.pop() if self._buf_pool else io.BytesIO()
+    
+    def _release_buf(self, buf: io.BytesIO) -> None:
+        """Reset a buffer and return it to the pool"""
+        buf.seek(0)
+        buf.truncate(0)
+        if len(self._buf_pool) < self.BUF_POOL_SIZE:
+            self._buf_pool.append(buf)
+    
+    def _dump_yaml(self, path: Path, data: Dict[str, Any], compress: bool = False, **dump_kwargs: Any) -> None:
+        """Serialize data as YAML into a pooled buffer and write it in one call"""
+        buf = self._acquire_buf()
+        try:
+            yaml.dump(data, buf, default_flow_style=False, allow_unicode=True, encoding='utf-8', **dump_kwargs)
+            with buf.getbuffer() as view:
+                self._write_payload(path, view, compress=compress)
+        finally:
+            self._release_buf(buf)
+    
+    def _write_payload(self, path: Path, data: Any, compress: bool = False) -> None:
+        """Write a serialized payload (any bytes-like object); with compress, large ones are compressed"""
+        if compress and len(data) > self.COMPRESS_THRESHOLD:
+            data = self.COMPRESSED_MAGIC + zlib.compress(data, self.COMPRESSION_LEVEL)
+        # Readers never see a partially written file: write a sibling temp
+        # file, then atomically swap it in
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                if self.FSYNC_ON_SAVE:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+    
+    @staticmethod
+    def _fsync_dir(directory: Path) -> None:
+        """Flush directory entries (renames) to disk where the OS supports it"""
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    
+    def _read_payload(self, path: Path) -> bytes:
+        """Read a payload written by _write_payload"""
+        data = path.read_bytes()
+        if data.startswith(self.COMPRESSED_MAGIC):
+            return zlib.decompress(data[len(self.COMPRESSED_MAGIC):])
+        return data
@@ -2,18 +2,78 @@
 Code writing tracker for tracking code file creation and modification during workflow execution.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any
+from collections import defaultdict, deque
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 import difflib
 
 
+_ACTION_ICONS = {
+    "create": "✨",
+    "modify": "📝",
+    "delete": "🗑️"
+}
+
+
+@lru_cache(maxsize=256)
+def _format_change_block(
+    file: str,
+    action: str,
+    stage: Any,
+    skill: Any,
+    size: Any,
+    lines: Any,
+    additions: Any,
+    deletions: Any,
+    timestamp: Any
+) -> str:
+    """
+    Render one change entry (with its trailing blank line).
+    
+    Recorded changes never change after the fact, so repeated renders of the
+    same recent changes reuse the formatted text.
+    """
+    parts = [
+        f"{_ACTION_ICONS.get(action, '📄')} **{file}**",
+        f"   - 操作: {action}",
+        f"   - 阶段: {stage}"
+    ]
+    
+    if skill:
+        parts.append(f"   - 技能: {skill}")
+    
+    if action == 'create':
+        parts.append(f"   - 大小: {size} 字符, {lines} 行")
+    elif action == 'modify':
+        parts.append(f"   - 变更: +{additions} -{deletions} 行")
+    
+    # Format timestamp
+    try:
+        ts = datetime.fromisoformat(timestamp)
+        parts.append(f"   - 时间: {ts.strftime('%Y-%m-%d %H:%M:%S')}")
+    except Exception:
+        parts.append(f"   - 时间: {timestamp}")
+    
+    parts.append("")
+    return "\n".join(parts)
+
+
 class CodeWritingTracker:
     """Tracks code file creation and modification during workflow execution"""
     
     def __init__(self, workspace_path: Path):
         self.workspace_path = workspace_path
-        self.writing_history: List[Dict[str, Any]] = []
+        # Chronological (oldest first); recent-changes queries walk it from the right
+        self.writing_history: Deque[Dict[str, Any]] = deque()
+        self._changes_by_stage: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    
+    def _record(self, change: Dict[str, Any]) -> None:
+        """Append a change to the history and the per-stage index"""
+        self.writing_history.append(change)
+        self._changes_by_stage[change.get('stage')].append(change)
     
     def track_file_creation(
         self,
@@ -24,7 +84,7 @@ class CodeWritingTracker:
     ) -> None:
         """Track file creation"""
         full_path = self.workspace_path / file_path
-        self.writing_history.append({
+        self._record({
             "action": "create",
             "file": file_path,
             "absolute_path": str(full_path),
@@ -45,25 +105,34 @@ class CodeWritingTracker:
         """Track file modification with diff"""
         full_path = self.workspace_path / file_path
         
-        # Generate diff
-        diff_lines = list(difflib.unified_diff(
-            old_content.splitlines(keepends=True),
-            new_content.splitlines(keepends=True),
-            fromfile=file_path,
-            tofile=file_path,
-            lineterm=''
-        ))
-        
-        # Count changes
-        additions = sum(1 for line in diff_lines if line.startswith('+') and not line.startswith('+++'))
-        deletions = sum(1 for line in diff_lines if line.startswith('-') and not line.startswith('---'))
+        # Generate diff (unified_diff is SequenceMatcher-based). One pass counts
+        # additions/deletions and keeps the preview, so the diff is never
+        # materialized; identical content skips diffing entirely.
+        additions = deletions = total_lines = 0
+        preview_lines: List[str] = []
+        if old_content != new_content:
+            for line in difflib.unified_diff(
+                old_content.splitlines(keepends=True),
+                new_content.splitlines(keepends=True),
+                fromfile=file_path,
+                tofile=file_path,
+                lineterm=''
+            ):
+                total_lines += 1
+                if total_lines <= 20:
+                    preview_lines.append(line)
+                if line.startswith('+'):
+                    if not line.startswith('+++'):
+                        additions += 1
+                elif line.startswith('-') and not line.startswith('---'):
+                    deletions += 1
         
         # Get preview of diff (first 20 lines)
-        diff_preview = '\n'.join(diff_lines[:20])
-        if len(diff_lines) > 20:
-            diff_preview += f"\n... (还有 {len(diff_lines) - 20} 行差异)"
+        diff_preview = '\n'.join(preview_lines)
+        if total_lines > 20:
+            diff_preview += f"\n... (还有 {total_lines - 20} 行差异)"
         
-        self.writing_history.append({
+        self._record({
             "action": "modify",
             "file": file_path,
             "absolute_path": str(full_path),
@@ -76,19 +145,12 @@ class CodeWritingTracker:
         })
     
     def get_recent_changes(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get recent code changes"""
-        return sorted(
-            self.writing_history,
-            key=lambda x: x['timestamp'],
-            reverse=True
-        )[:limit]
+        """Get recent code changes (most recent first)"""
+        return list(islice(reversed(self.writing_history), limit))
     
     def get_changes_by_stage(self, stage_id: str) -> List[Dict[str, Any]]:
         """Get all changes for a specific stage"""
-        return [
-            change for change in self.writing_history
-            if change.get('stage') == stage_id
-        ]
+        return list(self._changes_by_stage.get(stage_id, ()))
     
     def format_code_changes_for_display(self, limit: int = 5) -> str:
         """Format code changes for display"""
@@ -97,37 +159,19 @@ class CodeWritingTracker:
         if not changes:
             return "📝 **代码编写过程**\n\n暂无代码变更记录"
         
-        lines = []
-        lines.append("📝 **代码编写过程**")
-        lines.append("")
-        
+        blocks = ["📝 **代码编写过程**", ""]
         for change in changes:
-            action_icon = {
-                "create": "✨",
-                "modify": "📝",
-                "delete": "🗑️"
-            }.get(change['action'], "📄")
-            
-            lines.append(f"{action_icon} **{change['file']}**")
-            lines.append(f"   - 操作: {change['action']}")
-            lines.append(f"   - 阶段: {change.get('stage', 'unknown')}")
-            
-            if change.get('skill'):
-                lines.append(f"   - 技能: {change['skill']}")
-            
-            if change['action'] == 'create':
-                lines.append(f"   - 大小: {change['size']} 字符, {change['lines']} 行")
-            elif change['action'] == 'modify':
-                lines.append(f"   - 变更: +{change.get('additions', 0)} -{change.get('deletions', 0)} 行")
-            
-            # Format timestamp
-            try:
-                ts = datetime.fromisoformat(change['timestamp'])
-                lines.append(f"   - 时间: {ts.strftime('%Y-%m-%d %H:%M:%S')}")
-            except Exception:
-                lines.append(f"   - 时间: {change['timestamp']}")
-            
-            lines.append("")
+            blocks.append(_format_change_block(
+                change['file'],
+                change['action'],
+                change.get('stage', 'unknown'),
+                change.get('skill'),
+                change.get('size'),
+                change.get('lines'),
+                change.get('additions', 0),
+                change.get('deletions', 0),
+                change['timestamp']
+            ))
         
-        return "\n".join(lines)
+        return "\n".join(blocks)
 
@@ -3,9 +3,209 @@ Condition evaluator for workflow step conditions.
 Following Single Responsibility Principle - handles condition evaluation only.
 """
 
+import ast
+import operator
 import re
 import warnings
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Callable, Dict, Any, Optional, Tuple
+
+
+# {{step.step_id.result.field}} and {{inputs.key}} references
+_STEP_REF_RE = re.compile(r'\{\{step\.(\w+(?:\.[\w.]+)*)\}\}')
+_INPUT_REF_RE = re.compile(r'\{\{inputs\.(\w+)\}\}')
+
+# Names visible to condition expressions besides the reference placeholders
+_SAFE_NAMES = {
+    'True': True,
+    'False': False,
+    'None': None,
+    'bool': bool,
+    'int': int,
+    'float': float,
+    'str': str,
+    'len': len,
+}
+
+_COMPARE_OPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+    ast.In: lambda a, b: a in b,
+    ast.NotIn: lambda a, b: a not in b,
+}
+
+_BIN_OPS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+}
+
+_UNARY_OPS: Dict[type, Callable[[Any], Any]] = {
+    ast.Not: operator.not_,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+# A compiled expression node: placeholder values -> result
+_Node = Callable[[Dict[str, Any]], Any]
+
+
+def _compile_node(node: ast.AST) -> _Node:
+    """Turn an expression AST node into a closure, rejecting anything unsupported"""
+    if isinstance(node, ast.Constant):
+        value = node.value
+        return lambda values: value
+    
+    if isinstance(node, ast.Name):
+        name = node.id
+        if name in _SAFE_NAMES:
+            value = _SAFE_NAMES[name]
+            return lambda values: value
+        if name.startswith("_ref"):
+            return lambda values: values[name]
+        raise NameError(f"name '{name}' is not defined")
+    
+    if isinstance(node, ast.BoolOp):
+        operands = [_compile_node(v) for v in node.values]
+        if isinstance(node.op, ast.And):
+            def run_and(values: Dict[str, Any]) -> Any:
+                result = None
+                for operand in operands:
+                    result = operand(values)
+                    if not result:
+                        return result
+                return result
+            return run_and
+        
+        def run_or(values: Dict[str, Any]) -> Any:
+            result = None
+            for operand in operands:
+                result = operand(values)
+                if result:
+                    return result
+            return result
+        return run_or
+    
+    if isinstance(node, ast.Compare):
+        left = _compile_node(node.left)
+        steps = [(_op(_COMPARE_OPS, op), _compile_node(c)) for op, c in zip(node.ops, node.comparators)]
+        
+        def run_compare(values: Dict[str, Any]) -> bool:
+            current = left(values)
+            for compare, comparator in steps:
+                right = comparator(values)
+                if not compare(current, right):
+                    return False
+                current = right
+            return True
+        return run_compare
+    
+    if isinstance(node, ast.UnaryOp):
+        unary = _op(_UNARY_OPS, node.op)
+        operand = _compile_node(node.operand)
+        return lambda values: unary(operand(values))
+    
+    if isinstance(node, ast.BinOp):
+        binary = _op(_BIN_OPS, node.op)
+        lhs, rhs = _compile_node(node.left), _compile_node(node.right)
+        return lambda values: binary(lhs(values), rhs(values))
+    
+    if isinstance(node, (ast.List, ast.Tuple)):
+        items = [_compile_node(e) for e in node.elts]
+        factory = list if isinstance(node, ast.List) else tuple
+        return lambda values: factory(item(values) for item in items)
+    
+    if isinstance(node, ast.Set):
+        members = [_compile_node(e) for e in node.elts]
+        return lambda values: {member(values) for member in members}
+    
+    if isinstance(node, ast.Dict):
+        # A None key marks a **mapping entry
+        entries = [
+            (None if k is None else _compile_node(k), _compile_node(v))
+            for k, v in zip(node.keys, node.values)
+        ]
+        
+        def run_dict(values: Dict[str, Any]) -> Dict[Any, Any]:
+            result: Dict[Any, Any] = {}
+            for key, value in entries:
+                if key is None:
+                    result.update(value(values))
+                else:
+                    result[key(values)] = value(values)
+            return result
+        return run_dict
+    
+    if isinstance(node, ast.IfExp):
+        test, body, orelse = _compile_node(node.test), _compile_node(node.body), _compile_node(node.orelse)
+        return lambda values: body(values) if test(values) else orelse(values)
+    
+    if isinstance(node, ast.Subscript):
+        index_node = node.slice
+        # Python 3.8 wraps plain indexes in ast.Index
+        if type(index_node).__name__ == "Index":
+            index_node = index_node.value  # type: ignore[attr-defined]
+        target, index = _compile_node(node.value), _compile_node(index_node)
+        return lambda values: target(values)[index(values)]
+    
+    if isinstance(node, ast.Call) and not node.keywords:
+        func = _compile_node(node.func)
+        args = [_compile_node(a) for a in node.args]
+        return lambda values: func(values)(*[arg(values) for arg in args])
+    
+    raise ValueError(f"unsupported expression: {type(node).__name__}")
+
+
+def _op(table: Dict[type, Callable[..., Any]], op: ast.AST) -> Callable[..., Any]:
+    """Look up the function for an AST operator node"""
+    try:
+        return table[type(op)]
+    except KeyError:
+        raise ValueError(f"unsupported operator: {type(op).__name__}") from None
+
+
+@lru_cache(maxsize=512)
+def _parse_condition(condition: str) -> Tuple[_Node, Tuple[Tuple[str, str], ...]]:
+    """
+    Compile a condition once per distinct expression text.
+    
+    Each {{...}} reference is replaced by a placeholder name (_ref0, _ref1, ...)
+    bound to the referenced value at evaluation time. The expression is then
+    parsed and turned into a tree of closures, so evaluating it is a walk over
+    Python callables with no parsing and no eval().
+    
+    Returns:
+        (compiled expression, ((kind, path), ...)) where kind is "step" or "inputs"
+    """
+    refs = []
+    
+    def placeholder(kind: str):
+        def replace(match) -> str:
+            refs.append((kind, match.group(1)))
+            return f"_ref{len(refs) - 1}"
+        return replace
+    
+    expression = _STEP_REF_RE.sub(placeholder("step"), condition)
+    expression = _INPUT_REF_RE.sub(placeholder("inputs"), expression)
+    return _compile_node(ast.parse(expression.strip(), mode="eval").body), tuple(refs)
+
+
+def _to_literal(value: Any) -> str:
+    """Render a resolved value as Python source"""
+    if value is None:
+        return 'None'
+    if isinstance(value, (bool, int, float)):
+        return str(value)
+    return repr(value)
 
 
 class ConditionEvaluator:
@@ -19,6 +219,13 @@ class ConditionEvaluator:
     - Comparison operators: ==, !=, <, >, <=, >=
     - Logical operators: and, or, not
     - String and numeric comparisons
+    - Membership tests, arithmetic, list/tuple/set/dict literals, indexing,
+      conditional expressions (x if c else y) and the bool/int/float/str/len
+      builtins
+    
+    Attribute access, slicing, comprehensions, lambdas, f-strings, keyword
+    arguments and other Python constructs are rejected, which makes the
+    condition evaluate to False.
     """
     
     def __init__(self, step_outputs: Dict[str, Dict[str, Any]], workflow_inputs: Dict[str, Any]):
@@ -38,7 +245,7 @@ class ConditionEvaluator:
         
         Args:
             condition: Condition expression string
-            
+        
         Returns:
             Boolean result of evaluation
         """
@@ -46,94 +253,47 @@ class ConditionEvaluator:
             return True
         
         try:
-            # Resolve variable references
-            resolved_condition = self._resolve_variables(condition)
-            
-            # Evaluate the expression safely
-            # Using eval with restricted globals for safety
-            safe_dict = {
-                '__builtins__': {
-                    'True': True,
-                    'False': False,
-                    'None': None,
-                    'bool': bool,
-                    'int': int,
-                    'float': float,
-                    'str': str,
-                    'len': len,
-                }
+            compiled, refs = _parse_condition(condition)
+            values = {
+                f"_ref{i}": self._resolve_step_ref(path) if kind == "step" else self.workflow_inputs.get(path)
+                for i, (kind, path) in enumerate(refs)
             }
-            
-            # Replace common operators with Python equivalents
-            resolved_condition = resolved_condition.replace(' and ', ' and ')
-            resolved_condition = resolved_condition.replace(' or ', ' or ')
-            resolved_condition = resolved_condition.replace(' not ', ' not ')
-            
-            result = eval(resolved_condition, safe_dict)
-            return bool(result)
+            return bool(compiled(values))
         except Exception as e:
             # If evaluation fails, log and return False
             warnings.warn(f"Condition evaluation failed: {condition}, error: {e}")
             return False
     
-    def _resolve_variables(self, condition: str) -> str:
-        """Resolve variable references in condition"""
-        def resolve_step_ref(match):
-            """Resolve step reference like step_1.result.status"""
-            ref = match.group(1)
-            parts = ref.split('.')
-            
-            if len(parts) < 2:
-                return 'None'
-            
-            step_id = parts[0]
-            if step_id not in self.step_outputs:
-                return 'None'
-            
-            step_data = self.step_outputs[step_id]
-            
-            # Navigate through the data structure
-            current = step_data
-            for part in parts[1:]:
-                if isinstance(current, dict):
-                    current = current.get(part)
-                elif hasattr(current, part):
-                    current = getattr(current, part)
-                else:
-                    return 'None'
-                if current is None:
-                    return 'None'
-            
-            # Convert to Python literal
-            if isinstance(current, bool):
-                return str(current)
-            elif isinstance(current, (int, float)):
-                return str(current)
-            elif isinstance(current, str):
-                return repr(current)
-            else:
-                return repr(current)
+    def _resolve_step_ref(self, ref: str) -> Optional[Any]:
+        """Resolve a step reference like step_1.result.status to its value"""
+        parts = ref.split('.')
         
-        def resolve_input_ref(match):
-            """Resolve input reference like inputs.key"""
-            key = match.group(1)
-            value = self.workflow_inputs.get(key)
-            if value is None:
-                return 'None'
-            if isinstance(value, bool):
-                return str(value)
-            elif isinstance(value, (int, float)):
-                return str(value)
-            elif isinstance(value, str):
-                return repr(value)
-            else:
-                return repr(value)
+        if len(parts) < 2:
+            return None
         
+        step_id = parts[0]
+        if step_id not in self.step_outputs:
+            return None
+        
+        # Navigate through the data structure
+        current: Any = self.step_outputs[step_id]
+        for part in parts[1:]:
+            if isinstance(current, dict):
+                current = current.get(part)
+            elif hasattr(current, part):
+                current = getattr(current, part)
+            else:
+                return None
+            if current is None:
+                return None
+        return current
+    
+    def _resolve_variables(self, condition: str) -> str:
+        """Resolve variable references in condition"""
         # Resolve step references: {{step.step_id.result.field}}
-        condition = re.sub(r'\{\{step\.(\w+(?:\.[\w.]+)*)\}\}', resolve_step_ref, condition)
+        condition = _STEP_REF_RE.sub(lambda m: _to_literal(self._resolve_step_ref(m.group(1))), condition)
         
         # Resolve input references: {{inputs.key}}
-        condition = re.sub(r'\{\{inputs\.(\w+)\}\}', resolve_input_ref, condition)
+        condition = _INPUT_REF_RE.sub(lambda m: _to_literal(self.workflow_inputs.get(m.group(1))), condition)
         
         return condition
-
@@ -3,6 +3,8 @@ Configuration loader with dependency management.
 Following Single Responsibility Principle - handles configuration loading only.
 """
 
+import copy
+import functools
 import re
 import warnings
 from pathlib import Path
@@ -10,7 +12,30 @@ from typing import Dict, Any, List, Optional, Tuple, cast
 
 from .exceptions import ValidationError
 from .models import ProjectContext
-from .schema_loader import SchemaLoader
+from .schema_loader import SchemaLoader, SafeLoader
+
+
+@functools.lru_cache(maxsize=32)
+def _load_schema_cached(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """
+    Parse a schema file, memoized by path and file stat.
+    
+    mtime_ns and size are part of the key so an edited file is re-parsed.
+    Callers must not mutate the returned dict (ConfigLoader hands out copies).
+    """
+    return SchemaLoader.load_schema(Path(path))
+
+
+@functools.lru_cache(maxsize=256)
+def _load_skill_cached(path: str, skill_dir: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a Skill.md file, memoized by path and file stat (see _load_schema_cached)."""
+    return ConfigLoader._parse_anthropic_skill(Path(path), Path(skill_dir))
+
+
+def clear_schema_cache() -> None:
+    """Drop all parsed schemas and skills shared across ConfigLoader instances."""
+    _load_schema_cached.cache_clear()
+    _load_skill_cached.cache_clear()
 
 
 class ConfigLoader:
@@ -18,7 +43,7 @@ class ConfigLoader:
     
     def __init__(self, workspace_path: Path):
         self.workspace_path = Path(workspace_path)
-        self._cache: Dict[Path, Tuple[Any, float]] = {}
+        self._cache: Dict[Path, Tuple[Any, Tuple[int, int]]] = {}
 
     def _load_skill_directory(self, skill_dir: Path) -> Dict[str, Any]:
         """
@@ -67,6 +92,17 @@ class ConfigLoader:
         """
         Load skill from Anthropic standard Skill.md format.
         
+        Parsed skills are shared across loader instances while the file is
+        unchanged; each call returns its own copy.
+        """
+        stat = skill_md_path.stat()
+        return copy.deepcopy(_load_skill_cached(str(skill_md_path), str(skill_dir), stat.st_mtime_ns, stat.st_size))
+    
+    @staticmethod
+    def _parse_anthropic_skill(skill_md_path: Path, skill_dir: Path) -> Dict[str, Any]:
+        """
+        Parse an Anthropic standard Skill.md file.
+        
         Format: YAML frontmatter (---) + Markdown content
         """
         import yaml
@@ -88,7 +124,7 @@ class ConfigLoader:
         
         # Parse YAML
         try:
-            frontmatter_data = yaml.safe_load(yaml_content)
+            frontmatter_data = yaml.load(yaml_content, Loader=SafeLoader)
         except yaml.YAMLError as e:
             raise ValidationError(f"Invalid YAML in Skill.md frontmatter: {skill_md_path}: {e}")
         
@@ -245,16 +281,19 @@ class ConfigLoader:
         return skill_data, roles_data, workflow_data, context
     
     def _load_cached(self, file_path: Path) -> Dict[str, Any]:
-        """Load file with caching based on modification time"""
+        """Load file with caching based on modification time and size"""
         try:
-            mtime = file_path.stat().st_mtime
+            stat = file_path.stat()
+            signature = (stat.st_mtime_ns, stat.st_size)
             if file_path in self._cache:
-                cached_data, cached_mtime = self._cache[file_path]
-                if mtime == cached_mtime:
+                cached_data, cached_signature = self._cache[file_path]
+                if signature == cached_signature:
                     return cast(Dict[str, Any], cached_data)
             
-            data = SchemaLoader.load_schema(file_path)
-            self._cache[file_path] = (data, mtime)
+            # Parsed schemas are shared across loader instances; copy so that
+            # callers mutating the result cannot corrupt the shared entry.
+            data = copy.deepcopy(_load_schema_cached(str(file_path), *signature))
+            self._cache[file_path] = (data, signature)
             return cast(Dict[str, Any], data)
         except FileNotFoundError:
             raise ValidationError(f"Configuration file not found: {file_path}")
@@ -324,6 +363,6 @@ class ConfigLoader:
         return errors
     
     def clear_cache(self) -> None:
-        """Clear the configuration cache"""
+        """Clear this loader's configuration cache (see clear_schema_cache for the shared one)"""
         self._cache.clear()
 
@@ -10,6 +10,8 @@ from enum import Enum
 import uuid
 import json
 
+from .models import with_slots
+
 
 class DialogState(Enum):
     """Dialog state enum"""
@@ -31,6 +33,7 @@ class AmbiguityType(Enum):
     MULTIPLE_INTERPRETATIONS = "multiple_interpretations"  # 多种解释
 
 
+@with_slots
 @dataclass
 class DialogTurn:
     """A single turn in the dialog"""
@@ -174,6 +177,10 @@ class DialogManager:
         self.clarification_round = 0
         self.created_at = datetime.now()
         self.last_activity = datetime.now()
+        # Serialized turns reused by to_dict. Turns aren't changed once added,
+        # so each call only converts the turns appended since the last one.
+        self._history_dicts: List[Dict[str, Any]] = []
+        self._history_source: Optional[List[DialogTurn]] = None
     
     def add_user_turn(self, content: str, intent: Optional[Dict[str, Any]] = None) -> DialogTurn:
         """
@@ -478,10 +485,22 @@ class DialogManager:
         return self.context.refined_goal or self.context.original_goal
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert dialog manager state to dictionary for serialization"""
+        """
+        Convert dialog manager state to dictionary for serialization.
+        
+        The per-turn dicts under "history" are shared with later calls and
+        must not be modified.
+        """
+        if self._history_source is not self.history or len(self._history_dicts) > len(self.history):
+            # history was replaced or truncated; start over
+            self._history_dicts = []
+            self._history_source = self.history
+        for turn in self.history[len(self._history_dicts):]:
+            self._history_dicts.append(turn.to_dict())
+        
         return {
             "session_id": self.session_id,
-            "history": [turn.to_dict() for turn in self.history],
+            "history": list(self._history_dicts),
             "context": self.context.to_dict(),
             "state": self.state.value,
             "pending_questions": [q.to_dict() for q in self.pending_questions],
@@ -2,17 +2,44 @@
 Document preview generator for displaying generated documents in conversations.
 """
 
+import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 
+def _scan_text(path: Path, max_lines: Optional[int] = None) -> Tuple[List[str], int, int]:
+    """
+    Stream a text file, keeping at most max_lines lines (None keeps all).
+    
+    Returns (head lines with their newlines, character count, line count),
+    where the counts match len(content) and len(content.split('\n')) of a
+    full read, without holding the whole file in memory.
+    """
+    head: List[str] = []
+    chars = 0
+    newlines = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            chars += len(line)
+            if line.endswith('\n'):
+                newlines += 1
+            if max_lines is None or len(head) < max_lines:
+                head.append(line)
+    return head, chars, newlines + 1
+
+
 class DocumentPreviewGenerator:
     """Generates previews of documents for display in conversations"""
     
+    # Maximum number of formatted documents kept in memory
+    DISPLAY_CACHE_SIZE = 64
+    
     def __init__(self, workspace_path: Path):
         self.workspace_path = workspace_path
         self.temp_dir = workspace_path / ".workflow" / "temp"
+        # (document_name, show_full) -> ((mtime_ns, size), formatted text)
+        self._display_cache: Dict[Tuple[str, bool], Tuple[Tuple[int, int], str]] = {}
     
     def get_document_preview(
         self,
@@ -30,15 +57,15 @@ class DocumentPreviewGenerator:
             }
         
         try:
-            content = doc_path.read_text(encoding='utf-8')
-            lines = content.split('\n')
+            head, size, total_lines = _scan_text(doc_path, None if show_full else max_lines)
             
-            if show_full or len(lines) <= max_lines:
-                preview = content
+            if show_full or total_lines <= max_lines:
+                preview = ''.join(head)
                 truncated = False
             else:
-                preview = '\n'.join(lines[:max_lines])
-                preview += f"\n\n... (还有 {len(lines) - max_lines} 行，使用 `--full` 查看完整内容)"
+                # Every kept line is followed by more, so each ends with '\n'
+                preview = ''.join(head)[:-1]
+                preview += f"\n\n... (还有 {total_lines - max_lines} 行，使用 `--full` 查看完整内容)"
                 truncated = True
             
             stat = doc_path.stat()
@@ -49,8 +76,8 @@ class DocumentPreviewGenerator:
                 "absolute_path": str(doc_path),
                 "preview": preview,
                 "truncated": truncated,
-                "total_lines": len(lines),
-                "size": len(content),
+                "total_lines": total_lines,
+                "size": size,
                 "size_bytes": stat.st_size,
                 "last_modified": datetime.fromtimestamp(stat.st_mtime)
             }
@@ -66,6 +93,17 @@ class DocumentPreviewGenerator:
         show_full: bool = False
     ) -> str:
         """Format document for display in conversation"""
+        try:
+            stat = os.stat(self.temp_dir / document_name)
+            stamp: Optional[Tuple[int, int]] = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        
+        key = (document_name, show_full)
+        cached = self._display_cache.get(key)
+        if stamp is not None and cached is not None and cached[0] == stamp:
+            return cached[1]
+        
         preview_data = self.get_document_preview(document_name, show_full=show_full)
         
         if not preview_data.get("exists"):
@@ -86,7 +124,12 @@ class DocumentPreviewGenerator:
             lines.append("")
             lines.append(f"💡 提示: 使用 `workflow show-doc {document_name} --full` 查看完整内容")
         
-        return "\n".join(lines)
+        text = "\n".join(lines)
+        if stamp is not None:
+            if len(self._display_cache) >= self.DISPLAY_CACHE_SIZE:
+                self._display_cache.clear()
+            self._display_cache[key] = (stamp, text)
+        return text
     
     def list_all_documents(self) -> List[Dict[str, Any]]:
         """List all generated documents"""
@@ -95,22 +138,28 @@ class DocumentPreviewGenerator:
         
         documents = []
         try:
-            for doc_file in self.temp_dir.glob("*.md"):
-                try:
-                    stat = doc_file.stat()
-                    content = doc_file.read_text(encoding='utf-8')
-                    documents.append({
-                        "name": doc_file.name,
-                        "path": str(doc_file.relative_to(self.workspace_path)),
-                        "absolute_path": str(doc_file),
-                        "size": stat.st_size,
-                        "size_chars": len(content),
-                        "lines": len(content.split('\n')),
-                        "last_modified": datetime.fromtimestamp(stat.st_mtime)
-                    })
-                except Exception:
-                    # Skip files that can't be read
-                    continue
+            with os.scandir(self.temp_dir) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".md"):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                        doc_file = self.temp_dir / entry.name
+                        _head, size_chars, line_count = _scan_text(doc_file, 0)
+                        documents.append({
+                            "name": entry.name,
+                            "path": str(doc_file.relative_to(self.workspace_path)),
+                            "absolute_path": str(doc_file),
+                            "size": stat.st_size,
+                            "size_chars": size_chars,
+                            "lines": line_count,
+                            "last_modified": datetime.fromtimestamp(stat.st_mtime)
+                        })
+                    except Exception:
+                        # Skip files that can't be read
+                        continue
             
             # Sort by last modified time, most recent first
             documents.sort(key=lambda x: x['last_modified'], reverse=True)
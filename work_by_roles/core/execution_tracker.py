@@ -4,48 +4,82 @@ Following Single Responsibility Principle - tracks execution history only.
 """
 
 import json
+import threading
 import yaml
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-from .models import SkillExecution
+from .models import SkillExecution, with_slots
+
+
+@with_slots
+@dataclass
+class _SkillStats:
+    """Running totals for one skill, updated as executions are recorded"""
+    executions: List[SkillExecution] = field(default_factory=list)
+    successes: int = 0
+    total_time: float = 0.0
+    total_retries: int = 0
 
 
 @dataclass
 class ExecutionTracker:
-    """Tracks skill execution history and statistics"""
+    """
+    Tracks skill execution history and statistics.
+    
+    Per-skill history and totals are kept up to date by record_execution, so
+    the per-skill queries don't scan the full history. Executions must be
+    added through record_execution, not by appending to executions directly.
+    
+    A tracker may be shared by skill workflows running on several threads;
+    updates and the queries that combine several totals hold _lock.
+    """
     
     def __init__(self):
         self.executions: List[SkillExecution] = []
+        self._stats: Dict[str, _SkillStats] = {}
+        self._lock = threading.Lock()
     
     def record_execution(self, skill_execution: SkillExecution) -> None:
         """Record a skill execution"""
-        self.executions.append(skill_execution)
+        with self._lock:
+            self.executions.append(skill_execution)
+            stats = self._stats.get(skill_execution.skill_id)
+            if stats is None:
+                stats = self._stats[skill_execution.skill_id] = _SkillStats()
+            stats.executions.append(skill_execution)
+            if skill_execution.status == "success":
+                stats.successes += 1
+            stats.total_time += skill_execution.execution_time
+            stats.total_retries += skill_execution.retry_count
     
     def get_skill_history(self, skill_id: str) -> List[SkillExecution]:
         """Get execution history for a specific skill"""
-        return [e for e in self.executions if e.skill_id == skill_id]
+        with self._lock:
+            stats = self._stats.get(skill_id)
+            return list(stats.executions) if stats else []
     
     def get_success_rate(self, skill_id: str) -> float:
         """Calculate success rate for a skill"""
-        history = self.get_skill_history(skill_id)
-        if not history:
-            return 0.0
-        successful = sum(1 for e in history if e.status == "success")
-        return successful / len(history)
+        with self._lock:
+            stats = self._stats.get(skill_id)
+            if not stats:
+                return 0.0
+            return stats.successes / len(stats.executions)
     
     def get_avg_execution_time(self, skill_id: str) -> float:
         """Calculate average execution time for a skill"""
-        history = self.get_skill_history(skill_id)
-        if not history:
-            return 0.0
-        total_time = sum(e.execution_time for e in history)
-        return total_time / len(history)
+        with self._lock:
+            stats = self._stats.get(skill_id)
+            if not stats:
+                return 0.0
+            return stats.total_time / len(stats.executions)
     
     def get_total_executions(self, skill_id: Optional[str] = None) -> int:
         """Get total number of executions, optionally filtered by skill_id"""
         if skill_id:
-            return len(self.get_skill_history(skill_id))
+            stats = self._stats.get(skill_id)
+            return len(stats.executions) if stats else 0
         return len(self.executions)
     
     def export_trace(self, format: str = "json") -> str:
@@ -91,22 +125,22 @@ class ExecutionTracker:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get overall statistics"""
-        skill_ids = set(e.skill_id for e in self.executions)
         skills_stats: Dict[str, Any] = {}
-        stats: Dict[str, Any] = {
-            "total_executions": len(self.executions),
-            "unique_skills": len(skill_ids),
-            "skills": skills_stats
-        }
-        
-        for skill_id in skill_ids:
-            history = self.get_skill_history(skill_id)
-            skills_stats[skill_id] = {
-                "total_executions": len(history),
-                "success_rate": self.get_success_rate(skill_id),
-                "avg_execution_time": self.get_avg_execution_time(skill_id),
-                "total_retries": sum(e.retry_count for e in history),
+        with self._lock:
+            stats: Dict[str, Any] = {
+                "total_executions": len(self.executions),
+                "unique_skills": len(self._stats),
+                "skills": skills_stats
             }
+            
+            for skill_id, skill_stats in self._stats.items():
+                count = len(skill_stats.executions)
+                skills_stats[skill_id] = {
+                    "total_executions": count,
+                    "success_rate": skill_stats.successes / count,
+                    "avg_execution_time": skill_stats.total_time / count,
+                    "total_retries": skill_stats.total_retries,
+                }
         
         return stats
 
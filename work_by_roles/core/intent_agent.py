@@ -22,6 +22,28 @@ from .dialog_manager import (
 )
 
 
+# Keyword groups consulted by IntentAgent.detect_ambiguities
+_AMBIGUITY_KEYWORDS = {
+    "scope": ("系统", "模块", "功能", "页面", "服务", "组件", "system", "module", "feature", "page"),
+    "vague": ("一些", "某种", "大概", "可能", "也许", "差不多", "some", "maybe", "perhaps", "kind of"),
+    "tech_general": ("数据库", "api", "接口", "存储", "database", "storage", "interface"),
+    "tech_specific": ("mysql", "postgres", "redis", "mongodb", "rest", "graphql", "sqlite"),
+    "priority": ("紧急", "优先", "重要", "尽快", "urgent", "priority", "important", "asap"),
+    "context": ("现有", "已有", "当前", "目前", "existing", "current", "based on"),
+    "new": ("新",),
+    "modify": ("修改", "更新", "改进", "优化", "modify", "update", "improve", "optimize"),
+}
+
+# One pass over the input finds every group present. The alternation sits in
+# a lookahead so matches don't consume text and overlapping keywords (the
+# "新" in "更新") are all seen; no keyword is a prefix of one in another
+# group, so the group reported at each position is unambiguous.
+_AMBIGUITY_RE = re.compile("(?=" + "|".join(
+    f"(?P<{group}>{'|'.join(map(re.escape, words))})"
+    for group, words in _AMBIGUITY_KEYWORDS.items()
+) + ")")
+
+
 class IntentAgent:
     """
     统一的意图识别Agent：识别用户输入是需求实现还是bug修复
@@ -249,53 +271,43 @@ class IntentAgent:
         input_lower = user_input.lower()
         confidence = intent_result.get("confidence", 0.5)
         
+        found = {m.lastgroup for m in _AMBIGUITY_RE.finditer(input_lower)}
+        
         # 1. Check for missing scope
-        scope_indicators = ["系统", "模块", "功能", "页面", "服务", "组件", "system", "module", "feature", "page"]
-        has_scope = any(ind in input_lower for ind in scope_indicators)
-        if not has_scope and len(user_input) < 50:
+        if "scope" not in found and len(user_input) < 50:
             ambiguities.append((
                 AmbiguityType.MISSING_SCOPE,
                 "没有明确指定功能范围"
             ))
         
         # 2. Check for unclear requirements (vague language)
-        vague_words = ["一些", "某种", "大概", "可能", "也许", "差不多", "some", "maybe", "perhaps", "kind of"]
-        if any(word in input_lower for word in vague_words):
+        if "vague" in found:
             ambiguities.append((
                 AmbiguityType.UNCLEAR_REQUIREMENTS,
                 "需求描述包含模糊词汇"
             ))
         
         # 3. Check for technical ambiguity
-        tech_ambiguous = ["数据库", "api", "接口", "存储", "database", "storage", "interface"]
-        tech_specific = ["mysql", "postgres", "redis", "mongodb", "rest", "graphql", "sqlite"]
-        has_tech_general = any(t in input_lower for t in tech_ambiguous)
-        has_tech_specific = any(t in input_lower for t in tech_specific)
-        if has_tech_general and not has_tech_specific:
+        if "tech_general" in found and "tech_specific" not in found:
             ambiguities.append((
                 AmbiguityType.TECHNICAL_AMBIGUITY,
                 "技术实现方式未明确"
             ))
         
         # 4. Check for priority/importance indicators
-        priority_words = ["紧急", "优先", "重要", "尽快", "urgent", "priority", "important", "asap"]
-        has_priority = any(p in input_lower for p in priority_words)
-        if not has_priority and len(user_input) > 30:
+        if "priority" not in found and len(user_input) > 30:
             ambiguities.append((
                 AmbiguityType.PRIORITY_UNCLEAR,
                 "未指定优先级"
             ))
         
-        # 5. Check for missing context (no reference to existing system)
-        context_words = ["现有", "已有", "当前", "目前", "existing", "current", "based on"]
-        if not any(c in input_lower for c in context_words) and "新" not in input_lower:
-            # Only add if it seems like a modification task
-            mod_words = ["修改", "更新", "改进", "优化", "modify", "update", "improve", "optimize"]
-            if any(m in input_lower for m in mod_words):
-                ambiguities.append((
-                    AmbiguityType.MISSING_CONTEXT,
-                    "未说明基于现有系统还是新建"
-                ))
+        # 5. Check for missing context (no reference to existing system),
+        # only if it seems like a modification task
+        if "context" not in found and "new" not in found and "modify" in found:
+            ambiguities.append((
+                AmbiguityType.MISSING_CONTEXT,
+                "未说明基于现有系统还是新建"
+            ))
         
         # 6. Check for multiple interpretations (low confidence)
         if confidence <= 0.6:
@@ -0,0 +1,46 @@
+"""
+JSON encoding helpers that use orjson when it is installed.
+
+orjson is an optional speedup (``pip install work-by-roles[speedups]``); the
+stdlib json module is used otherwise. Both paths produce UTF-8 bytes with
+non-ASCII text left unescaped, matching ``json.dumps(..., ensure_ascii=False)``.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+    HAS_ORJSON = False
+
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = str) -> bytes:
+    """
+    Serialize obj to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Fallback for objects JSON can't represent natively
+
+    Returns:
+        Encoded JSON bytes
+    """
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            # orjson is stricter than json (e.g. non-str dict keys, ints
+            # beyond 64 bits); let the stdlib handle those payloads
+            pass
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False, default=default).encode('utf-8')
+
+
+def loads(data: Union[bytes, bytearray, memoryview, str]) -> Any:
+    """Deserialize JSON from bytes or str"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,10 +3,31 @@ LLM stream handler for processing streaming LLM responses.
 """
 
 import re
-from typing import Optional, Iterator, Any
+from typing import Optional, Iterator, Any, Callable, Dict, List
 from .stream_writer import StreamWriter
 
 
+# Control characters stripped from streamed chunks (newlines and tabs are kept)
+_CONTROL_CHARS = re.compile(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]')
+
+
+def _text_from_dict(response: Dict[str, Any]) -> str:
+    # Key checks instead of nested get() defaults, which would stringify the
+    # whole response even when 'content' is present
+    if 'content' in response:
+        return response['content']
+    if 'text' in response:
+        return response['text']
+    return str(response)
+
+
+# Exact-type fast path for _extract_text_from_response
+_TEXT_EXTRACTORS: Dict[type, Callable[[Any], str]] = {
+    str: lambda response: response,
+    dict: _text_from_dict,
+}
+
+
 class LLMStreamHandler:
     """Handler for streaming LLM responses"""
     
@@ -22,8 +43,23 @@ class LLMStreamHandler:
         self.stream_writer = stream_writer
         self.markdown_mode = markdown_mode
         self.role_name = role_name
-        self.buffer = ""
-        self.full_response = ""
+        # Chunks are joined lazily; repeated str += is quadratic in stream length
+        self._chunks: List[str] = []
+        self._joined: Optional[str] = ""
+        # Last non-whitespace character seen so far ('' if none yet)
+        self._last_visible = ""
+    
+    @property
+    def full_response(self) -> str:
+        """Complete text accumulated from the stream so far"""
+        if self._joined is None:
+            self._joined = ''.join(self._chunks)
+        return self._joined
+    
+    @property
+    def buffer(self) -> str:
+        """Text accumulated since the last reset (same as full_response)"""
+        return self.full_response
     
     def handle_chunk(self, chunk: str) -> None:
         """
@@ -32,8 +68,11 @@ class LLMStreamHandler:
         Args:
             chunk: Text chunk from LLM
         """
-        self.buffer += chunk
-        self.full_response += chunk
+        self._chunks.append(chunk)
+        self._joined = None
+        visible = chunk.rstrip()
+        if visible:
+            self._last_visible = visible[-1]
         
         # Try to extract meaningful text (skip control characters)
         display_chunk = self._clean_chunk(chunk)
@@ -44,7 +83,7 @@ class LLMStreamHandler:
             # 如果有角色名称，在流式输出中添加标识（仅在每行开始时添加）
             if self.role_name and display_chunk.strip():
                 # 检查是否是行首（buffer 为空或最后一个字符是换行）
-                if not self.buffer.rstrip() or self.buffer.rstrip()[-1] == '\n':
+                if not self._last_visible or self._last_visible == '\n':
                     display_chunk = f"[{self.role_name}] {display_chunk}"
             
             self.stream_writer.write(display_chunk, flush=True)
@@ -59,8 +98,7 @@ class LLMStreamHandler:
         Returns:
             Complete response text
         """
-        self.buffer = ""
-        self.full_response = ""
+        self.reset()
         
         try:
             for chunk in stream:
@@ -120,7 +158,7 @@ class LLMStreamHandler:
     def _clean_chunk(self, chunk: str) -> str:
         """Clean chunk of control characters"""
         # Remove null bytes and other control characters (except newlines)
-        cleaned = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F]', '', chunk)
+        cleaned = _CONTROL_CHARS.sub('', chunk)
         return cleaned
     
     def _format_markdown_chunk(self, chunk: str) -> str:
@@ -160,10 +198,14 @@ class LLMStreamHandler:
     
     def _extract_text_from_response(self, response: Any) -> str:
         """Extract text from various LLM response formats"""
+        extractor = _TEXT_EXTRACTORS.get(type(response))
+        if extractor is not None:
+            return extractor(response)
+        # Subclasses (e.g. OrderedDict) miss the exact-type table
         if isinstance(response, str):
             return response
         elif isinstance(response, dict):
-            return response.get('content', response.get('text', str(response)))
+            return _text_from_dict(response)
         else:
             return str(response)
     
@@ -173,6 +215,7 @@ class LLMStreamHandler:
     
     def reset(self) -> None:
         """Reset buffer and full response"""
-        self.buffer = ""
-        self.full_response = ""
+        self._chunks.clear()
+        self._joined = ""
+        self._last_visible = ""
 
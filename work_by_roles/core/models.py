@@ -5,8 +5,13 @@ Following Single Responsibility Principle - all data models in one module.
 
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set, Tuple, TYPE_CHECKING
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from collections import deque
 from datetime import datetime
+import heapq
+import itertools
+import os
+import sys
 
 if TYPE_CHECKING:
     from .role_manager import RoleManager
@@ -15,6 +20,26 @@ from .exceptions import WorkflowError
 from .enums import SkillWorkflowStepStatus, StageStatus
 
 
+def with_slots(cls: type) -> type:
+    """
+    Rebuild a dataclass so its fields live in __slots__ instead of __dict__.
+    
+    Stand-in for ``@dataclass(slots=True)``, which needs Python 3.10. Apply
+    it above ``@dataclass``; instances then reject attributes that aren't
+    fields.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    # Class-level defaults would clash with the slot descriptors; the
+    # generated __init__ already carries its own copy of each default
+    for name in field_names:
+        namespace.pop(name, None)
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = field_names
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
 # ============================================================================
 # Skill Models
 # ============================================================================
@@ -115,6 +140,7 @@ class Skill:
         }
 
 
+@with_slots
 @dataclass
 class SkillExecution:
     """Record of a skill execution"""
@@ -282,21 +308,22 @@ class SkillWorkflow:
                     graph[dep].append(step.step_id)
                     in_degree[step.step_id] += 1
         
-        # Kahn's algorithm
-        queue = [sid for sid, deg in in_degree.items() if deg == 0]
-        result = []
+        # Kahn's algorithm. The ready queue is a heap keyed by (order, arrival)
+        # so the lowest order goes first and ties keep their arrival order.
         step_map = {s.step_id: s for s in self.steps}
+        arrival = itertools.count()
+        queue = [(step_map[sid].order, next(arrival), sid) for sid, deg in in_degree.items() if deg == 0]
+        heapq.heapify(queue)
+        result = []
         
         while queue:
-            # Sort by order to maintain deterministic ordering
-            queue.sort(key=lambda x: step_map[x].order)
-            current = queue.pop(0)
+            current = heapq.heappop(queue)[2]
             result.append(step_map[current])
             
             for neighbor in graph[current]:
                 in_degree[neighbor] -= 1
                 if in_degree[neighbor] == 0:
-                    queue.append(neighbor)
+                    heapq.heappush(queue, (step_map[neighbor].order, next(arrival), neighbor))
         
         if len(result) != len(self.steps):
             raise WorkflowError("Circular dependency detected in skill workflow")
@@ -656,6 +683,7 @@ class AgentContext:
     shared_contexts: Dict[str, 'AgentContext'] = field(default_factory=dict)  # Contexts shared by other agents
 
 
+@with_slots
 @dataclass
 class ContextSummary:
     """
@@ -704,29 +732,34 @@ class ContextSummary:
         completed = engine.executor.get_completed_stages()
         current = engine.executor.state.current_role
         
+        # One pass over the workflow instead of a linear lookup per stage ID;
+        # the first stage with a given ID wins, as in _get_stage_by_id
+        stages_by_id: Dict[str, Stage] = {}
+        for stage in engine.executor.workflow.stages:
+            stages_by_id.setdefault(stage.id, stage)
+        current_stage = stages_by_id.get(current_stage_id) if current_stage_id else None
+        
         # Build stage summary
         stage_names = []
         for stage_id in sorted(completed):
-            stage = engine.executor._get_stage_by_id(stage_id)
+            stage = stages_by_id.get(stage_id)
             if stage:
                 stage_names.append(stage.name)
         
         stage_summary = " → ".join(stage_names) if stage_names else "无已完成阶段"
-        if current_stage_id:
-            current_stage = engine.executor._get_stage_by_id(current_stage_id)
-            if current_stage:
-                stage_summary += f" → {current_stage.name} (进行中)"
+        if current_stage:
+            stage_summary += f" → {current_stage.name} (进行中)"
         
         # Get key outputs (file names and content from memory if available)
         key_outputs = []
         document_contents = {}  # Store document contents for later stages
+        workflow_id = engine.workflow.id if engine.workflow else "default"
         
         for stage_id in completed:
-            stage = engine.executor._get_stage_by_id(stage_id)
+            stage = stages_by_id.get(stage_id)
             if stage and stage.outputs:
                 for output in stage.outputs:
                     # Get output path using unified path calculation
-                    workflow_id = engine.workflow.id if engine.workflow else "default"
                     if output.type in ("document", "report"):
                         # All document and report types go to .workflow/outputs/{workflow_id}/{stage_id}/
                         output_path = engine.workspace_path / ".workflow" / "outputs" / workflow_id / stage.id / output.name
@@ -772,10 +805,8 @@ class ContextSummary:
         
         # Get current goal
         current_goal = ""
-        if current_stage_id:
-            stage = engine.executor._get_stage_by_id(current_stage_id)
-            if stage:
-                current_goal = stage.goal_template or stage.name
+        if current_stage:
+            current_goal = current_stage.goal_template or current_stage.name
         
         return cls(
             stage_summary=stage_summary,
@@ -791,6 +822,29 @@ class ContextSummary:
 # Agent Collaboration Models
 # ============================================================================
 
+# Message IDs end in "<process nonce><counter>" rather than a timestamp, which
+# repeated for messages created within the same clock tick; the nonce keeps
+# them distinct across runs and forks (same scheme as agent IDs)
+_message_id_nonce = os.urandom(4).hex()
+_message_id_counter = itertools.count()
+
+
+def _reset_message_ids() -> None:
+    global _message_id_nonce, _message_id_counter
+    _message_id_nonce = os.urandom(4).hex()
+    _message_id_counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_message_ids)
+
+
+def new_message_id(from_agent: str, to_agent: str) -> str:
+    """Generate a unique ID for a message between two agents"""
+    return f"{from_agent}_{to_agent}_{_message_id_nonce}{next(_message_id_counter):08x}"
+
+
+@with_slots
 @dataclass
 class AgentMessage:
     """Agent 间消息（与 agent_message_bus.py 中的 AgentMessage 保持一致）"""
@@ -804,7 +858,7 @@ class AgentMessage:
     def __post_init__(self):
         """Generate message ID if not provided"""
         if not self.message_id:
-            self.message_id = f"{self.from_agent}_{self.to_agent}_{self.timestamp.timestamp()}"
+            self.message_id = new_message_id(self.from_agent, self.to_agent)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -822,14 +876,17 @@ class AgentMessage:
         """Create from dictionary"""
         return cls(
             message_id=data.get("message_id", ""),
-            from_agent=data["from_agent"],
-            to_agent=data["to_agent"],
-            message_type=data["message_type"],
+            # Agent IDs and message types repeat across a log; share one
+            # str object per distinct value
+            from_agent=sys.intern(data["from_agent"]),
+            to_agent=sys.intern(data["to_agent"]),
+            message_type=sys.intern(data["message_type"]),
             content=data["content"],
             timestamp=datetime.fromisoformat(data.get("timestamp", datetime.now().isoformat()))
         )
 
 
+@with_slots
 @dataclass
 class Task:
     """任务定义"""
@@ -866,6 +923,10 @@ class TaskDecomposition:
     execution_order: List[str]  # Task IDs in execution order
     dependencies: Dict[str, List[str]]  # Map from task ID to list of dependency task IDs
     total_estimated_time: Optional[float] = None  # Total estimated time for all tasks
+    # task ID -> position of the first task with that ID, built from the
+    # list and length recorded in _index_source (see get_task)
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _index_source: Optional[Tuple[List[Task], int]] = field(default=None, init=False, repr=False, compare=False)
     
     def get_ready_tasks(self) -> List[Task]:
         """Get tasks that are ready to execute (all dependencies completed)"""
@@ -879,9 +940,31 @@ class TaskDecomposition:
     
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get task by ID"""
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
+        task = self._find_indexed_task(task_id)
+        if task is None:
+            # A task replaced in place under a new ID only shows up as a
+            # miss; reindex from scratch before giving up
+            self._index_source = None
+            task = self._find_indexed_task(task_id)
+        return task
+    
+    def _find_indexed_task(self, task_id: str) -> Optional[Task]:
+        """Look up a task through the position index, refreshing it if tasks changed"""
+        tasks = self.tasks
+        source = self._index_source
+        if source is None or source[0] is not tasks or source[1] > len(tasks):
+            # New list, or tasks were removed: start over
+            self._index = {}
+            source = (tasks, 0)
+        if source[1] != len(tasks):
+            # Index only the tasks appended since the last lookup
+            for pos in range(source[1], len(tasks)):
+                self._index.setdefault(tasks[pos].id, pos)
+        self._index_source = (tasks, len(tasks))
+        pos = self._index.get(task_id)
+        # Positions go stale when an element is replaced in place
+        if pos is not None and tasks[pos].id == task_id:
+            return tasks[pos]
         return None
     
     def validate(self) -> List[str]:
@@ -895,32 +978,30 @@ class TaskDecomposition:
                 if dep not in task_ids:
                     errors.append(f"Task '{task.id}' depends on unknown task '{dep}'")
         
-        # Check for circular dependencies
-        visited = set()
-        rec_stack = set()
-        
-        def has_cycle(task_id: str) -> bool:
-            if task_id in rec_stack:
-                return True
-            if task_id in visited:
-                return False
-            
-            visited.add(task_id)
-            rec_stack.add(task_id)
-            
-            task = self.get_task(task_id)
-            if task:
-                for dep in task.dependencies:
-                    if has_cycle(dep):
-                        return True
-            
-            rec_stack.remove(task_id)
-            return False
-        
+        # Check for circular dependencies (Kahn's algorithm, no recursion):
+        # whatever can't be ordered is in a cycle or depends on one
+        task_map: Dict[str, Task] = {}
         for task in self.tasks:
-            if task.id not in visited:
-                if has_cycle(task.id):
-                    errors.append(f"Circular dependency detected involving task '{task.id}'")
+            task_map.setdefault(task.id, task)
+        in_degree = {task_id: 0 for task_id in task_map}
+        dependents: Dict[str, List[str]] = {task_id: [] for task_id in task_map}
+        for task_id, task in task_map.items():
+            for dep in task.dependencies:
+                if dep in dependents:
+                    dependents[dep].append(task_id)
+                    in_degree[task_id] += 1
+        
+        ready = deque(task_id for task_id, deg in in_degree.items() if deg == 0)
+        while ready:
+            for dependent in dependents[ready.popleft()]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+        
+        blocked = [task_id for task_id, deg in in_degree.items() if deg > 0]
+        if blocked:
+            involved = ", ".join(f"'{task_id}'" for task_id in blocked)
+            errors.append(f"Circular dependency detected involving task {involved}")
         
         return errors
 
@@ -2,14 +2,25 @@
 Progress stream for real-time progress updates.
 """
 
+import time
+from functools import lru_cache
 from typing import Dict, Optional, Any
 from datetime import datetime
 from .stream_writer import StreamWriter
 
 
+@lru_cache(maxsize=512)
+def _bar(length: int, filled: int) -> str:
+    """Progress bar string for a given length and filled cell count"""
+    return "█" * filled + "░" * (length - filled)
+
+
 class ProgressStream:
     """Real-time progress stream updater"""
     
+    # Upper bound on progress line redraws per second
+    MAX_UPDATES_PER_SECOND = 30
+    
     def __init__(self, stream_writer: StreamWriter):
         """
         Initialize progress stream.
@@ -21,6 +32,10 @@ class ProgressStream:
         self.current_progress = 0.0
         self.last_update: Optional[datetime] = None
         self.last_message = ""
+        # Last progress line written, to skip redundant identical writes
+        self._last_rendered: Optional[str] = None
+        self._last_emit = 0.0
+        self._min_interval = 1.0 / self.MAX_UPDATES_PER_SECOND
     
     def update(self, percentage: float, message: str = "", flush: bool = True) -> None:
         """
@@ -37,6 +52,16 @@ class ProgressStream:
         if message:
             self.last_message = message
         
+        # Throttle redraws; state above is always kept current and the final
+        # 100% update is never dropped
+        now = time.monotonic()
+        if (
+            self._last_rendered is not None
+            and self.current_progress < 1.0
+            and now - self._last_emit < self._min_interval
+        ):
+            return
+        
         # Generate progress bar
         progress_bar = self._generate_progress_bar(self.current_progress)
         pct_text = f"{int(self.current_progress * 100)}%"
@@ -46,6 +71,10 @@ class ProgressStream:
         else:
             progress_text = f"\r{progress_bar} {pct_text}"
         
+        if progress_text == self._last_rendered:
+            return
+        self._last_rendered = progress_text
+        self._last_emit = now
         self.stream_writer.write(progress_text, flush=flush)
     
     def update_stage(
@@ -75,6 +104,7 @@ class ProgressStream:
             if action:
                 message += f" - {action}"
         
+        self._last_rendered = None
         self.stream_writer.writeline(message, flush=True)
     
     def complete(self, message: str = "Complete") -> None:
@@ -87,6 +117,7 @@ class ProgressStream:
         # Clear progress line and write completion
         if self.stream_writer.is_interactive():
             self.stream_writer.clear_line()
+        self._last_rendered = None
         self.stream_writer.writeline(f"✅ {message} 100%", flush=True)
     
     def _generate_progress_bar(self, percentage: float, length: int = 20) -> str:
@@ -100,9 +131,8 @@ class ProgressStream:
         Returns:
             Progress bar string
         """
-        filled = int(percentage * length)
-        empty = length - filled
-        return "█" * filled + "░" * empty
+        filled = max(0, min(length, int(percentage * length)))
+        return _bar(length, filled)
     
     def write_status(self, status: str, flush: bool = True) -> None:
         """
@@ -112,5 +142,6 @@ class ProgressStream:
             status: Status message
             flush: Whether to flush immediately
         """
+        self._last_rendered = None
         self.stream_writer.writeline(status, flush=flush)
 
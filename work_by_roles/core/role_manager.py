@@ -23,6 +23,7 @@ from .models import (
     SkillWorkflowTrigger, SkillWorkflowConfig, Role
 )
 from .variable_resolver import VariableResolver
+from .schema_loader import SafeLoader
 from .models import ProjectContext
 
 
@@ -320,7 +321,7 @@ class RoleManager:
                         if path.suffix == ".json":
                             ext_data = json.load(f)
                         else:
-                            ext_data = yaml.safe_load(f)
+                            ext_data = yaml.load(f, Loader=SafeLoader)
                     
                     if isinstance(ext_data, list):
                         for item in ext_data:
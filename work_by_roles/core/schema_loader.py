@@ -10,6 +10,11 @@ import yaml
 
 from .exceptions import ValidationError, SecurityError
 
+# libyaml-backed safe loader/dumper when PyYAML was built with it; same
+# semantics as yaml.SafeLoader/SafeDumper, with the scanner/parser/emitter in C.
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+SafeDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def normalize_path(base: Path, relative_path: str) -> Path:
     """
@@ -70,7 +75,7 @@ class SchemaLoader:
         
         try:
             with open(normalized_path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f) or {}
+                data = yaml.load(f, Loader=SafeLoader) or {}
                 # Ensure we always return a dict for typing
                 if not isinstance(data, dict):
                     raise ValidationError(
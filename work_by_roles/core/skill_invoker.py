@@ -4,7 +4,9 @@ Following Single Responsibility Principle - handles skill invocation only.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, cast
+import json
+import threading
 import warnings
 
 from .exceptions import ValidationError
@@ -103,6 +105,9 @@ class LLMSkillInvoker(SkillInvoker):
         self.llm_client = llm_client
         self.max_tokens = max_tokens
         self.stream_handler = stream_handler
+        # One stream at a time through the shared handler, so output from
+        # skills invoked on different threads doesn't interleave
+        self._stream_lock = threading.Lock()
     
     def invoke(
         self,
@@ -117,8 +122,9 @@ class LLMSkillInvoker(SkillInvoker):
             # Try streaming if stream handler available and LLM supports it
             if self.stream_handler and hasattr(self.llm_client, 'stream'):
                 try:
-                    stream = self.llm_client.stream(prompt)
-                    response = self.stream_handler.handle_stream(stream)
+                    with self._stream_lock:
+                        stream = self.llm_client.stream(prompt)
+                        response = self.stream_handler.handle_stream(stream)
                     # Parse response
                     output = self._parse_response(response, skill)
                     return {
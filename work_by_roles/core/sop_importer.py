@@ -16,6 +16,32 @@ import json
 from .exceptions import WorkflowError
 
 
+def _keyword_pattern(keywords: frozenset) -> "re.Pattern[str]":
+    """Compile keywords into one case-insensitive alternation, longest first"""
+    alternatives = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(kw) for kw in alternatives), re.IGNORECASE)
+
+
+# Document type -> keywords; checked in order, the first category with a hit wins
+_DOCUMENT_TYPE_KEYWORDS = {
+    "process": frozenset(["流程", "process", "workflow", "步骤"]),
+    "procedure": frozenset(["操作规程", "procedure", "操作指南"]),
+    "guideline": frozenset(["指南", "guideline", "guide"]),
+    "standard": frozenset(["标准", "standard", "规范"]),
+}
+_DOCUMENT_TYPE_PATTERNS = [(doc_type, _keyword_pattern(kws)) for doc_type, kws in _DOCUMENT_TYPE_KEYWORDS.items()]
+
+# Industry -> keywords; the industry with the most distinct keywords present wins
+_INDUSTRY_KEYWORDS = {
+    "agile": frozenset(["sprint", "scrum", "敏捷", "backlog", "迭代"]),
+    "devops": frozenset(["ci/cd", "pipeline", "部署", "容器", "kubernetes"]),
+    "product": frozenset(["产品", "用户研究", "discovery", "原型"]),
+    "startup": frozenset(["mvp", "精益", "创业", "startup"]),
+    "enterprise": frozenset(["企业", "合规", "审计", "compliance"]),
+}
+_INDUSTRY_PATTERNS = [(industry, _keyword_pattern(kws)) for industry, kws in _INDUSTRY_KEYWORDS.items()]
+
+
 @dataclass
 class SOPAnalysis:
     """Result of SOP deep analysis"""
@@ -305,31 +331,17 @@ SOP文档内容：
     
     def _infer_document_type(self, content: str) -> str:
         """Infer document type from content"""
-        content_lower = content.lower()
-        if any(kw in content_lower for kw in ["流程", "process", "workflow", "步骤"]):
-            return "process"
-        elif any(kw in content_lower for kw in ["操作规程", "procedure", "操作指南"]):
-            return "procedure"
-        elif any(kw in content_lower for kw in ["指南", "guideline", "guide"]):
-            return "guideline"
-        elif any(kw in content_lower for kw in ["标准", "standard", "规范"]):
-            return "standard"
+        for doc_type, pattern in _DOCUMENT_TYPE_PATTERNS:
+            if pattern.search(content):
+                return doc_type
         return "unknown"
     
     def _infer_industry(self, content: str) -> str:
         """Infer industry from content"""
-        content_lower = content.lower()
-        industry_keywords = {
-            "agile": ["sprint", "scrum", "敏捷", "backlog", "迭代"],
-            "devops": ["ci/cd", "pipeline", "部署", "容器", "kubernetes"],
-            "product": ["产品", "用户研究", "discovery", "原型"],
-            "startup": ["mvp", "精益", "创业", "startup"],
-            "enterprise": ["企业", "合规", "审计", "compliance"]
-        }
-        
         scores = {}
-        for industry, keywords in industry_keywords.items():
-            score = sum(1 for kw in keywords if kw in content_lower)
+        for industry, pattern in _INDUSTRY_PATTERNS:
+            # Score = number of distinct keywords present, as before
+            score = len({match.lower() for match in pattern.findall(content)})
             if score > 0:
                 scores[industry] = score
         
@@ -10,6 +10,7 @@ from pathlib import Path
 from typing import Optional
 
 from .models import ExecutionState
+from .schema_loader import SafeDumper, SafeLoader
 
 
 class StateStorage(ABC):
@@ -41,8 +42,10 @@ class FileStateStorage(StateStorage):
             path.parent.mkdir(parents=True, exist_ok=True)
             
             data = state.to_dict()
-            with open(path, 'w', encoding='utf-8') as f:
-                yaml.dump(data, f, default_flow_style=False, allow_unicode=True)
+            # Serialize in memory, then write once instead of streaming to the file
+            path.write_bytes(
+                yaml.dump(data, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True, encoding='utf-8')
+            )
         except Exception as e:
             # Graceful degradation: log warning but don't interrupt workflow
             warnings.warn(f"Failed to save state to {path}: {e}", UserWarning)
@@ -53,11 +56,10 @@ class FileStateStorage(StateStorage):
             return None
         
         try:
-            with open(path, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-                if data is None:
-                    return None
-                return ExecutionState.from_dict(data)
+            data = yaml.load(path.read_bytes(), Loader=SafeLoader)
+            if data is None:
+                return None
+            return ExecutionState.from_dict(data)
         except Exception as e:
             # Graceful degradation: log warning and return None
             warnings.warn(f"Failed to load state from {path}: {e}. Starting with fresh state.", UserWarning)
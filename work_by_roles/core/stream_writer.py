@@ -20,8 +20,16 @@ class StreamWriter:
         """
         self.output_stream = output_stream or sys.stdout
         self.buffer_size = buffer_size
-        self.flush_immediately = True  # Cursor IDE needs immediate flushing
         self.is_tty = hasattr(self.output_stream, 'isatty') and self.output_stream.isatty()
+        # Cursor IDE needs immediate flushing, so writes flush by default;
+        # callers passing flush=False leave the text in the stream's own buffer
+        self.flush_immediately = False
+    
+    def __enter__(self) -> "StreamWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.flush()
     
     def write(self, text: str, flush: bool = True) -> None:
         """
@@ -63,15 +71,18 @@ class StreamWriter:
         """
         Write progress message with optional percentage.
         
+        Progress redraws are only flushed on a TTY; for pipes and files they
+        are left to the stream's buffer and go out with the next flush.
+        
         Args:
             message: Progress message
             percentage: Optional percentage (0.0-1.0)
         """
         if percentage is not None:
             pct = int(percentage * 100)
-            self.write(f"\r{message} [{pct}%]", flush=True)
+            self.write(f"\r{message} [{pct}%]", flush=self.is_tty)
         else:
-            self.write(f"\r{message}", flush=True)
+            self.write(f"\r{message}", flush=self.is_tty)
     
     def write_markdown(self, content: str, flush: bool = True) -> None:
         """
@@ -5,8 +5,14 @@ Workflow progress manager for tracking and displaying workflow execution progres
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
-import json
+from typing import Dict, List, Optional, Any, Tuple
+import os
+import pickle
+import threading
+import time
+import weakref
+
+from . import json_codec
 
 
 @dataclass
@@ -55,6 +61,59 @@ class WorkflowProgress:
     overall_progress: float = 0.0  # 0.0 - 1.0
     started_at: datetime = field(default_factory=datetime.now)
     estimated_completion: Optional[datetime] = None
+    # step_id -> position of the first step with that ID, built from the
+    # list and length recorded in _index_source (see get_step)
+    _index: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _index_source: Optional[Tuple[List[ProgressStep], int]] = field(default=None, init=False, repr=False, compare=False)
+    # Number of stages whose status is "completed"; see set_step_status
+    _completed: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._completed = sum(1 for s in self.stages if s.status == "completed")
+    
+    @property
+    def completed_count(self) -> int:
+        """Number of completed stages"""
+        return self._completed
+    
+    def set_step_status(self, step: ProgressStep, status: str) -> None:
+        """Change a step's status, keeping completed_count in step"""
+        was_completed = step.status == "completed"
+        is_completed = status == "completed"
+        if was_completed != is_completed:
+            self._completed += 1 if is_completed else -1
+        step.status = status
+    
+    def get_step(self, step_id: str) -> Optional[ProgressStep]:
+        """Get the first step with the given ID"""
+        if not self.stages:
+            return None
+        step = self._find_indexed_step(step_id)
+        if step is None:
+            # A step replaced in place under a new ID only shows up as a
+            # miss; reindex from scratch before giving up
+            self._index_source = None
+            step = self._find_indexed_step(step_id)
+        return step
+    
+    def _find_indexed_step(self, step_id: str) -> Optional[ProgressStep]:
+        """Look up a step through the position index, refreshing it if stages changed"""
+        stages = self.stages
+        source = self._index_source
+        if source is None or source[0] is not stages or source[1] > len(stages):
+            # New list, or steps were removed: start over
+            self._index = {}
+            source = (stages, 0)
+        if source[1] != len(stages):
+            # Index only the steps appended since the last lookup
+            for pos in range(source[1], len(stages)):
+                self._index.setdefault(stages[pos].step_id, pos)
+        self._index_source = (stages, len(stages))
+        pos = self._index.get(step_id)
+        # Positions go stale when an element is replaced in place
+        if pos is not None and stages[pos].step_id == step_id:
+            return stages[pos]
+        return None
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -80,40 +139,118 @@ class WorkflowProgress:
         )
 
 
+_STATUS_ICONS = {
+    "pending": "⏳",
+    "running": "🔄",
+    "completed": "✅",
+    "failed": "❌"
+}
+
+
+def _write_progress(progress_path: str, persist_format: str, progress: 'WorkflowProgress') -> None:
+    """Serialize progress in the given format and write it in one call."""
+    os.makedirs(os.path.dirname(progress_path), exist_ok=True)
+    if persist_format == "pickle":
+        data = pickle.dumps(progress, protocol=pickle.HIGHEST_PROTOCOL)
+    else:
+        data = json_codec.dumps(progress.to_dict(), indent=True)
+    with open(progress_path, 'wb') as f:
+        f.write(data)
+
+
+def _flush_on_finalize(progress_path: str, persist_format: str, pending: Dict[str, Any]) -> None:
+    """Best-effort final flush; the workspace may already be gone at exit."""
+    progress = pending.pop("progress", None)
+    if progress is None:
+        return
+    try:
+        _write_progress(progress_path, persist_format, progress)
+    except Exception:
+        pass
+
+
 class WorkflowProgressManager:
-    """Manages workflow progress tracking and display"""
+    """
+    Manages workflow progress tracking and display.
+    
+    Saves are coalesced: a change is written at once if nothing was written in
+    the last SAVE_INTERVAL seconds, otherwise a timer writes it when the
+    interval is up (or flush(), load_progress() or interpreter exit, if
+    sooner). Updates and the timer's write are serialized by a lock.
+    """
+    
+    SAVE_INTERVAL = 0.05  # seconds
+    
+    # persist_format -> progress file name
+    PROGRESS_FILES = {
+        "json": "progress.json",
+        "pickle": "progress.pickle",
+    }
     
-    def __init__(self, workspace_path: Path):
+    def __init__(self, workspace_path: Path, persist_format: str = "json"):
+        """
+        Initialize progress manager.
+        
+        Args:
+            workspace_path: Workspace root
+            persist_format: "json" (default, human-readable) or "pickle", which
+                skips text (de)serialization on every save. Only use pickle for
+                workspaces you trust: loading a pickle can run arbitrary code.
+        """
+        if persist_format not in self.PROGRESS_FILES:
+            raise ValueError(
+                f"Unsupported persist_format '{persist_format}'. Expected one of: {', '.join(self.PROGRESS_FILES)}"
+            )
         self.workspace_path = workspace_path
-        self.progress_file = workspace_path / ".workflow" / "progress.json"
+        self.persist_format = persist_format
+        self.progress_file = workspace_path / ".workflow" / self.PROGRESS_FILES[persist_format]
+        # Plain-str copy for the save/load paths, which run on every update
+        self._progress_path = os.fspath(self.progress_file)
+        # ((st_mtime_ns, st_size), progress) of the last load_progress() result
+        self._loaded: Optional[Tuple[Tuple[int, int], WorkflowProgress]] = None
         self.current_progress: Optional[WorkflowProgress] = None
+        # {"progress": WorkflowProgress} while a save is pending
+        self._pending: Dict[str, Any] = {}
+        self._last_save = float("-inf")
+        # Trailing write for a deferred save; guarded, with the progress
+        # itself, by _lock since it fires on another thread
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.RLock()
+        # step_id -> [start_ns, end_ns] from time.monotonic_ns(); durations
+        # use these when available so wall-clock jumps don't skew them
+        self._step_clock: Dict[str, List[Optional[int]]] = {}
+        weakref.finalize(self, _flush_on_finalize, self._progress_path, persist_format, self._pending)
     
     def start_workflow(self, workflow_id: str) -> WorkflowProgress:
         """Start tracking a workflow"""
-        self.current_progress = WorkflowProgress(
-            workflow_id=workflow_id,
-            started_at=datetime.now()
-        )
-        self._save_progress()
-        return self.current_progress
+        with self._lock:
+            self.current_progress = WorkflowProgress(
+                workflow_id=workflow_id,
+                started_at=datetime.now()
+            )
+            self._step_clock = {}
+            self._save_progress()
+            return self.current_progress
     
     def start_stage(self, stage_id: str, stage_name: str) -> ProgressStep:
         """Start tracking a stage"""
-        if not self.current_progress:
-            raise ValueError("Workflow not started. Call start_workflow() first.")
-        
-        step = ProgressStep(
-            step_id=stage_id,
-            name=stage_name,
-            status="running",
-            start_time=datetime.now()
-        )
-        
-        self.current_progress.current_stage = stage_id
-        self.current_progress.stages.append(step)
-        self._update_overall_progress()
-        self._save_progress()
-        return step
+        with self._lock:
+            if not self.current_progress:
+                raise ValueError("Workflow not started. Call start_workflow() first.")
+            
+            step = ProgressStep(
+                step_id=stage_id,
+                name=stage_name,
+                status="running",
+                start_time=datetime.now()
+            )
+            
+            self.current_progress.current_stage = stage_id
+            self.current_progress.stages.append(step)
+            self._step_clock[stage_id] = [time.monotonic_ns(), None]
+            self._update_overall_progress()
+            self._save_progress()
+            return step
     
     def update_stage(
         self,
@@ -123,31 +260,33 @@ class WorkflowProgressManager:
         output_files: Optional[List[str]] = None
     ) -> None:
         """Update stage status and details"""
-        if not self.current_progress:
-            return
-        
-        step = self._get_step(stage_id)
-        if not step:
-            return
-        
-        if status:
-            step.status = status
-            if status == "completed":
-                step.end_time = datetime.now()
-            elif status == "failed":
-                step.end_time = datetime.now()
-        
-        if details:
-            step.details.update(details)
-        
-        if output_files:
-            step.output_files.extend(output_files)
-            # Remove duplicates while preserving order
-            seen = set()
-            step.output_files = [f for f in step.output_files if not (f in seen or seen.add(f))]
-        
-        self._update_overall_progress()
-        self._save_progress()
+        with self._lock:
+            if not self.current_progress:
+                return
+            
+            step = self._get_step(stage_id)
+            if not step:
+                return
+            
+            if status:
+                self.current_progress.set_step_status(step, status)
+                if status in ("completed", "failed"):
+                    step.end_time = datetime.now()
+                    clock = self._step_clock.get(stage_id)
+                    if clock:
+                        clock[1] = time.monotonic_ns()
+            
+            if details:
+                step.details.update(details)
+            
+            if output_files:
+                step.output_files.extend(output_files)
+                # Remove duplicates while preserving order
+                seen = set()
+                step.output_files = [f for f in step.output_files if not (f in seen or seen.add(f))]
+            
+            self._update_overall_progress()
+            self._save_progress()
     
     def get_progress_markdown(self) -> str:
         """Generate markdown representation of progress"""
@@ -171,12 +310,7 @@ class WorkflowProgressManager:
         if self.current_progress.current_stage:
             current_step = self._get_step(self.current_progress.current_stage)
             if current_step:
-                status_icon = {
-                    "pending": "⏳",
-                    "running": "🔄",
-                    "completed": "✅",
-                    "failed": "❌"
-                }.get(current_step.status, "❓")
+                status_icon = _STATUS_ICONS.get(current_step.status, "❓")
                 lines.append(f"**当前阶段**: {status_icon} {current_step.name} ({current_step.status})")
                 lines.append("")
         
@@ -185,12 +319,7 @@ class WorkflowProgressManager:
         lines.append("")
         
         for step in self.current_progress.stages:
-            status_icon = {
-                "pending": "⏳",
-                "running": "🔄",
-                "completed": "✅",
-                "failed": "❌"
-            }.get(step.status, "❓")
+            status_icon = _STATUS_ICONS.get(step.status, "❓")
             
             lines.append(f"{status_icon} **{step.name}** (`{step.step_id}`)")
             
@@ -200,14 +329,20 @@ class WorkflowProgressManager:
             
             if step.output_files:
                 lines.append("   - 生成文件:")
-                for file in step.output_files:
-                    lines.append(f"     - `{file}`")
+                lines.extend(f"     - `{file}`" for file in step.output_files)
             
+            clock = self._step_clock.get(step.step_id)
             if step.end_time and step.start_time:
-                duration = (step.end_time - step.start_time).total_seconds()
+                if clock and clock[1] is not None:
+                    duration = (clock[1] - clock[0]) / 1e9
+                else:
+                    duration = (step.end_time - step.start_time).total_seconds()
                 lines.append(f"   - 耗时: {duration:.1f}秒")
             elif step.start_time:
-                duration = (datetime.now() - step.start_time).total_seconds()
+                if clock:
+                    duration = (time.monotonic_ns() - clock[0]) / 1e9
+                else:
+                    duration = (datetime.now() - step.start_time).total_seconds()
                 lines.append(f"   - 已运行: {duration:.1f}秒")
             
             lines.append("")
@@ -218,45 +353,89 @@ class WorkflowProgressManager:
         """Get step by stage ID"""
         if not self.current_progress:
             return None
-        return next((s for s in self.current_progress.stages if s.step_id == stage_id), None)
+        return self.current_progress.get_step(stage_id)
     
     def _update_overall_progress(self) -> None:
         """Update overall progress percentage"""
         if not self.current_progress or not self.current_progress.stages:
             return
         
-        total_stages = len(self.current_progress.stages)
-        if total_stages == 0:
-            return
-        
-        completed = sum(1 for s in self.current_progress.stages if s.status == "completed")
-        self.current_progress.overall_progress = completed / total_stages
+        progress = self.current_progress
+        progress.overall_progress = progress.completed_count / len(progress.stages)
     
     def _save_progress(self) -> None:
-        """Save progress to file"""
+        """Mark progress for saving, writing now unless a save just happened"""
         if not self.current_progress:
             return
         
-        try:
-            self.progress_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(self.current_progress.to_dict(), f, indent=2, ensure_ascii=False, default=str)
-        except Exception as e:
-            # Don't fail workflow if progress saving fails
-            import warnings
-            warnings.warn(f"Failed to save progress: {e}")
+        with self._lock:
+            self._pending["progress"] = self.current_progress
+            elapsed = time.monotonic() - self._last_save
+            if elapsed >= self.SAVE_INTERVAL:
+                self.flush()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.SAVE_INTERVAL - elapsed, self._flush_from_timer)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def _flush_from_timer(self) -> None:
+        """Timer callback for a deferred save"""
+        with self._lock:
+            # A flush() may have replaced this timer while it waited for the lock
+            if self._timer is threading.current_thread():
+                self._timer = None
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write any pending progress change to the progress file"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            
+            progress = self._pending.pop("progress", None)
+            if progress is None:
+                return
+            
+            self._loaded = None
+            try:
+                _write_progress(self._progress_path, self.persist_format, progress)
+            except Exception as e:
+                # Don't fail workflow if progress saving fails
+                import warnings
+                warnings.warn(f"Failed to save progress: {e}")
+            self._last_save = time.monotonic()
     
     def load_progress(self) -> Optional[WorkflowProgress]:
-        """Load progress from file"""
-        if not self.progress_file.exists():
+        """
+        Load progress from file.
+        
+        The file is only read and parsed again once its mtime or size
+        changes; until then the previously loaded object is returned.
+        """
+        self.flush()
+        try:
+            with open(self._progress_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                key = (st.st_mtime_ns, st.st_size)
+                if self._loaded is not None and self._loaded[0] == key:
+                    return self._loaded[1]
+                raw = f.read()
+        except FileNotFoundError:
             return None
         
         try:
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return WorkflowProgress.from_dict(data)
+            if self.persist_format == "pickle":
+                progress = pickle.loads(raw)
+                if not isinstance(progress, WorkflowProgress):
+                    raise TypeError(f"unexpected object of type {type(progress).__name__}")
+            else:
+                progress = WorkflowProgress.from_dict(json_codec.loads(raw))
         except Exception as e:
             import warnings
             warnings.warn(f"Failed to load progress: {e}")
             return None
+        
+        self._loaded = (key, progress)
+        return progress
 
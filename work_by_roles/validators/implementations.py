@@ -45,6 +45,9 @@ class LinterValidator(BaseValidator):
 class TestValidator(BaseValidator):
     """Validator that runs Pytest."""
     
+    # The gate only needs pass/fail: skip .pytest_cache I/O, stepwise state and the header
+    PYTEST_ARGS = ["-p", "no:cacheprovider", "-p", "no:stepwise", "--no-header", "-q"]
+    
     def validate(self, gate: Any, stage: Any, workspace_path: Path) -> Tuple[bool, List[str]]:
         errors = []
         
@@ -54,7 +57,7 @@ class TestValidator(BaseValidator):
         
         try:
             result = subprocess.run(
-                ["pytest", "."],
+                ["pytest", *self.PYTEST_ARGS, "."],
                 cwd=workspace_path,
                 capture_output=True,
                 text=True